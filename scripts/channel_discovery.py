@@ -286,10 +286,12 @@ class RobustAdvancedChannelDiscovery:
             logger.error(f"❌ Error loading existing channels: {e}")
             return set()
     
-    def _make_api_request(self, request_func, quota_cost: int = 1, **kwargs):
-        """Make API request with robust error handling"""
+    def _make_api_request(self, resource: str, quota_cost: int = 1, **kwargs):
+        """Make a <resource>.list API request with robust error handling"""
         try:
-            result = self.api_client._make_request(request_func(**kwargs), quota_cost)
+            # Built on client.service each time, so a benched key is swapped for the next one
+            result = self.api_client.execute(
+                lambda service: getattr(service, resource)().list(**kwargs), quota_cost)
             self.stats['api_calls_made'] += 1
             return result
         except Exception as e:
@@ -317,7 +319,7 @@ class RobustAdvancedChannelDiscovery:
                     logger.info(f"🔎 [{keyword_idx+1}/{len(keywords)}] Searching: '{keyword}'")
                 
                 response = self._make_api_request(
-                    self.api_client.service.search().list,
+                    'search',
                     quota_cost=100,
                     part='snippet',
                     q=keyword,
@@ -378,7 +380,7 @@ class RobustAdvancedChannelDiscovery:
         for hashtag_idx, hashtag in enumerate(trending_hashtags):
             try:
                 response = self._make_api_request(
-                    self.api_client.service.search().list,
+                    'search',
                     quota_cost=100,
                     part='snippet',
                     q=hashtag,
@@ -428,7 +430,7 @@ class RobustAdvancedChannelDiscovery:
         
         try:
             response = self._make_api_request(
-                self.api_client.service.videos().list,
+                'videos',
                 quota_cost=1,
                 part='snippet',
                 chart='mostPopular',
@@ -467,7 +469,7 @@ class RobustAdvancedChannelDiscovery:
             
             try:
                 response = self._make_api_request(
-                    self.api_client.service.channels().list,
+                    'channels',
                     quota_cost=1,
                     part='snippet,statistics,brandingSettings',
                     id=','.join(batch_ids),
@@ -444,14 +444,10 @@ class YouTubeAPIManager:
             key = self.api_keys[key_index]
             service = build('youtube', 'v3', developerKey=key)
             
-            # Try a minimal operation to test quota
-            response = service.search().list(
-                part='snippet',
-                q='test',
-                type='channel',
-                regionCode='LK',
-                maxResults=1,
-                order='relevance'
+            # Try a minimal operation to test quota (videos.list costs 1 unit, search.list 100)
+            service.videos().list(
+                part='id',
+                id='dQw4w9WgXcQ'
             ).execute()
             
             return True, service
@@ -794,7 +790,7 @@ class SriLankanChannelDiscovery:
                     if item['id']['kind'] == 'youtube#channel':
                         channel_ids.add(item['id']['channelId'])
                 
-                logger.debug(f"Found {len(response.get('items', []))} channels for '{keyword}'")
+                logger.debug("Found %d channels for '%s'", len(response.get('items', [])), keyword)
                 time.sleep(random.uniform(0.5, 1.0))
                 
             except Exception as e:
@@ -7,6 +7,7 @@ import os
 import sys
 import argparse
 from datetime import datetime, timedelta
+from itertools import chain
 from typing import List, Dict, Optional
 import pandas as pd
 from tqdm import tqdm
@@ -17,6 +18,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from config import (
     SRI_LANKAN_CHANNELS,
     ALL_CHANNEL_IDS,
+    CHANNEL_TO_CATEGORIES,
     MAX_VIDEOS_PER_CHANNEL,
     DATA_RAW_PATH,
     get_channel_ids_by_category,
@@ -33,25 +35,29 @@ from utils import (
     extract_channel_metadata,
     save_to_csv,
     save_to_json,
-    validate_video_data,
+    save_to_ndjson,
+    save_to_feather,
     setup_logging
 )
 
 logger = setup_logging()
 
+# Progress bars only when attached to a terminal (not under cron/scheduler)
+_PROGRESS_DISABLED = not sys.stderr.isatty()
+
 class VideoCollector:
     """Main class for collecting video data from YouTube channels"""
     
     def __init__(self, api_key: Optional[str] = None):
         """Initialize the video collector"""
+        # Validate API key before any client setup
+        if not validate_api_key():
+            raise ValueError("Invalid or missing YouTube API key. Please check your .env file.")
+        
         self.client = YouTubeAPIClient(api_key) if api_key else YouTubeAPIClient()
         self.collected_videos = []
         self.collected_channels = []
         self.failed_channels = []
-        
-        # Validate API key
-        if not validate_api_key():
-            raise ValueError("Invalid or missing YouTube API key. Please check your .env file.")
     
     def collect_channel_data(self, channel_ids: List[str]) -> List[Dict]:
         """Collect metadata for specified channels"""
@@ -65,7 +71,7 @@ class VideoCollector:
                 metadata = extract_channel_metadata(channel)
                 if metadata:
                     channels_metadata.append(metadata)
-                    logger.debug(f"Collected channel data: {metadata['title']}")
+                    logger.debug("Collected channel data: %s", metadata['title'])
             
             self.collected_channels.extend(channels_metadata)
             logger.info(f"Successfully collected data for {len(channels_metadata)} channels")
@@ -75,7 +81,8 @@ class VideoCollector:
             logger.error(f"Failed to collect channel data: {e}")
             return []
     
-    def collect_videos_from_channel(self, channel_id: str, max_videos: int = MAX_VIDEOS_PER_CHANNEL) -> List[Dict]:
+    def collect_videos_from_channel(self, channel_id: str, max_videos: int = MAX_VIDEOS_PER_CHANNEL,
+                                    category: Optional[str] = None) -> List[Dict]:
         """Collect videos from a specific channel"""
         logger.info(f"Collecting videos from channel: {channel_id}")
         
@@ -93,14 +100,21 @@ class VideoCollector:
             video_data = get_video_details(self.client, video_ids)
             videos_metadata = []
             
+            # Single collection timestamp shared by the whole batch
+            collected_at = datetime.now()
+            collected_at_iso = collected_at.isoformat()
+            collection_date = collected_at.date().isoformat()
+            
             for video in video_data:
-                metadata = extract_video_metadata(video)
-                if metadata and validate_video_data(metadata):
+                metadata = extract_video_metadata(video, validate=True)
+                if metadata:
                     # Add collection timestamp
-                    metadata['collected_at'] = datetime.now().isoformat()
-                    metadata['collection_date'] = datetime.now().date().isoformat()
+                    metadata['collected_at'] = collected_at_iso
+                    metadata['collection_date'] = collection_date
+                    if category is not None:
+                        metadata['channel_category'] = category
                     videos_metadata.append(metadata)
-                    logger.debug(f"Collected video: {metadata['title'][:50]}...")
+                    logger.debug("Collected video: %.50s...", metadata['title'])
             
             logger.info(f"Successfully collected {len(videos_metadata)} valid videos from channel {channel_id}")
             return videos_metadata
@@ -123,20 +137,17 @@ class VideoCollector:
             logger.warning(f"No channels found for category: {category}")
             return []
         
-        all_videos = []
+        per_channel = []
         
         # First collect channel metadata
         self.collect_channel_data(channel_ids)
         
         # Then collect videos from each channel
-        for channel_id in tqdm(channel_ids, desc=f"Processing {category} channels"):
-            videos = self.collect_videos_from_channel(channel_id, max_videos_per_channel)
-            all_videos.extend(videos)
-            
-            # Add category information to videos
-            for video in videos:
-                video['channel_category'] = category
+        for channel_id in tqdm(channel_ids, desc=f"Processing {category} channels",
+                               disable=_PROGRESS_DISABLED, mininterval=1.0):
+            per_channel.append(self.collect_videos_from_channel(channel_id, max_videos_per_channel, category))
         
+        all_videos = list(chain.from_iterable(per_channel))
         logger.info(f"Collected {len(all_videos)} videos from {category} category")
         return all_videos
     
@@ -144,14 +155,28 @@ class VideoCollector:
         """Collect videos from all configured channels"""
         logger.info("Starting collection from all configured channels...")
         
-        all_videos = []
-        categories = get_all_categories()
+        # Channels listed under several categories are fetched only once
+        channel_ids = list(CHANNEL_TO_CATEGORIES)
+        
+        per_channel = []
+        
+        # First collect channel metadata
+        self.collect_channel_data(channel_ids)
         
-        for category in categories:
-            logger.info(f"Processing category: {category}")
-            videos = self.collect_videos_by_category(category, max_videos_per_channel)
-            all_videos.extend(videos)
+        # Then collect videos from each unique channel
+        for channel_id in tqdm(channel_ids, desc="Processing channels",
+                               disable=_PROGRESS_DISABLED, mininterval=1.0):
+            # channel_category keeps the single primary (first listed) category the features expect;
+            # channel_categories lists every category the channel appears under
+            categories = CHANNEL_TO_CATEGORIES[channel_id]
+            videos = self.collect_videos_from_channel(channel_id, max_videos_per_channel, categories[0])
+            all_categories = ','.join(categories)
+            for video in videos:
+                video['channel_categories'] = all_categories
+            per_channel.append(videos)
         
+        # Flatten once instead of growing a list per channel
+        all_videos = list(chain.from_iterable(per_channel))
         self.collected_videos = all_videos
         logger.info(f"Total videos collected: {len(all_videos)}")
         
@@ -177,7 +202,8 @@ class VideoCollector:
         logger.info(f"Found {len(recent_videos)} videos from the last {days_back} days")
         return recent_videos
     
-    def save_data(self, output_dir: str = DATA_RAW_PATH, timestamp: bool = True):
+    def save_data(self, output_dir: str = DATA_RAW_PATH, timestamp: bool = True, fast_csv: bool = False,
+                  compress_level: int = 1, feather: bool = False):
         """Save collected data to files"""
         os.makedirs(output_dir, exist_ok=True)
         
@@ -188,12 +214,19 @@ class VideoCollector:
         if self.collected_videos:
             video_filename = f"videos_{ts}.csv" if ts else "videos.csv"
             video_filepath = os.path.join(output_dir, video_filename)
-            save_to_csv(self.collected_videos, video_filepath)
+            save_to_csv(self.collected_videos, video_filepath, fast=fast_csv)
             
-            # Also save as JSON for backup
-            json_filename = f"videos_{ts}.json" if ts else "videos.json"
+            # Also save as newline-delimited JSON for backup (gzip level 1 by default, 0 disables)
+            json_filename = f"videos_{ts}.jsonl" if ts else "videos.jsonl"
+            if compress_level > 0:
+                json_filename += '.gz'
             json_filepath = os.path.join(output_dir, json_filename)
-            save_to_json(self.collected_videos, json_filepath)
+            save_to_ndjson(self.collected_videos, json_filepath, compresslevel=compress_level)
+            
+            # Optional Arrow IPC copy for zero-copy downstream loading (needs pyarrow)
+            if feather:
+                feather_filename = f"videos_{ts}.feather" if ts else "videos.feather"
+                save_to_feather(self.collected_videos, os.path.join(output_dir, feather_filename))
             
             logger.info(f"Saved {len(self.collected_videos)} videos to {video_filepath}")
         
@@ -221,8 +254,7 @@ class VideoCollector:
             'failed_channels': len(self.failed_channels),
             'quota_used': self.client.quota_used,
             'collection_timestamp': datetime.now().isoformat(),
-            'categories_processed': len(set(video.get('channel_category', 'unknown') 
-                                          for video in self.collected_videos))
+            'categories_processed': len({video.get('channel_category', 'unknown') for video in self.collected_videos})
         }
 
 def main():
@@ -238,6 +270,12 @@ def main():
     parser.add_argument('--no-timestamp', action='store_true',
                        help='Do not add timestamp to output filenames')
     parser.add_argument('--api-key', type=str, help='YouTube API key (overrides .env)')
+    parser.add_argument('--fast-csv', action='store_true',
+                       help='Write the videos CSV with pyarrow (if installed)')
+    parser.add_argument('--compress-level', type=int, default=1, choices=range(0, 10),
+                       metavar='N', help='Gzip level for the JSON backup (0 = uncompressed, default: 1)')
+    parser.add_argument('--feather', action='store_true',
+                       help='Also save the videos as a Feather file (needs pyarrow)')
     
     args = parser.parse_args()
     
@@ -261,7 +299,8 @@ def main():
             videos = collector.collect_all_videos(args.max_videos)
         
         # Save data
-        collector.save_data(args.output_dir, timestamp=not args.no_timestamp)
+        collector.save_data(args.output_dir, timestamp=not args.no_timestamp, fast_csv=args.fast_csv,
+                            compress_level=args.compress_level, feather=args.feather)
         
         # Print summary
         summary = collector.get_collection_summary()
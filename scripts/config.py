@@ -4,8 +4,9 @@ Contains API settings, channel lists, and system parameters
 """
 
 import os
+import functools
 from dotenv import load_dotenv
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 # Load environment variables
 load_dotenv()
@@ -34,6 +35,7 @@ def get_all_api_keys():
 
 YOUTUBE_API_KEYS = get_all_api_keys()
 YOUTUBE_API_KEY = YOUTUBE_API_KEYS[0] if YOUTUBE_API_KEYS else 'your_youtube_api_key_here'
+API_KEY_VALID = YOUTUBE_API_KEY != 'your_youtube_api_key_here' and len(YOUTUBE_API_KEY) > 10
 YOUTUBE_API_BASE_URL = os.getenv('YOUTUBE_API_BASE_URL', 'https://www.googleapis.com/youtube/v3/')
 MAX_RESULTS_PER_REQUEST = int(os.getenv('MAX_RESULTS_PER_REQUEST', 50))
 DAILY_QUOTA_LIMIT = int(os.getenv('DAILY_QUOTA_LIMIT', 10000))
@@ -43,15 +45,16 @@ DATA_COLLECTION_INTERVAL_HOURS = int(os.getenv('DATA_COLLECTION_INTERVAL_HOURS',
 PERFORMANCE_TRACKING_INTERVAL_HOURS = int(os.getenv('PERFORMANCE_TRACKING_INTERVAL_HOURS', 6))
 MAX_VIDEOS_PER_CHANNEL = int(os.getenv('MAX_VIDEOS_PER_CHANNEL', 100))
 
-# File Paths
-DATA_RAW_PATH = 'data/raw'
-DATA_PROCESSED_PATH = 'data/processed'
-DATA_SNAPSHOTS_PATH = 'data/snapshots'
-DATA_LOGS_PATH = 'data/logs'
+# File Paths (anchored at the project root so scripts work from any CWD)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_RAW_PATH = os.path.join(PROJECT_ROOT, 'data', 'raw')
+DATA_PROCESSED_PATH = os.path.join(PROJECT_ROOT, 'data', 'processed')
+DATA_SNAPSHOTS_PATH = os.path.join(PROJECT_ROOT, 'data', 'snapshots')
+DATA_LOGS_PATH = os.path.join(PROJECT_ROOT, 'data', 'logs')
 
 # Logging Configuration
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-LOG_FILE_PATH = os.getenv('LOG_FILE_PATH', 'data/logs/youtube_collector.log')
+LOG_FILE_PATH = os.path.join(PROJECT_ROOT, os.getenv('LOG_FILE_PATH', 'data/logs/youtube_collector.log'))
 
 # Timezone
 TIMEZONE = os.getenv('TIMEZONE', 'Asia/Colombo')
@@ -134,6 +137,22 @@ ALL_CHANNEL_IDS = list(set(ALL_CHANNEL_IDS))
 # Channel categories (derived from SRI_LANKAN_CHANNELS keys)
 CHANNEL_CATEGORIES = list(SRI_LANKAN_CHANNELS.keys())
 
+# Pre-computed channel ID tuples per category
+_CATEGORY_IDS = {k: tuple(v.values()) for k, v in SRI_LANKAN_CHANNELS.items()}
+
+def _build_channel_to_categories() -> Dict[str, List[str]]:
+    """Build reverse index of channel ID to the categories listing it"""
+    channel_to_categories = {}
+    for category, channels in SRI_LANKAN_CHANNELS.items():
+        for channel_id in channels.values():
+            categories = channel_to_categories.setdefault(channel_id, [])
+            if category not in categories:
+                categories.append(category)
+    return channel_to_categories
+
+# Reverse index (channel ID -> categories), preserves config order
+CHANNEL_TO_CATEGORIES = _build_channel_to_categories()
+
 # YouTube API Endpoints
 YOUTUBE_ENDPOINTS = {
     'channels': 'channels',
@@ -169,7 +188,8 @@ COLLECTION_PARAMS = {
     'search_parts': ['snippet'],
     'max_retries': 3,
     'retry_delay': 1,  # seconds
-    'rate_limit_delay': 1,  # seconds between requests
+    'rate_limit_delay': 1,  # seconds between requests (starting pace; adapts per key)
+    'max_requests_per_second': 5,  # ceiling the adaptive rate limiter may ramp up to per key
 }
 
 # Feature Engineering Parameters
@@ -200,19 +220,19 @@ VALIDATION_RULES = {
     'required_fields': ['video_id', 'title', 'published_at', 'channel_id']
 }
 
-def get_channel_ids_by_category(category: str) -> List[str]:
+@functools.lru_cache(maxsize=None)
+def get_channel_ids_by_category(category: str) -> Tuple[str, ...]:
     """Get channel IDs for a specific category"""
-    if category in SRI_LANKAN_CHANNELS:
-        return list(SRI_LANKAN_CHANNELS[category].values())
-    return []
+    return _CATEGORY_IDS.get(category, ())
 
-def get_all_categories() -> List[str]:
+@functools.lru_cache(maxsize=None)
+def get_all_categories() -> Tuple[str, ...]:
     """Get all available categories"""
-    return list(SRI_LANKAN_CHANNELS.keys())
+    return tuple(SRI_LANKAN_CHANNELS.keys())
 
 def validate_api_key() -> bool:
-    """Validate if API key is set"""
-    return YOUTUBE_API_KEY != 'your_youtube_api_key_here' and len(YOUTUBE_API_KEY) > 10
+    """Validate if API key is set (evaluated once at import)"""
+    return API_KEY_VALID
 
 def get_quota_cost(endpoint: str, parts: List[str]) -> int:
     """Calculate quota cost for API request"""
@@ -240,9 +260,11 @@ def get_quota_cost(endpoint: str, parts: List[str]) -> int:
 # Export main configuration
 __all__ = [
     'YOUTUBE_API_KEY',
+    'API_KEY_VALID',
     'SRI_LANKAN_CHANNELS',
     'CHANNEL_CATEGORIES',
     'ALL_CHANNEL_IDS',
+    'CHANNEL_TO_CATEGORIES',
     'COLLECTION_PARAMS',
     'FEATURE_PARAMS',
     'DATABASE_CONFIG',
@@ -7,11 +7,13 @@ import os
 import sys
 import argparse
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 import pandas as pd
 import numpy as np
-from textblob import TextBlob
+from textblob.en import sentiment as pattern_sentiment
 from tqdm import tqdm
 
 # Add scripts directory to path for imports
@@ -30,15 +32,60 @@ from config import (
 
 from utils import (
     load_from_csv,
-    save_to_csv,
+    load_dataframe,
     clean_text,
-    get_time_features,
-    convert_to_local_time,
     setup_logging
 )
 
 logger = setup_logging()
 
+# Common YouTube title keywords, compiled into one alternation with a named group each
+YOUTUBE_KEYWORDS = ['tutorial', 'review', 'unboxing', 'vlog', 'challenge', 'reaction', 'how to', 'tips', 'tricks']
+YOUTUBE_KEYWORD_PATTERN = re.compile(
+    '|'.join(f'(?P<{keyword.replace(" ", "_")}>{re.escape(keyword)})' for keyword in YOUTUBE_KEYWORDS)
+)
+
+# Arrow-backed string dtype for text columns (None when pyarrow is not installed)
+try:
+    ARROW_STRING_DTYPE = pd.StringDtype('pyarrow')
+except ImportError:
+    ARROW_STRING_DTYPE = None
+
+TEXT_COLUMNS = ['title', 'description', 'channel_title', 'tags']
+LOW_CARDINALITY_COLUMNS = ['channel_id', 'channel_title', 'category_name', 'channel_category']
+
+# Snapshot columns used by engineer_performance_features
+SNAPSHOT_FEATURE_COLUMNS = ['video_id', 'snapshot_date', 'view_count', 'like_count',
+                            'comment_count', 'view_growth_24h']
+
+# Minimum number of distinct titles before sentiment scoring is spread over processes
+PARALLEL_SENTIMENT_MIN_TITLES = 5000
+
+def bin_values(values, bins: List[float], labels: List[str], include_lowest: bool = False) -> pd.Categorical:
+    """Right-closed binning equivalent to pd.cut, using np.searchsorted and category codes"""
+    values = np.asarray(values, dtype=float)
+    bins = np.asarray(bins, dtype=float)
+    
+    codes = np.searchsorted(bins, values, side='left') - 1
+    if include_lowest:
+        codes[values == bins[0]] = 0
+    
+    # Out-of-range and missing values become NaN, as with pd.cut
+    codes[np.isnan(values) | (codes < 0) | (codes >= len(labels))] = -1
+    return pd.Categorical.from_codes(codes, categories=labels, ordered=True)
+
+def _score_titles(titles) -> List[Tuple[float, float]]:
+    """Score a chunk of titles with the TextBlob lexicon (also runs in worker processes)"""
+    scores = []
+    for title in titles:
+        try:
+            # Score against TextBlob's preloaded lexicon directly, without
+            # building a TextBlob (tokenizer/parser setup) per title
+            scores.append(tuple(pattern_sentiment(title)))
+        except Exception:
+            scores.append((0.0, 0.0))
+    return scores
+
 class DataProcessor:
     """Main class for processing and feature engineering YouTube data"""
     
@@ -77,6 +124,11 @@ class DataProcessor:
                 latest_channel_file = max(channel_files)
                 channel_path = os.path.join(data_dir, latest_channel_file)
                 self.raw_channels = load_from_csv(channel_path)
+                if 'channel_id' in self.raw_channels.columns:
+                    # Index by channel_id so feature joins are hash lookups
+                    self.raw_channels = (self.raw_channels
+                                         .drop_duplicates(subset=['channel_id'], keep='last')
+                                         .set_index('channel_id'))
                 logger.info(f"Loaded {len(self.raw_channels)} channels from {latest_channel_file}")
             
             return True
@@ -85,23 +137,27 @@ class DataProcessor:
             logger.error(f"Failed to load raw data: {e}")
             return False
     
-    def load_snapshot_data(self, snapshots_dir: str = DATA_SNAPSHOTS_PATH) -> bool:
-        """Load performance snapshot data"""
+    def load_snapshot_data(self, snapshots_dir: str = DATA_SNAPSHOTS_PATH,
+                           video_ids: Optional[set] = None) -> bool:
+        """Load performance snapshot data, keeping only rows for the given videos"""
         logger.info("Loading snapshot data...")
         
         try:
             snapshot_files = [f for f in os.listdir(snapshots_dir) 
-                            if f.startswith('snapshot_') and f.endswith('.csv')]
+                            if f.startswith('snapshot_') and f.endswith(('.parquet', '.csv'))]
             
             if not snapshot_files:
                 logger.warning("No snapshot files found")
                 return False
             
-            # Load all snapshot files and combine
+            # Filter each file as it is read so only relevant rows are held in memory
             all_snapshots = []
             for file in snapshot_files:
                 file_path = os.path.join(snapshots_dir, file)
-                df = load_from_csv(file_path)
+                filters = [('video_id', 'in', list(video_ids))] if video_ids is not None else None
+                df = load_dataframe(file_path, columns=SNAPSHOT_FEATURE_COLUMNS, filters=filters)
+                if video_ids is not None and 'video_id' in df.columns:
+                    df = df[df['video_id'].isin(video_ids)]
                 if not df.empty:
                     all_snapshots.append(df)
             
@@ -119,11 +175,12 @@ class DataProcessor:
         """Clean and normalize video data"""
         logger.info("Cleaning video data...")
         
-        df = self.raw_videos.copy()
+        # Clean in place on the loaded frame rather than a defensive copy
+        df = self.raw_videos
         initial_count = len(df)
         
         # Remove duplicates
-        df = df.drop_duplicates(subset=['video_id'])
+        df.drop_duplicates(subset=['video_id'], inplace=True)
         logger.info(f"Removed {initial_count - len(df)} duplicate videos")
         
         # Clean text fields
@@ -140,7 +197,7 @@ class DataProcessor:
         
         # Convert timestamps
         if 'published_at' in df.columns:
-            df['published_at'] = pd.to_datetime(df['published_at'], errors='coerce')
+            df['published_at'] = pd.to_datetime(df['published_at'], utc=True, errors='coerce')
         
         # Filter out invalid data
         valid_mask = (
@@ -150,9 +207,15 @@ class DataProcessor:
             (df['title'].str.len() > 0)
         )
         
-        df = df[valid_mask]
+        df = df.loc[valid_mask].reset_index(drop=True)
         logger.info(f"Filtered to {len(df)} valid videos")
         
+        # Arrow strings take less memory and run .str methods in C++ kernels
+        if ARROW_STRING_DTYPE is not None:
+            for field in TEXT_COLUMNS:
+                if field in df.columns:
+                    df[field] = df[field].astype(ARROW_STRING_DTYPE)
+        
         return df
     
     def engineer_basic_features(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -167,15 +230,18 @@ class DataProcessor:
         
         # Tag features
         if 'tags' in df.columns:
-            df['tag_count'] = df['tags'].apply(lambda x: len(eval(x)) if isinstance(x, str) and x.startswith('[') else 0)
+            # Tags are stored as a list repr; count the "', '" separators instead of eval()
+            tags = df['tags'].fillna('').astype(str)
+            has_tags = tags.str.startswith('[') & (tags.str.len() > 2)
+            df['tag_count'] = np.where(has_tags, tags.str.count(r"""['"], ['"]""") + 1, 0)
         else:
             df['tag_count'] = 0
         
         # Duration features
         df['duration_minutes'] = df['duration_seconds'] / 60
-        df['duration_category'] = pd.cut(df['duration_seconds'], 
-                                       bins=[0, 60, 300, 600, 1800, float('inf')],
-                                       labels=['very_short', 'short', 'medium', 'long', 'very_long'])
+        df['duration_category'] = bin_values(df['duration_seconds'],
+                                             bins=[0, 60, 300, 600, 1800, float('inf')],
+                                             labels=['very_short', 'short', 'medium', 'long', 'very_long'])
         
         # Engagement features
         df['like_ratio'] = df['like_count'] / (df['view_count'] + 1)
@@ -187,13 +253,18 @@ class DataProcessor:
         
         # Channel features (if channel data is available)
         if not self.raw_channels.empty:
-            channel_features = self.raw_channels[['channel_id', 'subscriber_count', 'video_count', 'avg_views_per_video']].copy()
-            df = df.merge(channel_features, on='channel_id', how='left')
+            for col in ['subscriber_count', 'video_count', 'avg_views_per_video']:
+                df[col] = df['channel_id'].map(self.raw_channels[col])
             
             # Channel size categories
-            df['channel_size'] = pd.cut(df['subscriber_count'].fillna(0),
-                                      bins=[0, 1000, 10000, 100000, 1000000, float('inf')],
-                                      labels=['micro', 'small', 'medium', 'large', 'mega'])
+            df['channel_size'] = bin_values(df['subscriber_count'].fillna(0),
+                                            bins=[0, 1000, 10000, 100000, 1000000, float('inf')],
+                                            labels=['micro', 'small', 'medium', 'large', 'mega'])
+        
+        # Low-cardinality identifiers as categoricals for cheaper groupby/value_counts
+        for col in LOW_CARDINALITY_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
         
         return df
     
@@ -205,37 +276,30 @@ class DataProcessor:
             logger.warning("No published_at column found, skipping time features")
             return df
         
-        # Convert to local timezone
-        df['published_at_local'] = df['published_at'].apply(
-            lambda x: convert_to_local_time(x.isoformat()) if pd.notna(x) else None
-        )
-        
-        # Extract time features
-        time_features_list = []
-        for idx, row in df.iterrows():
-            if pd.notna(row['published_at_local']):
-                time_features = get_time_features(row['published_at_local'])
-                time_features_list.append(time_features)
-            else:
-                time_features_list.append({key: None for key in ['year', 'month', 'day', 'hour', 'day_of_week', 'is_weekend']})
-        
-        time_df = pd.DataFrame(time_features_list)
-        df = pd.concat([df, time_df], axis=1)
+        # Convert to local timezone in bulk
+        published_utc = pd.to_datetime(df['published_at'], utc=True)
+        df['published_at_local'] = published_utc.dt.tz_convert(TIMEZONE)
+        
+        # Extract time features (vectorized over the local timestamps)
+        local_ts = df['published_at_local'].dt
+        df['year'] = local_ts.year
+        df['month'] = local_ts.month
+        df['day'] = local_ts.day
+        df['hour'] = local_ts.hour
+        df['day_of_week'] = local_ts.dayofweek
+        df['day_of_year'] = local_ts.dayofyear
+        df['week_of_year'] = local_ts.isocalendar().week
+        df['is_weekend'] = local_ts.dayofweek >= 5
+        df['quarter'] = local_ts.quarter
         
         # Time-based categories
-        df['publish_time_category'] = pd.cut(df['hour'].fillna(12),
-                                           bins=[0, 6, 12, 18, 24],
-                                           labels=['night', 'morning', 'afternoon', 'evening'],
-                                           include_lowest=True)
+        df['publish_time_category'] = bin_values(df['hour'].fillna(12),
+                                                 bins=[0, 6, 12, 18, 24],
+                                                 labels=['night', 'morning', 'afternoon', 'evening'],
+                                                 include_lowest=True)
         
         # Days since publication
-        current_time = datetime.now()
-        # Make current_time timezone-aware to match published_at
-        if df['published_at'].dt.tz is not None:
-            import pytz
-            current_time = current_time.replace(tzinfo=pytz.UTC)
-        
-        df['days_since_published'] = (current_time - df['published_at']).dt.days
+        df['days_since_published'] = (pd.Timestamp.now(tz='UTC') - published_utc).dt.days
         df['weeks_since_published'] = df['days_since_published'] / 7
         
         return df
@@ -248,35 +312,52 @@ class DataProcessor:
             logger.info("Sentiment analysis disabled, skipping text features")
             return df
         
+        # Lowercased titles, shared by the case-insensitive features below
+        title_lower = df['title'].str.lower()
+        
         # Sentiment analysis for titles
         logger.info("Analyzing title sentiment...")
-        title_sentiments = []
-        for title in tqdm(df['title'], desc="Processing titles"):
-            try:
-                blob = TextBlob(title)
-                sentiment = {
-                    'title_sentiment_polarity': blob.sentiment.polarity,
-                    'title_sentiment_subjectivity': blob.sentiment.subjectivity
-                }
-            except:
-                sentiment = {
-                    'title_sentiment_polarity': 0.0,
-                    'title_sentiment_subjectivity': 0.0
-                }
-            title_sentiments.append(sentiment)
+        # Titles repeat across re-collected videos, so score each distinct title once
+        unique_titles = np.asarray(df['title'].unique(), dtype=object)
+        n_workers = os.cpu_count() or 1
+        
+        if len(unique_titles) >= PARALLEL_SENTIMENT_MIN_TITLES and n_workers > 1:
+            # Lexicon state is read-only; chunking amortizes process IPC
+            chunks = np.array_split(unique_titles, n_workers * 4)
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                chunk_scores = executor.map(_score_titles, chunks)
+                title_sentiments = list(chain.from_iterable(
+                    tqdm(chunk_scores, total=len(chunks), desc="Processing title chunks")
+                ))
+        else:
+            title_sentiments = _score_titles(tqdm(unique_titles, desc="Processing titles"))
         
-        sentiment_df = pd.DataFrame(title_sentiments)
-        df = pd.concat([df, sentiment_df], axis=1)
+        sentiment_df = pd.DataFrame(
+            title_sentiments, index=unique_titles,
+            columns=['title_sentiment_polarity', 'title_sentiment_subjectivity']
+        )
+        for col in sentiment_df.columns:
+            df[col] = df['title'].map(sentiment_df[col])
         
-        # Text complexity features
+        # Text complexity features (title_length comes from engineer_basic_features)
+        title_length = df['title_length'] if 'title_length' in df.columns else df['title'].str.len()
         df['title_exclamation_count'] = df['title'].str.count('!')
-        df['title_question_count'] = df['title'].str.count('\?')
-        df['title_caps_ratio'] = df['title'].apply(lambda x: sum(1 for c in x if c.isupper()) / max(len(x), 1))
-        
-        # Keyword features (common YouTube keywords)
-        youtube_keywords = ['tutorial', 'review', 'unboxing', 'vlog', 'challenge', 'reaction', 'how to', 'tips', 'tricks']
-        for keyword in youtube_keywords:
-            df[f'title_has_{keyword.replace(" ", "_")}'] = df['title'].str.lower().str.contains(keyword, na=False)
+        df['title_question_count'] = df['title'].str.count(r'\?')
+        # str.isupper counts every cased capital (accented, math alphanumerics), not just A-Z;
+        # summed in C once per distinct title
+        caps_counts = {title: sum(map(str.isupper, title)) for title in unique_titles}
+        df['title_caps_ratio'] = df['title'].map(caps_counts) / title_length.clip(lower=1)
+        
+        # Keyword features (common YouTube keywords), all matched in one regex pass
+        keyword_matches = (
+            title_lower
+            .str.extractall(YOUTUBE_KEYWORD_PATTERN)
+            .notna()
+            .groupby(level=0).any()
+            .reindex(df.index, fill_value=False)
+        )
+        for group in YOUTUBE_KEYWORD_PATTERN.groupindex:
+            df[f'title_has_{group}'] = keyword_matches[group].astype(bool)
         
         return df
     
@@ -288,59 +369,40 @@ class DataProcessor:
             logger.warning("No snapshot data available, skipping performance features")
             return df
         
-        # Calculate growth metrics from snapshots
-        growth_features = []
+        # Calculate growth metrics from snapshots in one groupby pass
+        snapshots = self.snapshots.assign(snapshot_date=pd.to_datetime(self.snapshots['snapshot_date']))
+        grouped = snapshots.sort_values('snapshot_date', kind='stable').groupby('video_id', sort=False)
+        
+        metric_columns = ['snapshot_date', 'view_count', 'like_count', 'comment_count']
+        first_snapshot = grouped[metric_columns].first()
+        last_snapshot = grouped[metric_columns].last()
+        snapshot_counts = grouped.size()
+        
+        days_diff = (last_snapshot['snapshot_date'] - first_snapshot['snapshot_date']).dt.days.clip(lower=1)
+        
+        growth_df = pd.DataFrame({
+            'view_growth_rate': (last_snapshot['view_count'] - first_snapshot['view_count']) / days_diff,
+            'like_growth_rate': (last_snapshot['like_count'] - first_snapshot['like_count']) / days_diff,
+            'comment_growth_rate': (last_snapshot['comment_count'] - first_snapshot['comment_count']) / days_diff,
+        })
+        
+        # Peak daily views and consistency score (mean/std of daily growth)
+        if 'view_growth_24h' in snapshots.columns:
+            daily_growth = grouped['view_growth_24h']
+            growth_std = daily_growth.std()
+            growth_df['peak_daily_views'] = daily_growth.max()
+            growth_df['consistency_score'] = (daily_growth.mean() / growth_std).where(
+                (snapshot_counts > 2) & (growth_std > 0), 0
+            )
+        else:
+            growth_df['peak_daily_views'] = 0
+            growth_df['consistency_score'] = 0
         
-        for video_id in tqdm(df['video_id'], desc="Processing performance data"):
-            video_snapshots = self.snapshots[self.snapshots['video_id'] == video_id]
-            
-            if len(video_snapshots) < 2:
-                # Not enough data for growth calculation
-                growth_features.append({
-                    'view_growth_rate': 0,
-                    'like_growth_rate': 0,
-                    'comment_growth_rate': 0,
-                    'peak_daily_views': 0,
-                    'consistency_score': 0
-                })
-                continue
-            
-            # Sort by date
-            video_snapshots = video_snapshots.sort_values('snapshot_date')
-            
-            # Calculate growth rates
-            first_snapshot = video_snapshots.iloc[0]
-            last_snapshot = video_snapshots.iloc[-1]
-            
-            days_diff = max((pd.to_datetime(last_snapshot['snapshot_date']) - 
-                           pd.to_datetime(first_snapshot['snapshot_date'])).days, 1)
-            
-            view_growth_rate = (last_snapshot['view_count'] - first_snapshot['view_count']) / days_diff
-            like_growth_rate = (last_snapshot['like_count'] - first_snapshot['like_count']) / days_diff
-            comment_growth_rate = (last_snapshot['comment_count'] - first_snapshot['comment_count']) / days_diff
-            
-            # Peak daily views (if daily growth data available)
-            peak_daily_views = 0
-            if 'view_growth_24h' in video_snapshots.columns:
-                peak_daily_views = video_snapshots['view_growth_24h'].max()
-            
-            # Consistency score (coefficient of variation of daily growth)
-            consistency_score = 0
-            if 'view_growth_24h' in video_snapshots.columns and len(video_snapshots) > 2:
-                daily_growth = video_snapshots['view_growth_24h']
-                if daily_growth.std() > 0:
-                    consistency_score = daily_growth.mean() / daily_growth.std()
-            
-            growth_features.append({
-                'view_growth_rate': view_growth_rate,
-                'like_growth_rate': like_growth_rate,
-                'comment_growth_rate': comment_growth_rate,
-                'peak_daily_views': peak_daily_views,
-                'consistency_score': consistency_score
-            })
+        # Not enough data for growth calculation with fewer than two snapshots
+        growth_df = growth_df[snapshot_counts >= 2]
         
-        growth_df = pd.DataFrame(growth_features)
-        df = pd.concat([df, growth_df], axis=1)
+        for col in growth_df.columns:
+            df[col] = df['video_id'].map(growth_df[col]).fillna(0)
         
         return df
     
@@ -348,37 +410,32 @@ class DataProcessor:
         """Create target variables for machine learning"""
         logger.info("Creating target variables...")
         
-        # Viewership categories based on percentiles
-        view_percentiles = df['view_count'].quantile([0.25, 0.5, 0.75, 0.9])
-        
-        def categorize_viewership(views):
-            if views <= view_percentiles[0.25]:
-                return 'low'
-            elif views <= view_percentiles[0.5]:
-                return 'medium_low'
-            elif views <= view_percentiles[0.75]:
-                return 'medium_high'
-            elif views <= view_percentiles[0.9]:
-                return 'high'
-            else:
-                return 'viral'
+        view_counts = df['view_count'].values.astype(float)
+        engagement = df['engagement_ratio'].values.astype(float)
+        
+        # One quantile pass per metric; the 0/1 quantiles double as min/max for normalization
+        view_min, *view_edges, view_max = np.quantile(view_counts, [0.0, 0.25, 0.5, 0.75, 0.9, 1.0])
+        engagement_min, *engagement_edges, engagement_max = np.quantile(engagement, [0.0, 0.33, 0.67, 1.0])
         
-        df['viewership_category'] = df['view_count'].apply(categorize_viewership)
+        # Viewership categories based on percentiles (x <= 25th pct is 'low', > 90th is 'viral')
+        view_codes = np.digitize(view_counts, view_edges, right=True)
+        df['viewership_category'] = pd.Categorical.from_codes(
+            view_codes, categories=['low', 'medium_low', 'medium_high', 'high', 'viral'], ordered=True
+        )
         
         # Binary viral classification
         viral_threshold = FEATURE_PARAMS.get('viral_view_threshold', 100000)
-        df['is_viral'] = (df['view_count'] >= viral_threshold).astype(int)
+        df['is_viral'] = (view_counts >= viral_threshold).astype(int)
         
         # Engagement level
-        engagement_percentiles = df['engagement_ratio'].quantile([0.33, 0.67])
-        df['engagement_level'] = pd.cut(df['engagement_ratio'],
-                                      bins=[0, engagement_percentiles[0.33], engagement_percentiles[0.67], float('inf')],
-                                      labels=['low', 'medium', 'high'])
+        df['engagement_level'] = bin_values(engagement,
+                                            bins=[0, *engagement_edges, float('inf')],
+                                            labels=['low', 'medium', 'high'])
         
         # Success score (composite metric)
         # Normalize metrics to 0-1 scale
-        df['view_score'] = (df['view_count'] - df['view_count'].min()) / (df['view_count'].max() - df['view_count'].min())
-        df['engagement_score'] = (df['engagement_ratio'] - df['engagement_ratio'].min()) / (df['engagement_ratio'].max() - df['engagement_ratio'].min())
+        df['view_score'] = (view_counts - view_min) / (view_max - view_min)
+        df['engagement_score'] = (engagement - engagement_min) / (engagement_max - engagement_min)
         
         # Weighted success score
         df['success_score'] = 0.7 * df['view_score'] + 0.3 * df['engagement_score']
@@ -400,14 +457,22 @@ class DataProcessor:
             'numeric_features': {}
         }
         
-        for col in numeric_columns:
-            self.feature_stats['numeric_features'][col] = {
-                'mean': float(df[col].mean()),
-                'std': float(df[col].std()),
-                'min': float(df[col].min()),
-                'max': float(df[col].max()),
-                'median': float(df[col].median()),
-                'missing_count': int(df[col].isna().sum())
+        if len(numeric_columns):
+            numeric_df = df[numeric_columns]
+            summary = numeric_df.describe(percentiles=[0.5]).T[['mean', 'std', 'min', 'max', '50%']]
+            summary = summary.rename(columns={'50%': 'median'}).astype(float)
+            summary['missing_count'] = numeric_df.isna().sum()
+            
+            self.feature_stats['numeric_features'] = {
+                col: {
+                    'mean': row['mean'],
+                    'std': row['std'],
+                    'min': row['min'],
+                    'max': row['max'],
+                    'median': row['median'],
+                    'missing_count': int(row['missing_count'])
+                }
+                for col, row in summary.iterrows()
             }
         
         # Category distributions
@@ -427,7 +492,8 @@ class DataProcessor:
             raise ValueError("Failed to load raw data")
         
         if include_snapshots:
-            self.load_snapshot_data()
+            video_ids = set(self.raw_videos['video_id']) if 'video_id' in self.raw_videos.columns else None
+            self.load_snapshot_data(video_ids=video_ids)
         
         # Clean data
         df = self.clean_video_data()
@@ -453,8 +519,9 @@ class DataProcessor:
         
         return df
     
-    def save_processed_data(self, output_dir: str = DATA_PROCESSED_PATH, timestamp: bool = True):
-        """Save processed data and feature statistics"""
+    def save_processed_data(self, output_dir: str = DATA_PROCESSED_PATH, timestamp: bool = True,
+                            output_format: str = 'parquet'):
+        """Save processed data (Parquet, or CSV fallback) and feature statistics"""
         os.makedirs(output_dir, exist_ok=True)
         
         if self.processed_data.empty:
@@ -464,10 +531,23 @@ class DataProcessor:
         # Generate timestamp for filenames
         ts = datetime.now().strftime("%Y%m%d_%H%M%S") if timestamp else ""
         
-        # Save processed dataset
-        filename = f"processed_videos_{ts}.csv" if ts else "processed_videos.csv"
-        filepath = os.path.join(output_dir, filename)
-        save_to_csv(self.processed_data.to_dict('records'), filepath)
+        # Save processed dataset (columnar Parquet keeps dtypes; needs pyarrow)
+        basename = f"processed_videos_{ts}" if ts else "processed_videos"
+        filepath = None
+        
+        if output_format == 'parquet':
+            filepath = os.path.join(output_dir, f"{basename}.parquet")
+            try:
+                self.processed_data.to_parquet(filepath, compression='zstd', index=False)
+            except Exception as e:
+                logger.warning(f"Parquet output failed ({e}), falling back to CSV")
+                if os.path.exists(filepath):
+                    os.remove(filepath)
+                filepath = None
+        
+        if filepath is None:
+            filepath = os.path.join(output_dir, f"{basename}.csv")
+            self.processed_data.to_csv(filepath, index=False, encoding='utf-8')
         
         # Save feature statistics
         stats_filename = f"feature_stats_{ts}.json" if ts else "feature_stats.json"
@@ -494,6 +574,8 @@ def main():
                        help='Skip sentiment analysis')
     parser.add_argument('--no-timestamp', action='store_true',
                        help='Do not add timestamp to output filenames')
+    parser.add_argument('--format', choices=['parquet', 'csv'], default='parquet',
+                       help='Output format for the processed dataset (default: parquet)')
     
     args = parser.parse_args()
     
@@ -510,7 +592,8 @@ def main():
         processed_df = processor.process_all_data(include_snapshots=not args.no_snapshots)
         
         # Save results
-        processor.save_processed_data(args.output_dir, timestamp=not args.no_timestamp)
+        processor.save_processed_data(args.output_dir, timestamp=not args.no_timestamp,
+                                      output_format=args.format)
         
         # Print summary
         logger.info("Processing Summary:")
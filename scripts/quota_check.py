@@ -1,6 +1,7 @@
 import os
 import sys
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
@@ -29,7 +30,7 @@ def load_api_keys():
 
     return keys
 
-def check_lightweight_quota(api_key, index):
+def check_lightweight_quota(api_key, index, log=print):
     """Check 1-unit quota (videos.list)."""
     url = "https://www.googleapis.com/youtube/v3/videos"
     params = {
@@ -41,17 +42,17 @@ def check_lightweight_quota(api_key, index):
     try:
         response = requests.get(url, params=params, timeout=10)
         if response.status_code == 200:
-            print(f"[LIGHT ✅] API Key {index} ({api_key[:10]}...) has 1-unit quota.")
+            log(f"[LIGHT ✅] API Key {index} ({api_key[:10]}...) has 1-unit quota.")
             return True
         else:
             reason = response.json().get("error", {}).get("errors", [{}])[0].get("reason", "Unknown error")
-            print(f"[LIGHT ❌] API Key {index} ({api_key[:10]}...) error: {reason}")
+            log(f"[LIGHT ❌] API Key {index} ({api_key[:10]}...) error: {reason}")
             return False
     except Exception as e:
-        print(f"[LIGHT ⚠️] API Key {index} ({api_key[:10]}...) exception: {e}")
+        log(f"[LIGHT ⚠️] API Key {index} ({api_key[:10]}...) exception: {e}")
         return False
 
-def check_search_quota(api_key, index):
+def check_search_quota(api_key, index, log=print):
     """Try a single 100-unit search.list call."""
     try:
         service = build('youtube', 'v3', developerKey=api_key)
@@ -64,23 +65,23 @@ def check_search_quota(api_key, index):
             order='relevance'
         ).execute()
 
-        print(f"[SEARCH ✅] API Key {index} ({api_key[:10]}...) has 100-unit quota.")
+        log(f"[SEARCH ✅] API Key {index} ({api_key[:10]}...) has 100-unit quota.")
         return True
     except HttpError as e:
         if e.resp.status == 403:
             reason = e.error_details[0].get('reason', 'unknown') if e.error_details else 'unknown'
             if 'quotaExceeded' in reason:
-                print(f"[SEARCH ❌] API Key {index} ({api_key[:10]}...) quota exceeded.")
+                log(f"[SEARCH ❌] API Key {index} ({api_key[:10]}...) quota exceeded.")
             else:
-                print(f"[SEARCH ❌] API Key {index} ({api_key[:10]}...) error: {reason}")
+                log(f"[SEARCH ❌] API Key {index} ({api_key[:10]}...) error: {reason}")
         else:
-            print(f"[SEARCH ❌] API Key {index} ({api_key[:10]}...) HTTP {e.resp.status}: {e}")
+            log(f"[SEARCH ❌] API Key {index} ({api_key[:10]}...) HTTP {e.resp.status}: {e}")
         return False
     except Exception as e:
-        print(f"[SEARCH ⚠️] API Key {index} ({api_key[:10]}...) exception: {e}")
+        log(f"[SEARCH ⚠️] API Key {index} ({api_key[:10]}...) exception: {e}")
         return False
 
-def test_multiple_searches(api_key, key_index, max_tests=10):
+def test_multiple_searches(api_key, key_index, max_tests=10, log=print):
     """Test how many 100-unit searches a key can handle."""
     try:
         service = build('youtube', 'v3', developerKey=api_key)
@@ -98,24 +99,44 @@ def test_multiple_searches(api_key, key_index, max_tests=10):
                 ).execute()
 
                 successful += 1
-                print(f"  ✅ Search {i+1}: Success")
+                log(f"  ✅ Search {i+1}: Success")
 
             except HttpError as e:
                 if e.resp.status == 403 and 'quotaExceeded' in str(e):
-                    print(f"  ❌ Search {i+1}: Quota exceeded")
+                    log(f"  ❌ Search {i+1}: Quota exceeded")
                     break
                 else:
-                    print(f"  ❌ Search {i+1}: Error - {e}")
+                    log(f"  ❌ Search {i+1}: Error - {e}")
                     break
             except Exception as e:
-                print(f"  ❌ Search {i+1}: Exception - {e}")
+                log(f"  ❌ Search {i+1}: Exception - {e}")
                 break
 
         return successful
     except Exception as e:
-        print(f"  💥 Failed to initialize service: {e}")
+        log(f"  💥 Failed to initialize service: {e}")
         return 0
 
+def probe_key(indexed_key):
+    """Run all quota checks for one key, buffering its output lines."""
+    i, key = indexed_key
+    lines = [f"\n🔑 API Key {i} ({key[:10]}...):"]
+    log = lines.append
+
+    light = check_lightweight_quota(key, i, log=log)
+    search = check_search_quota(key, i, log=log)
+
+    log("🔁 Estimating remaining search capacity...")
+    success_count = test_multiple_searches(key, i, max_tests=10, log=log)
+
+    if success_count == 0:
+        log(f"  📊 Result: No quota remaining")
+    else:
+        estimated = success_count * 100
+        log(f"  📊 Result: ~{estimated} units remaining ({success_count} searches)")
+
+    return lines, light, search, success_count
+
 def main():
     print("📦 Checking YouTube API Key Quotas")
     print("=" * 60)
@@ -129,24 +150,15 @@ def main():
     light_ok = 0
     search_ok = 0
 
-    for i, key in enumerate(api_keys, 1):
-        print(f"\n🔑 API Key {i} ({key[:10]}...):")
-
-        if check_lightweight_quota(key, i):
-            light_ok += 1
-
-        if check_search_quota(key, i):
-            search_ok += 1
+    # Keys are probed in parallel; calls within one key stay sequential
+    with ThreadPoolExecutor(max_workers=min(16, len(api_keys))) as executor:
+        results = executor.map(probe_key, enumerate(api_keys, 1))
 
-        print("🔁 Estimating remaining search capacity...")
-        success_count = test_multiple_searches(key, i, max_tests=10)
-        total_capacity += success_count
-
-        if success_count == 0:
-            print(f"  📊 Result: No quota remaining")
-        else:
-            estimated = success_count * 100
-            print(f"  📊 Result: ~{estimated} units remaining ({success_count} searches)")
+        for lines, light, search, success_count in results:
+            print("\n".join(lines))
+            light_ok += light
+            search_ok += search
+            total_capacity += success_count
 
     print("\n📊 Summary")
     print("=" * 60)
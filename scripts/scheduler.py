@@ -5,73 +5,206 @@ Handles periodic data collection, processing, and maintenance tasks
 
 import os
 import sys
-import time
+import logging
+import importlib
+import threading
+import traceback
 import schedule
 import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Union
 
 # Add scripts directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+import config
+import utils
 from utils import setup_logging
 from config import DATA_LOGS_PATH
 
 logger = setup_logging()
 
+# Scripts run in the scheduler process via their main(); others still use a subprocess.
+# process_data.py is left out: its process pool would fork this multithreaded process
+IN_PROCESS_SCRIPTS = {
+    'collect_videos.py': 'collect_videos',
+    'track_performance.py': 'track_performance',
+}
+
+# Longest a job may run before it is treated as hung (seconds)
+JOB_TIMEOUT = 3600
+
 class YouTubeDataScheduler:
     """Main scheduler class for automating data collection tasks"""
     
+    # Job names; each resolves to the '<name>_job' method
+    JOB_NAMES = ('daily_pipeline', 'collect_videos', 'track_performance', 'process_data',
+                 'channel_discovery', 'integration_test', 'cleanup')
+    
     def __init__(self, project_root: Optional[str] = None):
         """Initialize the scheduler"""
         self.project_root = project_root or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.scripts_dir = os.path.join(self.project_root, 'scripts')
         self.is_running = False
+        self._stop_event = threading.Event()
+        self._modules = {}  # Imported job modules, reloaded for each run
+        self._hung_scripts = set()  # In-process jobs that timed out; they run as subprocesses from then on
+        self._job_thread = None  # Latest in-process job thread, possibly still running after a timeout
+        
+        # Interpreter and script paths resolved once
+        self._python = sys.executable
+        self._script_paths = {
+            name: os.path.join(self.scripts_dir, name)
+            for name in ('collect_videos.py', 'track_performance.py', 'process_data.py',
+                         'collect_channels.py', 'test_integration.py')
+        }
         
         # Ensure logs directory exists
         os.makedirs(DATA_LOGS_PATH, exist_ok=True)
         
         logger.info(f"Scheduler initialized with project root: {self.project_root}")
     
-    def run_script(self, script_name: str, args: list = None) -> bool:
-        """Run a Python script with optional arguments"""
+    def _refresh_module_state(self, module_name: str):
+        """Re-read config and reset module-level state so each run starts like a fresh process"""
+        importlib.reload(config)
+        utils.reset_module_state()
+        
+        module = self._modules.get(module_name)
+        if module is None:
+            module = importlib.import_module(module_name)
+        else:
+            module = importlib.reload(module)
+        self._modules[module_name] = module
+        return module
+    
+    def run_module(self, script_name: str, args: list = None) -> bool:
+        """Run a script's main() in-process, in a watchdog thread bounded by JOB_TIMEOUT"""
+        module_name = IN_PROCESS_SCRIPTS[script_name]
+        argv = [script_name] + list(args or [])
+        saved_argv = sys.argv
+        saved_cwd = os.getcwd()
+        outcome = {}
+        
+        logger.info("Running in-process: %s", ' '.join(argv))
+        
+        def run_main():
+            try:
+                module.main()
+                outcome['success'] = True
+            except SystemExit as e:
+                outcome['success'] = e.code in (None, 0)
+                if not outcome['success']:
+                    logger.error(f"❌ {script_name} failed with exit code {e.code}")
+            except Exception as e:
+                outcome['success'] = False
+                logger.error(f"❌ Failed to run {script_name}: {e}")
+                logger.debug(traceback.format_exc())
+        
         try:
-            script_path = os.path.join(self.scripts_dir, script_name)
+            module = self._refresh_module_state(module_name)
+            
+            # Scripts parse sys.argv and use paths relative to the project root
+            sys.argv = argv
+            os.chdir(self.project_root)
             
-            if not os.path.exists(script_path):
-                logger.error(f"Script not found: {script_path}")
+            worker = threading.Thread(target=run_main, name=f"job-{module_name}", daemon=True)
+            self._job_thread = worker
+            worker.start()
+            worker.join(timeout=JOB_TIMEOUT)
+            
+            if worker.is_alive():
+                # A thread cannot be killed; leave it to finish in the background and run
+                # this script as a (killable) subprocess from now on
+                self._hung_scripts.add(script_name)
+                logger.error(f"❌ {script_name} timed out after {JOB_TIMEOUT // 60} minutes; "
+                             f"future runs will use a subprocess")
                 return False
             
-            # Build command
-            cmd = [sys.executable, script_path]
+            if outcome.get('success'):
+                logger.info(f"✅ {script_name} completed successfully")
+                return True
+            return False
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to run {script_name}: {e}")
+            logger.debug(traceback.format_exc())
+            return False
+        finally:
+            # A timed-out job is still running with these; don't change them underneath it
+            if not self._job_running():
+                sys.argv = saved_argv
+                os.chdir(saved_cwd)
+    
+    def _job_running(self) -> bool:
+        """Whether an in-process job thread is still alive, e.g. after timing out"""
+        return self._job_thread is not None and self._job_thread.is_alive()
+    
+    def run_script(self, script_name: str, args: list = None) -> bool:
+        """Run a Python script with optional arguments"""
+        if self._job_running():
+            # Another run would read and write the same data files the old job still writes to
+            logger.error(f"❌ Skipping {script_name}: {self._job_thread.name} from an earlier run "
+                         f"is still running")
+            return False
+        
+        if script_name in IN_PROCESS_SCRIPTS and script_name not in self._hung_scripts:
+            return self.run_module(script_name, args)
+        
+        try:
+            script_path = self._script_paths.get(script_name) or os.path.join(self.scripts_dir, script_name)
+            
+            # Build command (a missing script surfaces as a non-zero exit below)
+            cmd = [self._python, script_path]
             if args:
                 cmd.extend(args)
             
-            logger.info(f"Running: {' '.join(cmd)}")
+            logger.info("Running: %s", ' '.join(cmd))
             
-            # Run the script
-            result = subprocess.run(
+            # Run the script, streaming its output line by line instead of buffering it all
+            proc = subprocess.Popen(
                 cmd,
                 cwd=self.project_root,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=3600  # 1 hour timeout
+                bufsize=1
             )
             
-            if result.returncode == 0:
+            # Keep only the tail of the output for failure reports
+            output_tail = deque(maxlen=50)
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            
+            def relay_output():
+                for line in proc.stdout:
+                    line = line.rstrip()
+                    output_tail.append(line)
+                    if debug_enabled:
+                        logger.debug("[%s] %s", script_name, line)
+            
+            reader = threading.Thread(target=relay_output, daemon=True)
+            reader.start()
+            
+            try:
+                returncode = proc.wait(timeout=JOB_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                logger.error(f"❌ {script_name} timed out after {JOB_TIMEOUT // 60} minutes")
+                return False
+            finally:
+                reader.join(timeout=5)
+            
+            if returncode == 0:
                 logger.info(f"✅ {script_name} completed successfully")
-                if result.stdout:
-                    logger.debug(f"Output: {result.stdout}")
                 return True
             else:
-                logger.error(f"❌ {script_name} failed with return code {result.returncode}")
-                if result.stderr:
-                    logger.error(f"Error: {result.stderr}")
+                logger.error(f"❌ {script_name} failed with return code {returncode}")
+                if output_tail:
+                    logger.error("Error: " + "\n".join(output_tail))
                 return False
                 
-        except subprocess.TimeoutExpired:
-            logger.error(f"❌ {script_name} timed out after 1 hour")
-            return False
         except Exception as e:
             logger.error(f"❌ Failed to run {script_name}: {e}")
             return False
@@ -86,6 +219,11 @@ class YouTubeDataScheduler:
         else:
             logger.error("❌ Daily video collection failed")
     
+    def daily_pipeline_job(self):
+        """Daily pipeline: collect new videos, then process them in the same cycle"""
+        self.collect_videos_job()
+        self.process_data_job()
+    
     def track_performance_job(self):
         """Performance tracking job"""
         logger.info("📊 Starting performance tracking...")
@@ -126,38 +264,57 @@ class YouTubeDataScheduler:
         else:
             logger.error("❌ Integration tests failed")
     
+    def _remove_old_files(self, directory: str, cutoff: float, prefix: str = '',
+                          suffix: Union[str, tuple] = '') -> int:
+        """Remove files in directory older than cutoff, deleting in parallel"""
+        try:
+            with os.scandir(directory) as entries:
+                # Match on the name first so unrelated files are never stat'ed
+                stale = [entry.path for entry in entries
+                         if entry.name.startswith(prefix) and entry.name.endswith(suffix)
+                         and entry.is_file() and entry.stat().st_mtime < cutoff]
+        except FileNotFoundError:
+            logger.debug(f"Directory not found: {directory}")
+            return 0
+        
+        if not stale:
+            return 0
+        
+        # Unlinks are independent; a small pool hides per-call latency on network filesystems
+        with ThreadPoolExecutor(max_workers=min(8, len(stale))) as pool:
+            results = list(pool.map(self._remove_file, stale))
+        return sum(results)
+    
+    @staticmethod
+    def _remove_file(path: str) -> bool:
+        """Remove a single file, logging the outcome"""
+        try:
+            os.remove(path)
+            logger.info(f"Removed old file: {os.path.basename(path)}")
+            return True
+        except OSError as e:
+            logger.warning(f"⚠️ Could not remove {path}: {e}")
+            return False
+    
     def cleanup_job(self):
         """Monthly cleanup job"""
         logger.info("🧹 Starting cleanup tasks...")
         
         try:
+            now = datetime.now()
+            
             # Clean old log files (older than 30 days)
             logs_dir = os.path.join(self.project_root, 'data', 'logs')
-            if os.path.exists(logs_dir):
-                cutoff_date = datetime.now() - timedelta(days=30)
-                
-                for filename in os.listdir(logs_dir):
-                    filepath = os.path.join(logs_dir, filename)
-                    if os.path.isfile(filepath):
-                        file_time = datetime.fromtimestamp(os.path.getmtime(filepath))
-                        if file_time < cutoff_date:
-                            os.remove(filepath)
-                            logger.info(f"Removed old log file: {filename}")
+            removed_logs = self._remove_old_files(
+                logs_dir, (now - timedelta(days=30)).timestamp())
             
             # Clean old raw data files (older than 90 days)
             raw_dir = os.path.join(self.project_root, 'data', 'raw')
-            if os.path.exists(raw_dir):
-                cutoff_date = datetime.now() - timedelta(days=90)
-                
-                for filename in os.listdir(raw_dir):
-                    if filename.startswith('videos_') and filename.endswith('.csv'):
-                        filepath = os.path.join(raw_dir, filename)
-                        file_time = datetime.fromtimestamp(os.path.getmtime(filepath))
-                        if file_time < cutoff_date:
-                            os.remove(filepath)
-                            logger.info(f"Removed old raw data file: {filename}")
+            removed_raw = self._remove_old_files(
+                raw_dir, (now - timedelta(days=90)).timestamp(), prefix='videos_',
+                suffix=('.csv', '.jsonl', '.jsonl.gz', '.feather'))
             
-            logger.info("✅ Cleanup completed")
+            logger.info(f"✅ Cleanup completed: {removed_logs} log files, {removed_raw} raw data files removed")
             
         except Exception as e:
             logger.error(f"❌ Cleanup failed: {e}")
@@ -167,8 +324,7 @@ class YouTubeDataScheduler:
         logger.info("Setting up scheduled jobs...")
         
         # Daily jobs
-        schedule.every().day.at("02:00").do(self.collect_videos_job)
-        schedule.every().day.at("03:00").do(self.process_data_job)
+        schedule.every().day.at("02:00").do(self.daily_pipeline_job)
         
         # Every 6 hours
         schedule.every(6).hours.do(self.track_performance_job)
@@ -181,8 +337,7 @@ class YouTubeDataScheduler:
         schedule.every().month.do(self.cleanup_job)
         
         logger.info("✅ Schedule configured:")
-        logger.info("  - Daily video collection: 02:00")
-        logger.info("  - Daily data processing: 03:00")
+        logger.info("  - Daily video collection + data processing: 02:00")
         logger.info("  - Performance tracking: Every 6 hours")
         logger.info("  - Channel discovery: Sundays 01:00")
         logger.info("  - Integration tests: Sundays 04:00")
@@ -192,11 +347,20 @@ class YouTubeDataScheduler:
         """Run the scheduler continuously"""
         logger.info("🚀 Starting YouTube Data Collection Scheduler...")
         self.is_running = True
+        self._stop_event.clear()
         
         try:
             while self.is_running:
+                # Sleep exactly until the next job is due; stop_scheduler() wakes us early
+                idle = schedule.idle_seconds()
+                if idle is None:
+                    logger.warning("No scheduled jobs, stopping scheduler")
+                    break
+                if idle > 0 and self._stop_event.wait(idle):
+                    break
                 schedule.run_pending()
-                time.sleep(60)  # Check every minute
+            
+            self.is_running = False
                 
         except KeyboardInterrupt:
             logger.info("⏹️ Scheduler stopped by user")
@@ -209,37 +373,28 @@ class YouTubeDataScheduler:
         """Stop the scheduler"""
         logger.info("Stopping scheduler...")
         self.is_running = False
+        self._stop_event.set()
     
     def run_job_now(self, job_name: str):
         """Run a specific job immediately"""
-        jobs = {
-            'collect_videos': self.collect_videos_job,
-            'track_performance': self.track_performance_job,
-            'process_data': self.process_data_job,
-            'channel_discovery': self.channel_discovery_job,
-            'integration_test': self.integration_test_job,
-            'cleanup': self.cleanup_job
-        }
-        
-        if job_name in jobs:
+        if job_name in self.JOB_NAMES:
             logger.info(f"Running job immediately: {job_name}")
-            jobs[job_name]()
+            getattr(self, f"{job_name}_job")()
         else:
             logger.error(f"Unknown job: {job_name}")
-            logger.info(f"Available jobs: {', '.join(jobs.keys())}")
+            logger.info(f"Available jobs: {', '.join(self.JOB_NAMES)}")
     
     def get_schedule_info(self):
         """Get information about scheduled jobs"""
-        jobs_info = []
-        for job in schedule.jobs:
-            jobs_info.append({
-                'job': str(job.job_func.__name__),
+        return [
+            {
+                'job': job.job_func.__name__,
                 'next_run': job.next_run.isoformat() if job.next_run else 'Not scheduled',
-                'interval': str(job.interval),
+                'interval': job.interval,
                 'unit': job.unit
-            })
-        
-        return jobs_info
+            }
+            for job in schedule.jobs
+        ]
 
 def main():
     """Main function for command-line usage"""
@@ -248,8 +403,7 @@ def main():
     parser = argparse.ArgumentParser(description='YouTube Data Collection Scheduler')
     parser.add_argument('--run-job', type=str, 
                        help='Run a specific job immediately',
-                       choices=['collect_videos', 'track_performance', 'process_data', 
-                               'channel_discovery', 'integration_test', 'cleanup'])
+                       choices=YouTubeDataScheduler.JOB_NAMES)
     parser.add_argument('--show-schedule', action='store_true',
                        help='Show scheduled jobs information')
     parser.add_argument('--daemon', action='store_true',
@@ -5,8 +5,10 @@ Tracks daily changes in video engagement metrics (views, likes, comments)
 
 import os
 import sys
+import time
 import argparse
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
 from typing import List, Dict, Optional, Set
 import pandas as pd
 from tqdm import tqdm
@@ -24,57 +26,95 @@ from config import (
 from utils import (
     YouTubeAPIClient,
     get_video_details,
-    extract_video_metadata,
+    extract_video_metadata_batch,
     save_to_csv,
+    save_to_parquet,
+    save_to_json,
+    save_to_feather,
+    load_from_feather,
     load_from_csv,
+    load_dataframe,
     setup_logging
 )
 
 logger = setup_logging()
 
+# Snapshots are written as Parquet when pyarrow is available; older CSV snapshots are still read
+SNAPSHOT_EXTENSIONS = ('.parquet', '.csv')
+
+# Snapshots fetched but not yet saved, kept so a failed save can be retried with --resume
+PENDING_SNAPSHOT_FILE = os.path.join(DATA_SNAPSHOTS_PATH, 'pending_snapshot.feather')
+
+# Concurrent videos.list batches; the client's shared rate limiter still paces requests
+TRACKING_WORKERS = 8
+
+# Metadata fields copied into each snapshot, in output column order
+SNAPSHOT_FIELDS = ['video_id', 'view_count', 'like_count', 'comment_count', 'engagement_ratio',
+                   'title', 'channel_id', 'channel_title', 'published_at', 'duration_seconds',
+                   'category_id']
+
+# Columns needed from earlier snapshots to compute growth
+GROWTH_METRIC_COLUMNS = ['view_count', 'like_count', 'comment_count']
+GROWTH_SOURCE_COLUMNS = ['video_id'] + GROWTH_METRIC_COLUMNS
+
 class PerformanceTracker:
     """Main class for tracking video performance over time"""
     
     def __init__(self, api_key: Optional[str] = None):
         """Initialize the performance tracker"""
         self.client = YouTubeAPIClient(api_key) if api_key else YouTubeAPIClient()
-        self.snapshots = []
+        self.snapshots = pd.DataFrame()
         self.failed_videos = []
         
+        # Directory listings, scanned once per tracker (see list_raw_files/list_snapshot_files)
+        self._raw_files = None
+        self._snapshot_files = None
+        
         # Validate API key
         if not validate_api_key():
             raise ValueError("Invalid or missing YouTube API key. Please check your .env file.")
     
+    def _scan_raw_file(self, file: str, cutoff_date: pd.Timestamp) -> Set[str]:
+        """Get IDs of videos published since cutoff_date from one raw data file"""
+        try:
+            filepath = os.path.join(DATA_RAW_PATH, file)
+            df = load_from_csv(filepath, columns=['video_id', 'published_at'])
+            
+            if 'video_id' in df.columns and 'published_at' in df.columns:
+                # Filter for recent videos (load_from_csv already returns typed timestamps)
+                if not pd.api.types.is_datetime64_any_dtype(df['published_at']):
+                    df['published_at'] = pd.to_datetime(df['published_at'], utc=True)
+                recent_videos = df[df['published_at'] >= cutoff_date]
+                
+                logger.info(f"Found {len(recent_videos)} recent videos in {file}")
+                # Dedupe in C first so repeated IDs never become Python strings
+                return set(recent_videos['video_id'].unique())
+            
+        except Exception as e:
+            logger.warning(f"Failed to process file {file}: {e}")
+        
+        return set()
+    
     def get_video_ids_from_raw_data(self, days_back: int = 30) -> Set[str]:
         """Get video IDs from raw data files for tracking"""
         video_ids = set()
         
         try:
             # Look for video files in raw data directory
-            raw_files = [f for f in os.listdir(DATA_RAW_PATH) if f.startswith('videos_') and f.endswith('.csv')]
+            raw_files = self.list_raw_files()
             
             if not raw_files:
                 logger.warning("No video data files found in raw data directory")
                 return video_ids
             
-            # Load videos from recent files
-            cutoff_date = datetime.now() - timedelta(days=days_back)
+            # Load videos from recent files (published_at is stored in UTC)
+            cutoff_date = pd.Timestamp.now(tz='UTC') - pd.Timedelta(days=days_back)
             
-            for file in raw_files:
-                try:
-                    filepath = os.path.join(DATA_RAW_PATH, file)
-                    df = load_from_csv(filepath)
-                    
-                    if 'video_id' in df.columns and 'published_at' in df.columns:
-                        # Filter for recent videos
-                        df['published_at'] = pd.to_datetime(df['published_at'])
-                        recent_videos = df[df['published_at'] >= cutoff_date]
-                        video_ids.update(recent_videos['video_id'].tolist())
-                        
-                        logger.info(f"Found {len(recent_videos)} recent videos in {file}")
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to process file {file}: {e}")
+            # The CSV parsers release the GIL, so files are read in parallel
+            with ThreadPoolExecutor(max_workers=min(8, len(raw_files))) as executor:
+                for file_ids in executor.map(self._scan_raw_file, raw_files,
+                                             [cutoff_date] * len(raw_files)):
+                    video_ids |= file_ids
             
             logger.info(f"Total unique video IDs for tracking: {len(video_ids)}")
             return video_ids
@@ -83,23 +123,41 @@ class PerformanceTracker:
             logger.error(f"Failed to get video IDs from raw data: {e}")
             return video_ids
     
+    def list_raw_files(self, refresh: bool = False) -> List[str]:
+        """List raw video files, scanning the directory only on first use or refresh"""
+        if self._raw_files is None or refresh:
+            with os.scandir(DATA_RAW_PATH) as entries:
+                self._raw_files = sorted(entry.name for entry in entries
+                                         if entry.name.startswith('videos_') and entry.name.endswith('.csv'))
+        return self._raw_files
+    
+    def list_snapshot_files(self, refresh: bool = False) -> List[str]:
+        """List snapshot files, newest first (Parquet before CSV for the same date)"""
+        if self._snapshot_files is None or refresh:
+            with os.scandir(DATA_SNAPSHOTS_PATH) as entries:
+                snapshot_files = [entry.name for entry in entries
+                                  if entry.name.startswith('snapshot_') and entry.name.endswith(SNAPSHOT_EXTENSIONS)]
+            self._snapshot_files = sorted(snapshot_files,
+                                          key=lambda f: (os.path.splitext(f)[0], f.endswith('.parquet')),
+                                          reverse=True)
+        return self._snapshot_files
+    
     def get_video_ids_from_snapshots(self) -> Set[str]:
         """Get video IDs that are already being tracked"""
         video_ids = set()
         
         try:
             # Look for snapshot files
-            snapshot_files = [f for f in os.listdir(DATA_SNAPSHOTS_PATH) 
-                            if f.startswith('snapshot_') and f.endswith('.csv')]
+            snapshot_files = self.list_snapshot_files()
             
             if not snapshot_files:
                 return video_ids
             
             # Get the most recent snapshot file
-            latest_file = max(snapshot_files)
+            latest_file = snapshot_files[0]
             filepath = os.path.join(DATA_SNAPSHOTS_PATH, latest_file)
             
-            df = load_from_csv(filepath)
+            df = load_dataframe(filepath, columns=['video_id'])
             if 'video_id' in df.columns:
                 video_ids.update(df['video_id'].tolist())
                 logger.info(f"Found {len(video_ids)} videos in latest snapshot")
@@ -109,216 +167,205 @@ class PerformanceTracker:
         
         return video_ids
     
-    def track_video_performance(self, video_ids: List[str]) -> List[Dict]:
+    def track_video_performance(self, video_ids: List[str]) -> pd.DataFrame:
         """Track performance metrics for given video IDs"""
         logger.info(f"Tracking performance for {len(video_ids)} videos...")
         
-        snapshots = []
+        # Each batch's metadata is extracted as one DataFrame; they are concatenated at the end
+        frames = []
         current_time = datetime.now()
         
         # Process videos in batches to respect API limits
         batch_size = 50
+        batches = [video_ids[i:i + batch_size] for i in range(0, len(video_ids), batch_size)]
         
-        for i in tqdm(range(0, len(video_ids), batch_size), desc="Processing video batches"):
-            batch_ids = video_ids[i:i + batch_size]
+        # Batches are independent requests, so overlap their network round trips
+        with ThreadPoolExecutor(max_workers=max(1, min(TRACKING_WORKERS, len(batches)))) as executor:
+            futures = {executor.submit(get_video_details, self.client, batch_ids): batch_index
+                       for batch_index, batch_ids in enumerate(batches)}
             
-            try:
-                # Get current video data
-                video_data = get_video_details(self.client, batch_ids)
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Processing video batches"):
+                batch_index = futures[future]
+                batch_ids = batches[batch_index]
                 
-                for video in video_data:
-                    metadata = extract_video_metadata(video)
-                    
-                    if metadata:
-                        # Create snapshot record
-                        snapshot = {
-                            'video_id': metadata['video_id'],
-                            'snapshot_date': current_time.date().isoformat(),
-                            'snapshot_datetime': current_time.isoformat(),
-                            'view_count': metadata['view_count'],
-                            'like_count': metadata['like_count'],
-                            'comment_count': metadata['comment_count'],
-                            'engagement_ratio': metadata['engagement_ratio'],
-                            'title': metadata['title'],
-                            'channel_id': metadata['channel_id'],
-                            'channel_title': metadata['channel_title'],
-                            'published_at': metadata['published_at'],
-                            'duration_seconds': metadata['duration_seconds'],
-                            'category_id': metadata['category_id']
-                        }
-                        
-                        # Calculate days since publication
-                        try:
-                            pub_date = datetime.fromisoformat(metadata['published_at'].replace('Z', '+00:00'))
-                            days_since_pub = (current_time - pub_date.replace(tzinfo=None)).days
-                            snapshot['days_since_published'] = days_since_pub
-                        except:
-                            snapshot['days_since_published'] = None
-                        
-                        snapshots.append(snapshot)
-                        logger.debug(f"Tracked video: {metadata['title'][:50]}...")
+                # Only the API call can fail the batch; extraction below handles its own errors
+                try:
+                    video_data = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to track batch {batch_index + 1}: {e}")
+                    # Add failed video IDs to failed list
+                    for video_id in batch_ids:
+                        self.failed_videos.append({
+                            'video_id': video_id,
+                            'error': str(e),
+                            'timestamp': current_time.isoformat()
+                        })
+                    continue
                 
-            except Exception as e:
-                logger.error(f"Failed to track batch {i//batch_size + 1}: {e}")
-                # Add failed video IDs to failed list
-                for video_id in batch_ids:
-                    self.failed_videos.append({
-                        'video_id': video_id,
-                        'error': str(e),
-                        'timestamp': current_time.isoformat()
-                    })
+                # Snapshots never use the local publish time, so skip that conversion
+                metadata = extract_video_metadata_batch(video_data, include_local_time=False)
+                frames.append(metadata[SNAPSHOT_FIELDS])
+                logger.debug("Tracked batch %d: %d videos", batch_index + 1, len(metadata))
+        
+        if frames:
+            snapshots = pd.concat(frames, ignore_index=True)
+        else:
+            snapshots = pd.DataFrame(columns=SNAPSHOT_FIELDS)
+        # Narrowest integer type that holds each count column; ratios don't need float64
+        for column in GROWTH_METRIC_COLUMNS:
+            snapshots[column] = pd.to_numeric(snapshots[column], downcast='integer')
+        snapshots['engagement_ratio'] = snapshots['engagement_ratio'].astype('float32')
+        snapshots.insert(1, 'snapshot_date', current_time.date().isoformat())
+        snapshots.insert(2, 'snapshot_datetime', current_time.isoformat())
+        
+        # Days since publication for the whole run in one vectorized parse
+        published_at = pd.to_datetime(snapshots['published_at'], utc=True, errors='coerce')
+        snapshots['days_since_published'] = (
+            (pd.Timestamp.now(tz='UTC') - published_at).dt.days.astype('Int64'))
         
         self.snapshots = snapshots
         logger.info(f"Successfully tracked {len(snapshots)} videos")
+        
+        if not snapshots.empty:
+            os.makedirs(DATA_SNAPSHOTS_PATH, exist_ok=True)
+            save_to_feather(snapshots, PENDING_SNAPSHOT_FILE)
         return snapshots
     
-    def calculate_growth_metrics(self, video_id: str, current_snapshot: Dict) -> Dict:
-        """Calculate growth metrics by comparing with previous snapshots"""
-        growth_metrics = {
-            'view_growth_24h': 0,
-            'like_growth_24h': 0,
-            'comment_growth_24h': 0,
-            'view_growth_7d': 0,
-            'like_growth_7d': 0,
-            'comment_growth_7d': 0
-        }
+    def load_pending_snapshots(self) -> bool:
+        """Reload snapshots fetched by a previous run that did not finish saving"""
+        if not os.path.exists(PENDING_SNAPSHOT_FILE):
+            return False
         
+        self.snapshots = load_from_feather(PENDING_SNAPSHOT_FILE)
+        return not self.snapshots.empty
+    
+    def _load_prior_snapshot(self, target_date: date,
+                             video_ids: Optional[List[str]] = None) -> pd.DataFrame:
+        """Load the newest snapshot taken on or before target_date (one row per video)
+
+        If video_ids is given, only those rows are read (pushed down into the Parquet scan).
+        """
         try:
-            # Look for previous snapshots
-            snapshot_files = [f for f in os.listdir(DATA_SNAPSHOTS_PATH) 
-                            if f.startswith('snapshot_') and f.endswith('.csv')]
-            
-            if not snapshot_files:
-                return growth_metrics
-            
-            # Load recent snapshots
-            current_date = datetime.now().date()
-            date_24h_ago = current_date - timedelta(days=1)
-            date_7d_ago = current_date - timedelta(days=7)
-            
-            snapshot_24h = None
-            snapshot_7d = None
-            
-            for file in sorted(snapshot_files, reverse=True):
+            for file in self.list_snapshot_files():
+                date_str = os.path.splitext(file)[0].replace('snapshot_', '')
                 try:
-                    filepath = os.path.join(DATA_SNAPSHOTS_PATH, file)
-                    df = load_from_csv(filepath)
-                    
-                    if 'video_id' not in df.columns:
-                        continue
-                    
-                    video_data = df[df['video_id'] == video_id]
-                    if video_data.empty:
-                        continue
-                    
-                    # Parse snapshot date from filename or data
-                    if 'snapshot_date' in df.columns:
-                        snapshot_date = pd.to_datetime(video_data.iloc[0]['snapshot_date']).date()
-                    else:
-                        # Try to parse from filename
-                        date_str = file.replace('snapshot_', '').replace('.csv', '')
-                        try:
-                            snapshot_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-                        except:
-                            continue
-                    
-                    # Find closest snapshots to target dates
-                    if not snapshot_24h and snapshot_date <= date_24h_ago:
-                        snapshot_24h = video_data.iloc[0].to_dict()
-                    
-                    if not snapshot_7d and snapshot_date <= date_7d_ago:
-                        snapshot_7d = video_data.iloc[0].to_dict()
-                        break  # We have both snapshots
-                    
-                except Exception as e:
-                    logger.debug(f"Failed to process snapshot file {file}: {e}")
+                    snapshot_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+                except ValueError:
                     continue
-            
-            # Calculate growth metrics
-            current_views = current_snapshot['view_count']
-            current_likes = current_snapshot['like_count']
-            current_comments = current_snapshot['comment_count']
-            
-            if snapshot_24h:
-                growth_metrics['view_growth_24h'] = current_views - snapshot_24h.get('view_count', 0)
-                growth_metrics['like_growth_24h'] = current_likes - snapshot_24h.get('like_count', 0)
-                growth_metrics['comment_growth_24h'] = current_comments - snapshot_24h.get('comment_count', 0)
-            
-            if snapshot_7d:
-                growth_metrics['view_growth_7d'] = current_views - snapshot_7d.get('view_count', 0)
-                growth_metrics['like_growth_7d'] = current_likes - snapshot_7d.get('like_count', 0)
-                growth_metrics['comment_growth_7d'] = current_comments - snapshot_7d.get('comment_count', 0)
-            
+                
+                if snapshot_date > target_date:
+                    continue
+                
+                filepath = os.path.join(DATA_SNAPSHOTS_PATH, file)
+                filters = [('video_id', 'in', video_ids)] if video_ids is not None else None
+                df = load_dataframe(filepath, columns=GROWTH_SOURCE_COLUMNS, filters=filters)
+                if not set(GROWTH_SOURCE_COLUMNS).issubset(df.columns):
+                    continue
+                
+                logger.info(f"Using {file} as the baseline for {target_date}")
+                return df[GROWTH_SOURCE_COLUMNS].drop_duplicates('video_id')
+                
         except Exception as e:
-            logger.warning(f"Failed to calculate growth metrics for video {video_id}: {e}")
+            logger.warning(f"Failed to load snapshot for {target_date}: {e}")
         
-        return growth_metrics
+        return pd.DataFrame(columns=GROWTH_SOURCE_COLUMNS)
+    
+    def add_growth_metrics(self, current: pd.DataFrame, today: date) -> pd.DataFrame:
+        """Add 24h and 7d growth columns by joining against the baseline snapshots"""
+        video_ids = current['video_id'].tolist()
+        for period, days in (('24h', 1), ('7d', 7)):
+            prior = self._load_prior_snapshot(today - timedelta(days=days), video_ids)
+            # Left join keeps the current row order; videos missing from the baseline get 0 growth
+            baseline = current[['video_id']].merge(prior, on='video_id', how='left')
+            for column in GROWTH_METRIC_COLUMNS:
+                growth = current[column].to_numpy() - baseline[column].to_numpy(dtype='float64')
+                current[column.replace('_count', f'_growth_{period}')] = pd.to_numeric(
+                    pd.Series(growth, index=current.index).fillna(0).astype('int64'), downcast='integer')
+        
+        return current
     
     def save_snapshots(self, output_dir: str = DATA_SNAPSHOTS_PATH, include_growth: bool = True):
         """Save performance snapshots to files"""
         os.makedirs(output_dir, exist_ok=True)
         
-        if not self.snapshots:
+        if self.snapshots.empty:
             logger.warning("No snapshots to save")
             return
         
+        today = datetime.now().date()
+        
         # Add growth metrics if requested
         if include_growth:
             logger.info("Calculating growth metrics...")
-            for snapshot in tqdm(self.snapshots, desc="Adding growth metrics"):
-                growth_metrics = self.calculate_growth_metrics(snapshot['video_id'], snapshot)
-                snapshot.update(growth_metrics)
+            start_time = time.perf_counter()
+            self.snapshots = self.add_growth_metrics(self.snapshots, today)
+            elapsed = time.perf_counter() - start_time
+            logger.info(f"Computed growth for {len(self.snapshots)} videos in {elapsed:.2f}s")
         
         # Generate filename with current date
-        current_date = datetime.now().date().isoformat()
-        filename = f"snapshot_{current_date}.csv"
-        filepath = os.path.join(output_dir, filename)
+        current_date = today.isoformat()
+        filepath = os.path.join(output_dir, f"snapshot_{current_date}.parquet")
         
-        # Save snapshots
-        save_to_csv(self.snapshots, filepath)
+        # Save snapshots, falling back to CSV without pyarrow
+        if not save_to_parquet(self.snapshots, filepath):
+            filepath = os.path.join(output_dir, f"snapshot_{current_date}.csv")
+            save_to_csv(self.snapshots, filepath)
         logger.info(f"Saved {len(self.snapshots)} snapshots to {filepath}")
+        self._snapshot_files = None  # The new file invalidates the cached listing
         
         # Save failed videos if any
         if self.failed_videos:
             failed_filename = f"failed_tracking_{current_date}.json"
             failed_filepath = os.path.join(output_dir, failed_filename)
             
-            import json
-            with open(failed_filepath, 'w') as f:
-                json.dump(self.failed_videos, f, indent=2)
+            save_to_json(self.failed_videos, failed_filepath)
             
             logger.warning(f"Saved {len(self.failed_videos)} failed videos to {failed_filepath}")
+        
+        # The snapshot is safely on disk; the pending copy is no longer needed
+        try:
+            os.remove(PENDING_SNAPSHOT_FILE)
+        except FileNotFoundError:
+            pass
     
     def get_tracking_summary(self) -> Dict:
         """Get summary of tracking results"""
-        if not self.snapshots:
+        if self.snapshots.empty:
             return {'error': 'No snapshots available'}
         
-        df = pd.DataFrame(self.snapshots)
+        df = self.snapshots
+        
+        # Reduce every summary column in one pass
+        columns = ['view_count', 'like_count', 'comment_count', 'engagement_ratio']
+        has_growth = 'view_growth_24h' in df.columns
+        if has_growth:
+            columns += ['view_growth_24h', 'like_growth_24h', 'comment_growth_24h']
+        stats = df[columns].agg(['mean', 'sum'])
+        means, totals = stats.loc['mean'], stats.loc['sum']
         
         summary = {
             'total_videos_tracked': len(self.snapshots),
             'failed_videos': len(self.failed_videos),
             'quota_used': self.client.quota_used,
             'tracking_timestamp': datetime.now().isoformat(),
-            'avg_view_count': df['view_count'].mean(),
-            'avg_like_count': df['like_count'].mean(),
-            'avg_comment_count': df['comment_count'].mean(),
-            'avg_engagement_ratio': df['engagement_ratio'].mean(),
-            'total_views': df['view_count'].sum(),
-            'total_likes': df['like_count'].sum(),
-            'total_comments': df['comment_count'].sum()
+            'avg_view_count': means['view_count'],
+            'avg_like_count': means['like_count'],
+            'avg_comment_count': means['comment_count'],
+            'avg_engagement_ratio': means['engagement_ratio'],
+            'total_views': int(totals['view_count']),
+            'total_likes': int(totals['like_count']),
+            'total_comments': int(totals['comment_count'])
         }
         
         # Add growth metrics if available
-        if 'view_growth_24h' in df.columns:
+        if has_growth:
             summary.update({
-                'avg_view_growth_24h': df['view_growth_24h'].mean(),
-                'avg_like_growth_24h': df['like_growth_24h'].mean(),
-                'avg_comment_growth_24h': df['comment_growth_24h'].mean(),
-                'total_view_growth_24h': df['view_growth_24h'].sum(),
-                'total_like_growth_24h': df['like_growth_24h'].sum(),
-                'total_comment_growth_24h': df['comment_growth_24h'].sum()
+                'avg_view_growth_24h': means['view_growth_24h'],
+                'avg_like_growth_24h': means['like_growth_24h'],
+                'avg_comment_growth_24h': means['comment_growth_24h'],
+                'total_view_growth_24h': int(totals['view_growth_24h']),
+                'total_like_growth_24h': int(totals['like_growth_24h']),
+                'total_comment_growth_24h': int(totals['comment_growth_24h'])
             })
         
         return summary
@@ -336,6 +383,8 @@ def main():
     parser.add_argument('--no-growth', action='store_true',
                        help='Skip growth metrics calculation')
     parser.add_argument('--api-key', type=str, help='YouTube API key (overrides .env)')
+    parser.add_argument('--resume', action='store_true',
+                       help='Save snapshots left pending by an interrupted run instead of fetching')
     
     args = parser.parse_args()
     
@@ -344,7 +393,10 @@ def main():
         tracker = PerformanceTracker(api_key=args.api_key)
         
         # Get video IDs to track
-        if args.video_ids:
+        if args.resume and tracker.load_pending_snapshots():
+            logger.info(f"Resuming with {len(tracker.snapshots)} pending snapshots")
+            video_ids = None
+        elif args.video_ids:
             video_ids = args.video_ids
             logger.info(f"Tracking {len(video_ids)} specified videos")
         else:
@@ -358,12 +410,13 @@ def main():
             video_ids = list(video_ids_set)
             logger.info(f"Tracking {len(video_ids)} videos from data files")
         
-        if not video_ids:
-            logger.error("No video IDs found to track")
-            return
-        
-        # Track performance
-        snapshots = tracker.track_video_performance(video_ids)
+        if video_ids is not None:
+            if not video_ids:
+                logger.error("No video IDs found to track")
+                return
+            
+            # Track performance
+            tracker.track_video_performance(video_ids)
         
         # Save snapshots
         tracker.save_snapshots(args.output_dir, include_growth=not args.no_growth)
@@ -13,12 +13,18 @@ FEATURES:
 """
 
 import os
+import re
 import sys
 import json
 import time
 import random
+import queue
+import sqlite3
 import argparse
-from datetime import datetime, timedelta
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
 from typing import List, Dict, Optional, Set, Tuple
 from pathlib import Path
 from collections import defaultdict, Counter
@@ -37,13 +43,213 @@ except ImportError as e:
     print("Install with: pip install google-api-python-client python-dotenv requests")
     exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import project modules
 from config import DATA_RAW_PATH, validate_api_key
-from utils import setup_logging, YouTubeAPIClient
+from utils import setup_logging, YouTubeAPIClient, save_to_ndjson
 
 # Setup logging
 logger = setup_logging()
 
+def read_json(path: Path):
+    """Read a JSON file (parsed with orjson when available)"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def write_json(path: Path, data, pretty: bool = True):
+    """Write a JSON file, indented unless pretty is False (encoded with orjson when available)"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        content = orjson.dumps(data, option=option)
+    elif pretty:
+        content = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    else:
+        content = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    
+    # One write to a temporary file, then an atomic rename, so a crash never leaves a partial file
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+def read_ndjson_log(path: Path) -> List[Dict]:
+    """Read an append-only JSON-lines log, skipping lines that do not parse
+    
+    A torn last line (a write cut short by a crash) is truncated away so the next
+    append starts on a fresh line. I/O errors are raised to the caller.
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    records = []
+    offset = 0
+    with open(path, 'rb') as f:
+        lines = f.readlines()
+    
+    for number, line in enumerate(lines, 1):
+        if line.strip():
+            try:
+                records.append(loads(line))
+            except ValueError:
+                if number == len(lines) and not line.endswith(b'\n'):
+                    logger.warning(f"Truncating torn last line of {path}")
+                    with open(path, 'r+b') as f:
+                        f.truncate(offset)
+                    break
+                logger.warning(f"Skipping unparseable line {number} of {path}")
+        offset += len(line)
+    return records
+
+# Errors that mean the daily quota is gone (on this key or on all of them)
+QUOTA_ERROR_PATTERN = re.compile(r'quotaExceeded|All API keys exhausted')
+
+def is_quota_error(error: Exception) -> bool:
+    """Whether an API error means the quota is exhausted"""
+    return QUOTA_ERROR_PATTERN.search(str(error)) is not None
+
+# Sri Lankan relevance indicators and the score each adds (once per indicator found)
+SRI_LANKAN_INDICATORS = {
+    # High-value indicators
+    'sri lanka': 3.0, 'srilanka': 3.0, 'ceylon': 3.0, 'lanka': 3.0,
+    # Medium-value indicators
+    'colombo': 2.0, 'kandy': 2.0, 'galle': 2.0, 'jaffna': 2.0, 'sinhala': 2.0, 'tamil': 2.0,
+    # Cultural indicators
+    'lankan': 1.5, 'ape': 1.5, 'mage': 1.5, 'machang': 1.5, 'aiya': 1.5, 'nangi': 1.5,
+}
+
+# One zero-width lookahead per text position finds every indicator in a single scan,
+# including overlapping ones; longest alternatives first so 'lankan' wins over 'lanka'.
+# Case-insensitive so fields are scanned as-is rather than lowercased copies
+SRI_LANKAN_INDICATOR_PATTERN = re.compile(
+    '(?=(' + '|'.join(re.escape(indicator) for indicator in
+                      sorted(SRI_LANKAN_INDICATORS, key=len, reverse=True)) + '))',
+    re.IGNORECASE
+)
+
+# Indicators that contain shorter ones starting at the same position (e.g. 'lankan' -> 'lanka')
+SRI_LANKAN_IMPLIED_INDICATORS = {
+    indicator: frozenset(other for other in SRI_LANKAN_INDICATORS if other != indicator and other in indicator)
+    for indicator in SRI_LANKAN_INDICATORS
+}
+
+# Channel categories in priority order with the keywords that select them
+CATEGORY_KEYWORDS = (
+    ("News & Politics", ('news', 'politics', 'breaking', 'current')),
+    ("Music", ('music', 'song', 'singer', 'band')),
+    ("Entertainment", ('comedy', 'funny', 'entertainment', 'drama')),
+    ("Education", ('education', 'tutorial', 'learn', 'teach')),
+    ("Sports", ('sports', 'cricket', 'football', 'game')),
+    ("Travel & Events", ('travel', 'tour', 'visit', 'trip')),
+)
+DEFAULT_CATEGORY = "People & Blogs"
+
+# Priority (index into CATEGORY_KEYWORDS) of each category keyword
+CATEGORY_PRIORITY = {keyword: priority for priority, (_, keywords) in enumerate(CATEGORY_KEYWORDS)
+                     for keyword in keywords}
+
+# Finds every category keyword in one scan, the same way as SRI_LANKAN_INDICATOR_PATTERN
+CATEGORY_PATTERN = re.compile(
+    '(?=(' + '|'.join(re.escape(keyword) for keyword in
+                      sorted(CATEGORY_PRIORITY, key=len, reverse=True)) + '))',
+    re.IGNORECASE
+)
+
+def _build_long_tail_keywords() -> Tuple[str, ...]:
+    """Every long-tail search phrase, deduplicated (built once at import)"""
+    base_terms = ["sri lanka", "srilanka", "lanka", "sinhala", "tamil"]
+    locations = ["colombo", "kandy", "galle", "jaffna", "negombo", "matara"]
+    topics = ["vlog", "travel", "food", "news", "music", "comedy", "wedding", "festival"]
+    modifiers = ["2024", "2025", "latest", "new", "best", "top", "amazing"]
+    
+    templates = ("{base} {location} {topic}", "{location} {base} {topic}",
+                 "best {base} {topic}", "latest {location} {topic}")
+    keywords = {template.format(base=base, location=location, topic=topic)
+                for template in templates
+                for base, location, topic in itertools.product(base_terms[:2], locations[:3], topics[:4])}
+    keywords.update(f"{modifier} {base} {topic}"
+                    for modifier, base, topic in itertools.product(modifiers[:3], base_terms[:2], topics[:3]))
+    return tuple(sorted(keywords))
+
+LONG_TAIL_KEYWORDS = _build_long_tail_keywords()
+
+def chunked(iterable, size: int):
+    """Yield successive lists of up to size items without slicing copies of the source"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+# Strategies with a discover_* implementation; the others are planned and never selected
+IMPLEMENTED_STRATEGIES = ('keyword_search', 'long_tail_keywords', 'trending_hashtags', 'popular_videos')
+
+# Strategy selection is Thompson sampling over Beta(alpha, beta) posteriors of channels found per API call
+TS_DISCOUNT = 0.95       # Posterior counts decay by this much per update, so stale results age out
+
+# Search queries kept in flight at once; the API client's shared rate limiter still paces them
+SEARCH_WORKERS = 8
+
+# channels().list batches validated at once (quota cost 1 each)
+VALIDATION_WORKERS = 8
+
+# The background validator validates once it holds a full channels().list call's worth of IDs,
+# or once its oldest pending ID has waited this many seconds
+VALIDATION_BATCH_SIZE = 50
+VALIDATION_MAX_WAIT = 20.0
+
+# Search responses are reused across sessions for this long (0 disables the cache)
+DEFAULT_CACHE_TTL_HOURS = 24
+
+class SearchResponseCache:
+    """On-disk cache of search().list responses so repeated queries cost no quota"""
+    
+    def __init__(self, cache_file: Path, ttl_hours: float = DEFAULT_CACHE_TTL_HOURS):
+        self.ttl_seconds = ttl_hours * 3600
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(cache_file), check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, ts INTEGER, body TEXT)"
+            )
+            # Expired rows would never be served again
+            self._conn.execute("DELETE FROM cache WHERE ts < ?", (int(time.time() - self.ttl_seconds),))
+            self._conn.commit()
+    
+    @staticmethod
+    def make_key(**params) -> str:
+        """Canonical key for a set of request parameters"""
+        canonical = '|'.join(f"{name}={params[name]}" for name in sorted(params))
+        return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached response for key, or None if missing or expired"""
+        with self._lock:
+            row = self._conn.execute("SELECT ts, body FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None or time.time() - row[0] >= self.ttl_seconds:
+            return None
+        return json.loads(row[1])
+    
+    def put(self, key: str, response: Dict):
+        """Store a response under key"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, ts, body) VALUES (?, ?, ?)",
+                (key, int(time.time()), json.dumps(response, ensure_ascii=False))
+            )
+            self._conn.commit()
+    
+    def close(self):
+        """Close the cache database"""
+        with self._lock:
+            self._conn.close()
+
 class UnlimitedDiscoveryEngine:
     """Unlimited discovery engine with multiple strategies and continuous operation"""
     
@@ -55,24 +261,31 @@ class UnlimitedDiscoveryEngine:
         self.progress_file = output_dir / "unlimited_discovery_progress.json"
         self.discovered_ids_file = output_dir / "unlimited_discovered_ids.json"
         self.validated_channels_file = output_dir / "unlimited_validated_channels.json"
+        
+        # Append-only logs written on every save; the JSON files above are exported by finalize()
+        self.discovered_ids_log = output_dir / "unlimited_discovered_ids.jsonl"
+        self.validated_channels_log = output_dir / "unlimited_validated_channels.jsonl"
         self.strategy_stats_file = output_dir / "discovery_strategy_stats.json"
         
-        # Load existing data
+        # Load existing data; if the history cannot be read, finalize() must not
+        # overwrite the exports with only this session's data
+        self.history_loaded = True
         self.progress = self._load_progress()
         self.discovered_ids = self._load_discovered_ids()
         self.validated_channels = self._load_validated_channels()
+        # Kept in step with validated_channels so unvalidated lookups never rebuild it
+        self.validated_ids = {channel['channel_id'] for channel in self.validated_channels}
         self.strategy_stats = self._load_strategy_stats()
         
+        # Saves can come from several validation workers or strategies at once
+        self._lock = threading.Lock()
+        
         # Discovery strategies with performance tracking
         self.strategies = {
-            'keyword_search': {'weight': 1.0, 'success_rate': 0.0, 'last_used': None},
-            'long_tail_keywords': {'weight': 1.0, 'success_rate': 0.0, 'last_used': None},
-            'trending_hashtags': {'weight': 1.0, 'success_rate': 0.0, 'last_used': None},
-            'popular_videos': {'weight': 1.0, 'success_rate': 0.0, 'last_used': None},
-            'comment_mining': {'weight': 1.0, 'success_rate': 0.0, 'last_used': None},
-            'playlist_discovery': {'weight': 1.0, 'success_rate': 0.0, 'last_used': None},
-            'micro_geographic': {'weight': 1.0, 'success_rate': 0.0, 'last_used': None},
-            'autocomplete_expansion': {'weight': 1.0, 'success_rate': 0.0, 'last_used': None}
+            strategy: {'success_rate': 0.0, 'last_used': None, 'pulls': 0, 'alpha': 1.0, 'beta': 1.0}
+            for strategy in ('keyword_search', 'long_tail_keywords', 'trending_hashtags', 'popular_videos',
+                             'comment_mining', 'playlist_discovery', 'micro_geographic',
+                             'autocomplete_expansion')
         }
         
         # Load strategy performance
@@ -85,8 +298,7 @@ class UnlimitedDiscoveryEngine:
         """Load unlimited discovery progress"""
         if self.progress_file.exists():
             try:
-                with open(self.progress_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return read_json(self.progress_file)
             except Exception as e:
                 logger.warning(f"Error loading progress: {e}")
         
@@ -104,32 +316,56 @@ class UnlimitedDiscoveryEngine:
     
     def _load_discovered_ids(self) -> Set[str]:
         """Load all discovered channel IDs"""
+        if self.discovered_ids_log.exists():
+            try:
+                return {record['channel_id'] for record in read_ndjson_log(self.discovered_ids_log)
+                        if 'channel_id' in record}
+            except Exception as e:
+                logger.error(f"Error loading discovered IDs log: {e}")
+                self.history_loaded = False
+                return set()
+        
+        # Migrate IDs from the older whole-file JSON format into the append-only log
         if self.discovered_ids_file.exists():
             try:
-                with open(self.discovered_ids_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return set(data.get('channel_ids', []))
+                data = read_json(self.discovered_ids_file)
+                channel_ids = set(data.get('channel_ids', []))
+                save_to_ndjson([{'channel_id': channel_id} for channel_id in channel_ids],
+                               str(self.discovered_ids_log))
+                return channel_ids
             except Exception as e:
                 logger.warning(f"Error loading discovered IDs: {e}")
+                self.history_loaded = False
         return set()
     
     def _load_validated_channels(self) -> List[Dict]:
         """Load all validated channels"""
+        if self.validated_channels_log.exists():
+            try:
+                return [record for record in read_ndjson_log(self.validated_channels_log)
+                        if 'channel_id' in record]
+            except Exception as e:
+                logger.error(f"Error loading validated channels log: {e}")
+                self.history_loaded = False
+                return []
+        
+        # Migrate channels from the older whole-file JSON format into the append-only log
         if self.validated_channels_file.exists():
             try:
-                with open(self.validated_channels_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get('channels', [])
+                data = read_json(self.validated_channels_file)
+                channels = data.get('channels', [])
+                save_to_ndjson(channels, str(self.validated_channels_log))
+                return channels
             except Exception as e:
                 logger.warning(f"Error loading validated channels: {e}")
+                self.history_loaded = False
         return []
     
     def _load_strategy_stats(self) -> Dict:
         """Load strategy performance statistics"""
         if self.strategy_stats_file.exists():
             try:
-                with open(self.strategy_stats_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return read_json(self.strategy_stats_file)
             except Exception as e:
                 logger.warning(f"Error loading strategy stats: {e}")
         return {}
@@ -139,57 +375,82 @@ class UnlimitedDiscoveryEngine:
         if not new_ids:
             return
         
-        self.discovered_ids.update(new_ids)
-        
-        # Save to file
-        data = {
-            'channel_ids': list(self.discovered_ids),
-            'total_count': len(self.discovered_ids),
-            'last_updated': datetime.now().isoformat(),
-            'last_strategy': strategy,
-            'session_id': self.progress['session_id']
-        }
-        
-        with open(self.discovered_ids_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
-        # Update progress
-        self.progress['total_discovered'] = len(self.discovered_ids)
-        self.progress['last_strategy'] = strategy
-        self.progress['last_updated'] = datetime.now().isoformat()
-        
-        if strategy not in self.progress['strategies_used']:
-            self.progress['strategies_used'].append(strategy)
-        
-        self._save_progress()
+        with self._lock:
+            self.discovered_ids.update(new_ids)
+            
+            # Append only the new IDs to the log
+            discovered_at = datetime.now().isoformat()
+            save_to_ndjson([{'channel_id': channel_id, 'strategy': strategy, 'discovered_at': discovered_at}
+                            for channel_id in new_ids],
+                           str(self.discovered_ids_log), append=True)
+            
+            # Update progress
+            self.progress['total_discovered'] = len(self.discovered_ids)
+            self.progress['last_strategy'] = strategy
+            self.progress['last_updated'] = datetime.now().isoformat()
+            
+            if strategy not in self.progress['strategies_used']:
+                self.progress['strategies_used'].append(strategy)
+            
+            self._save_progress()
+            total = len(self.discovered_ids)
         
-        logger.info(f"💾 Saved {len(new_ids)} new IDs from {strategy}. Total: {len(self.discovered_ids)}")
+        logger.info(f"💾 Saved {len(new_ids)} new IDs from {strategy}. Total: {total}")
     
     def save_validated_channels(self, new_channels: List[Dict]):
         """Save newly validated channels"""
         if not new_channels:
             return
         
-        self.validated_channels.extend(new_channels)
+        with self._lock:
+            self.validated_channels.extend(new_channels)
+            self.validated_ids.update(channel['channel_id'] for channel in new_channels)
+            
+            # Append only the new channels to the log
+            save_to_ndjson(new_channels, str(self.validated_channels_log), append=True)
+            
+            # Update progress
+            self.progress['total_validated'] = len(self.validated_channels)
+            self.progress['last_updated'] = datetime.now().isoformat()
+            
+            self._save_progress()
+            total = len(self.validated_channels)
         
-        # Save to file
-        data = {
+        logger.info(f"💾 Saved {len(new_channels)} validated channels. Total: {total}")
+    
+    def finalize(self):
+        """Export the discovered IDs and validated channels as whole JSON files and
+        rewrite the compact in-session state files indented (end of session)"""
+        last_updated = datetime.now().isoformat()
+        
+        if not self.history_loaded:
+            # The append-only logs still hold everything; keep the previous exports
+            logger.warning("⚠️ Discovery history could not be fully loaded; keeping the existing "
+                           "ID and channel exports")
+            write_json(self.strategy_stats_file, self.strategies)
+            write_json(self.progress_file, self.progress)
+            return
+        
+        write_json(self.discovered_ids_file, {
+            'channel_ids': list(self.discovered_ids),
+            'total_count': len(self.discovered_ids),
+            'last_updated': last_updated,
+            'last_strategy': self.progress['last_strategy'],
+            'session_id': self.progress['session_id']
+        })
+        
+        write_json(self.validated_channels_file, {
             'channels': self.validated_channels,
             'total_count': len(self.validated_channels),
-            'last_updated': datetime.now().isoformat(),
+            'last_updated': last_updated,
             'session_id': self.progress['session_id']
-        }
-        
-        with open(self.validated_channels_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        })
         
-        # Update progress
-        self.progress['total_validated'] = len(self.validated_channels)
-        self.progress['last_updated'] = datetime.now().isoformat()
+        write_json(self.strategy_stats_file, self.strategies)
+        write_json(self.progress_file, self.progress)
         
-        self._save_progress()
-        
-        logger.info(f"💾 Saved {len(new_channels)} validated channels. Total: {len(self.validated_channels)}")
+        logger.info(f"💾 Exported {len(self.discovered_ids)} discovered IDs and "
+                    f"{len(self.validated_channels)} validated channels")
     
     def update_strategy_performance(self, strategy: str, channels_found: int, api_calls: int):
         """Update strategy performance metrics"""
@@ -199,60 +460,61 @@ class UnlimitedDiscoveryEngine:
         # Calculate success rate
         success_rate = channels_found / max(api_calls, 1)
         
-        # Update strategy stats
-        self.strategies[strategy]['success_rate'] = success_rate
-        self.strategies[strategy]['last_used'] = datetime.now().isoformat()
-        self.strategies[strategy]['weight'] = min(2.0, max(0.1, success_rate * 2))
-        
-        # Save strategy stats
-        with open(self.strategy_stats_file, 'w', encoding='utf-8') as f:
-            json.dump(self.strategies, f, indent=2, ensure_ascii=False)
+        # Update strategy stats; channels found count as successes and empty calls as failures,
+        # on top of discounted earlier evidence
+        with self._lock:
+            stats = self.strategies[strategy]
+            stats['success_rate'] = success_rate
+            stats['last_used'] = datetime.now().isoformat()
+            stats['pulls'] = stats.get('pulls', 0) + 1
+            stats['alpha'] = 1.0 + TS_DISCOUNT * (stats.get('alpha', 1.0) - 1.0) + channels_found
+            stats['beta'] = 1.0 + TS_DISCOUNT * (stats.get('beta', 1.0) - 1.0) + max(api_calls - channels_found, 0)
+            
+            # Save strategy stats
+            write_json(self.strategy_stats_file, self.strategies, pretty=False)
         
-        logger.info(f"📊 Updated {strategy}: success_rate={success_rate:.3f}, weight={self.strategies[strategy]['weight']:.2f}")
+        logger.info(f"📊 Updated {strategy}: success_rate={success_rate:.3f}, pulls={stats['pulls']}")
     
     def _save_progress(self):
         """Save progress to file"""
-        with open(self.progress_file, 'w', encoding='utf-8') as f:
-            json.dump(self.progress, f, indent=2, ensure_ascii=False)
+        write_json(self.progress_file, self.progress, pretty=False)
     
     def get_next_strategy(self) -> str:
-        """Get next strategy based on performance and rotation"""
-        # Weight strategies by performance and recency
-        strategy_scores = {}
-        current_time = datetime.now()
-        
-        for strategy, stats in self.strategies.items():
-            # Base score from success rate and weight
-            base_score = stats['weight']
-            
-            # Recency bonus (prefer strategies not used recently)
-            if stats['last_used']:
-                last_used = datetime.fromisoformat(stats['last_used'])
-                hours_since = (current_time - last_used).total_seconds() / 3600
-                recency_bonus = min(1.0, hours_since / 24)  # Full bonus after 24 hours
-            else:
-                recency_bonus = 1.0  # Never used
-            
-            strategy_scores[strategy] = base_score * (1 + recency_bonus)
+        """Get next strategy by Thompson sampling from each strategy's Beta posterior"""
+        return self.get_next_strategies(1)[0]
+    
+    def get_next_strategies(self, count: int) -> List[str]:
+        """Get up to count distinct strategies, ranked by Thompson samples"""
+        # Every strategy is tried once before any is exploited
+        untried = [strategy for strategy in IMPLEMENTED_STRATEGIES if not self.strategies[strategy].get('pulls')]
+        
+        strategy_scores = {
+            strategy: random.betavariate(self.strategies[strategy].get('alpha', 1.0),
+                                         self.strategies[strategy].get('beta', 1.0))
+            for strategy in IMPLEMENTED_STRATEGIES if strategy not in untried
+        }
         
-        # Select strategy with highest score
-        best_strategy = max(strategy_scores.items(), key=lambda x: x[1])[0]
+        # Untried strategies first, then the highest sampled scores
+        selected = (untried + sorted(strategy_scores, key=strategy_scores.get, reverse=True))[:count]
         
         if self.debug_mode:
-            logger.info(f"🎯 Selected strategy: {best_strategy} (score: {strategy_scores[best_strategy]:.2f})")
+            for strategy in selected:
+                if strategy in strategy_scores:
+                    logger.info(f"🎯 Selected strategy: {strategy} (sample: {strategy_scores[strategy]:.2f})")
+                else:
+                    logger.info(f"🎯 Selected strategy: {strategy} (not tried yet)")
         
-        return best_strategy
+        return selected
     
     def get_unvalidated_ids(self) -> List[str]:
         """Get channel IDs that haven't been validated yet"""
-        validated_ids = {ch['channel_id'] for ch in self.validated_channels}
-        unvalidated = self.discovered_ids - validated_ids
-        return list(unvalidated)
+        return list(self.discovered_ids - self.validated_ids)
 
 class UnlimitedChannelDiscovery:
     """Main unlimited discovery system"""
     
-    def __init__(self, output_dir: str = None, debug_mode: bool = False, target_total: int = 10000):
+    def __init__(self, output_dir: str = None, debug_mode: bool = False, target_total: int = 10000,
+                 cache_ttl_hours: float = DEFAULT_CACHE_TTL_HOURS, parallel_strategies: int = 1):
         # Validate API key
         if not validate_api_key():
             raise ValueError("Invalid or missing YouTube API key. Please check your .env file.")
@@ -264,6 +526,7 @@ class UnlimitedChannelDiscovery:
         
         self.debug_mode = debug_mode
         self.target_total = target_total
+        self.parallel_strategies = max(1, min(parallel_strategies, len(IMPLEMENTED_STRATEGIES)))
         
         # Setup directories
         if output_dir is None:
@@ -275,10 +538,26 @@ class UnlimitedChannelDiscovery:
         # Initialize discovery engine
         self.engine = UnlimitedDiscoveryEngine(self.output_dir, debug_mode)
         
+        # Search response cache shared across sessions
+        self.search_cache = None
+        if cache_ttl_hours > 0:
+            try:
+                self.search_cache = SearchResponseCache(self.output_dir / "search_cache.sqlite", cache_ttl_hours)
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ Search cache unavailable, searching without it: {e}")
+        
         # Load existing channels from main file
         self.channels_file = self.output_dir / "discovered_channels.json"
+        # Channels validated this session are appended here and merged into channels_file at session end
+        self.pending_channels_file = self.output_dir / "discovered_channels.pending.jsonl"
+        # Merge anything left behind by a session that did not finish
+        self._compact_channels_file()
         self.existing_channels = self._load_existing_channels()
         
+        # Every channel ID already known, so discovery checks one set instead of two
+        self._all_seen = self.existing_channels | self.engine.discovered_ids
+        self._seen_lock = threading.Lock()
+        
         # Statistics
         self.session_stats = {
             'session_start': datetime.now().isoformat(),
@@ -288,6 +567,18 @@ class UnlimitedChannelDiscovery:
             'strategies_attempted': [],
             'quota_exhausted': False
         }
+        self._stats_lock = threading.Lock()
+        # Set by the first validation worker that runs out of quota so the others stop early
+        self._quota_exhausted = threading.Event()
+        
+        # Discovery hands new IDs to the background validator through this queue
+        self._validation_queue = queue.Queue()
+        self._discovery_done = threading.Event()
+        
+        # Set when an API call was throttled, so the next round backs off
+        self._rate_limited = threading.Event()
+        # Set once the session's quota is gone; wakes the discovery loop out of its pauses
+        self._session_stopped = threading.Event()
         
         logger.info(f"🚀 Unlimited Discovery System initialized")
         logger.info(f"📊 Current status: {len(self.engine.discovered_ids)} discovered, {len(self.engine.validated_channels)} validated")
@@ -300,8 +591,7 @@ class UnlimitedChannelDiscovery:
             return set()
         
         try:
-            with open(self.channels_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = read_json(self.channels_file)
             
             existing_ids = set()
             for category, channels in data.items():
@@ -317,27 +607,35 @@ class UnlimitedChannelDiscovery:
             logger.error(f"❌ Error loading existing channels: {e}")
             return set()
     
-    def _make_api_request(self, request_func, quota_cost: int = 1, **kwargs):
-        """Make API request with robust error handling and proper key rotation"""
+    def _mark_quota_exhausted(self):
+        """Record that the quota is exhausted and stop the session loop"""
+        self.session_stats['quota_exhausted'] = True
+        self._session_stopped.set()
+    
+    def _make_api_request(self, resource: str, quota_cost: int = 1, **kwargs):
+        """Make a <resource>.list API request with robust error handling and proper key rotation"""
         max_retries = 3
         
         for attempt in range(max_retries):
             try:
-                # Always build fresh request with current service
-                request = request_func(**kwargs)
-                result = self.api_client._make_request(request, quota_cost)
+                # Built on client.service each time, so a benched key is swapped for the next one
+                result = self.api_client.execute(
+                    lambda service: getattr(service, resource)().list(**kwargs), quota_cost)
                 
                 if result is None:
                     raise Exception("API request returned None - likely quota exhausted")
                 
-                self.session_stats['api_calls_made'] += 1
+                with self._stats_lock:
+                    self.session_stats['api_calls_made'] += 1
                 return result
                 
             except Exception as e:
                 error_msg = str(e)
+                if "quotaExceeded" in error_msg or "rateLimitExceeded" in error_msg:
+                    self._rate_limited.set()
                 
                 if "All API keys exhausted" in error_msg:
-                    self.session_stats['quota_exhausted'] = True
+                    self._mark_quota_exhausted()
                     logger.warning("⚠️ All API keys exhausted")
                     raise
                 elif "quotaExceeded" in error_msg and attempt < max_retries - 1:
@@ -345,7 +643,7 @@ class UnlimitedChannelDiscovery:
                     logger.info(f"Quota exceeded, retrying with rotated key (attempt {attempt + 1})")
                     continue
                 elif "API request returned None" in error_msg:
-                    self.session_stats['quota_exhausted'] = True
+                    self._mark_quota_exhausted()
                     logger.warning("⚠️ API quota exhausted")
                     raise
                 else:
@@ -355,9 +653,70 @@ class UnlimitedChannelDiscovery:
                     raise
         
         # If we get here, all retries failed
-        self.session_stats['quota_exhausted'] = True
+        self._mark_quota_exhausted()
         raise Exception("API request failed after all retries")
     
+    def _search_channel_ids(self, query: str, search_type: str = 'channel', **params) -> Set[str]:
+        """Run one LK search query and return the channel IDs it surfaced"""
+        request_params = dict(part='snippet', q=query, type=search_type,
+                              regionCode='LK', order='relevance', **params)
+        
+        cache_key = None
+        response = None
+        if self.search_cache is not None:
+            cache_key = SearchResponseCache.make_key(endpoint='search', **request_params)
+            response = self.search_cache.get(cache_key)
+        
+        if response is None:
+            response = self._make_api_request(
+                'search',
+                quota_cost=100,
+                **request_params
+            )
+            if cache_key is not None:
+                self.search_cache.put(cache_key, response)
+        
+        if search_type == 'channel':
+            return {item['id']['channelId'].strip() for item in response.get('items', [])
+                    if item['id']['kind'] == 'youtube#channel'}
+        return {item['snippet']['channelId'] for item in response.get('items', [])}
+    
+    def _run_search_queries(self, queries: List[str], max_results: int, label: str,
+                            **params) -> Tuple[Set[str], int]:
+        """Run search queries concurrently; returns new channel IDs and the API calls made"""
+        new_channel_ids = set()
+        api_calls = 0
+        
+        executor = ThreadPoolExecutor(max_workers=SEARCH_WORKERS)
+        futures = {executor.submit(self._search_channel_ids, query, **params): query for query in queries}
+        try:
+            for future in as_completed(futures):
+                query = futures[future]
+                try:
+                    channel_ids = future.result()
+                except Exception as e:
+                    if is_quota_error(e):
+                        break
+                    logger.error(f"Error with {label} '{query}': {e}")
+                    continue
+                
+                api_calls += 1
+                with self._seen_lock:
+                    for channel_id in channel_ids:
+                        if channel_id not in self._all_seen:
+                            new_channel_ids.add(channel_id)
+                            self._all_seen.add(channel_id)
+                
+                if len(new_channel_ids) >= max_results:
+                    break
+        finally:
+            # Queries that have not started yet are dropped once we stop early
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+        
+        return new_channel_ids, api_calls
+    
     def discover_keyword_search(self, max_results: int = 500) -> Set[str]:
         """Basic keyword search discovery"""
         logger.info("🔍 Running keyword search discovery...")
@@ -376,40 +735,8 @@ class UnlimitedChannelDiscovery:
             
         ]
         
-        new_channel_ids = set()
-        api_calls = 0
-        
-        for keyword in keywords:
-            if len(new_channel_ids) >= max_results:
-                break
-            
-            try:
-                response = self._make_api_request(
-                    self.api_client.service.search().list,
-                    quota_cost=100,
-                    part='snippet',
-                    q=keyword,
-                    type='channel',
-                    regionCode='LK',
-                    maxResults=50,
-                    order='relevance'
-                )
-                api_calls += 1
-                
-                for item in response.get('items', []):
-                    if item['id']['kind'] == 'youtube#channel':
-                        channel_id = item['id']['channelId'].strip()
-                        if (channel_id not in self.existing_channels and 
-                            channel_id not in self.engine.discovered_ids):
-                            new_channel_ids.add(channel_id)
-                
-                time.sleep(random.uniform(0.3, 0.7))
-                
-            except Exception as e:
-                if "quotaExceeded" in str(e) or "All API keys exhausted" in str(e):
-                    break
-                logger.error(f"Error with keyword '{keyword}': {e}")
-                continue
+        new_channel_ids, api_calls = self._run_search_queries(
+            keywords, max_results, 'keyword', maxResults=50)
         
         # Save and update performance
         if new_channel_ids:
@@ -424,67 +751,11 @@ class UnlimitedChannelDiscovery:
         """Long-tail keyword discovery"""
         logger.info("🔍 Running long-tail keyword discovery...")
         
-        # Generate long-tail combinations
-        base_terms = ["sri lanka", "srilanka", "lanka", "sinhala", "tamil"]
-        locations = ["colombo", "kandy", "galle", "jaffna", "negombo", "matara"]
-        topics = ["vlog", "travel", "food", "news", "music", "comedy", "wedding", "festival"]
-        modifiers = ["2024", "2025", "latest", "new", "best", "top", "amazing"]
-        
-        long_tail_keywords = []
-        for base in base_terms[:2]:
-            for location in locations[:3]:
-                for topic in topics[:4]:
-                    long_tail_keywords.extend([
-                        f"{base} {location} {topic}",
-                        f"{location} {base} {topic}",
-                        f"best {base} {topic}",
-                        f"latest {location} {topic}"
-                    ])
-        
-        # Add modifiers
-        for modifier in modifiers[:3]:
-            for base in base_terms[:2]:
-                for topic in topics[:3]:
-                    long_tail_keywords.append(f"{modifier} {base} {topic}")
-        
-        # Remove duplicates and shuffle
-        long_tail_keywords = list(set(long_tail_keywords))
-        random.shuffle(long_tail_keywords)
+        # A random 50 of the precomputed combinations, to prevent excessive usage
+        long_tail_keywords = random.sample(LONG_TAIL_KEYWORDS, min(50, len(LONG_TAIL_KEYWORDS)))
         
-        new_channel_ids = set()
-        api_calls = 0
-        
-        for keyword in long_tail_keywords[:50]:  # Limit to prevent excessive usage
-            if len(new_channel_ids) >= max_results:
-                break
-            
-            try:
-                response = self._make_api_request(
-                    self.api_client.service.search().list,
-                    quota_cost=100,
-                    part='snippet',
-                    q=keyword,
-                    type='channel',
-                    regionCode='LK',
-                    maxResults=25,
-                    order='relevance'
-                )
-                api_calls += 1
-                
-                for item in response.get('items', []):
-                    if item['id']['kind'] == 'youtube#channel':
-                        channel_id = item['id']['channelId'].strip()
-                        if (channel_id not in self.existing_channels and 
-                            channel_id not in self.engine.discovered_ids):
-                            new_channel_ids.add(channel_id)
-                
-                time.sleep(random.uniform(0.4, 0.8))
-                
-            except Exception as e:
-                if "quotaExceeded" in str(e) or "All API keys exhausted" in str(e):
-                    break
-                logger.error(f"Error with long-tail keyword '{keyword}': {e}")
-                continue
+        new_channel_ids, api_calls = self._run_search_queries(
+            long_tail_keywords, max_results, 'long-tail keyword', maxResults=25)
         
         # Save and update performance
         if new_channel_ids:
@@ -509,40 +780,11 @@ class UnlimitedChannelDiscovery:
             "#SinhalaMusic", "#TamilMusic", "#LankanComedy", "#SriLankanDrama"
         ]
         
-        new_channel_ids = set()
-        api_calls = 0
-        
-        for hashtag in trending_hashtags:
-            if len(new_channel_ids) >= max_results:
-                break
-            
-            try:
-                response = self._make_api_request(
-                    self.api_client.service.search().list,
-                    quota_cost=100,
-                    part='snippet',
-                    q=hashtag,
-                    type='video',
-                    regionCode='LK',
-                    publishedAfter=(datetime.now() - timedelta(days=30)).isoformat() + 'Z',
-                    maxResults=30,
-                    order='relevance'
-                )
-                api_calls += 1
-                
-                for item in response.get('items', []):
-                    channel_id = item['snippet']['channelId']
-                    if (channel_id not in self.existing_channels and 
-                        channel_id not in self.engine.discovered_ids):
-                        new_channel_ids.add(channel_id)
-                
-                time.sleep(random.uniform(0.3, 0.6))
-                
-            except Exception as e:
-                if "quotaExceeded" in str(e) or "All API keys exhausted" in str(e):
-                    break
-                logger.error(f"Error with hashtag '{hashtag}': {e}")
-                continue
+        # Rounded to the day so repeated searches share a response cache key
+        published_after = (date.today() - timedelta(days=30)).isoformat() + 'T00:00:00Z'
+        new_channel_ids, api_calls = self._run_search_queries(
+            trending_hashtags, max_results, 'hashtag',
+            search_type='video', publishedAfter=published_after, maxResults=30)
         
         # Save and update performance
         if new_channel_ids:
@@ -562,7 +804,7 @@ class UnlimitedChannelDiscovery:
         
         try:
             response = self._make_api_request(
-                self.api_client.service.videos().list,
+                'videos',
                 quota_cost=1,
                 part='snippet',
                 chart='mostPopular',
@@ -571,14 +813,15 @@ class UnlimitedChannelDiscovery:
             )
             api_calls += 1
             
-            for item in response.get('items', []):
-                channel_id = item['snippet']['channelId']
-                if (channel_id not in self.existing_channels and 
-                    channel_id not in self.engine.discovered_ids):
-                    new_channel_ids.add(channel_id)
+            with self._seen_lock:
+                for item in response.get('items', []):
+                    channel_id = item['snippet']['channelId']
+                    if channel_id not in self._all_seen:
+                        new_channel_ids.add(channel_id)
+                        self._all_seen.add(channel_id)
             
         except Exception as e:
-            if not ("quotaExceeded" in str(e) or "All API keys exhausted" in str(e)):
+            if not is_quota_error(e):
                 logger.error(f"Error in popular videos discovery: {e}")
         
         # Save and update performance
@@ -591,256 +834,316 @@ class UnlimitedChannelDiscovery:
         return new_channel_ids
     
     def validate_channels_batch(self, channel_ids: List[str], batch_size: int = 50) -> List[Dict]:
-        """Validate channels in batches"""
-        logger.info(f"🔍 Validating {len(channel_ids)} channels...")
+        """Validate channels in batches, several batches at a time"""
+        logger.info("🔍 Validating %d channels...", len(channel_ids))
         
-        all_validated = []
+        self._quota_exhausted.clear()
         
-        for i in range(0, len(channel_ids), batch_size):
-            batch_ids = channel_ids[i:i + batch_size]
-            
-            try:
-                response = self._make_api_request(
-                    self.api_client.service.channels().list,
-                    quota_cost=1,
-                    part='snippet,statistics,brandingSettings',
-                    id=','.join(batch_ids),
-                    maxResults=50
-                )
-                
-                batch_validated = []
-                for item in response.get('items', []):
-                    snippet = item.get('snippet', {})
-                    statistics = item.get('statistics', {})
-                    branding = item.get('brandingSettings', {}).get('channel', {})
-                    
-                    channel_data = {
-                        'channel_id': item['id'],
-                        'title': snippet.get('title', ''),
-                        'description': snippet.get('description', ''),
-                        'subscriber_count': int(statistics.get('subscriberCount', 0)),
-                        'video_count': int(statistics.get('videoCount', 0)),
-                        'view_count': int(statistics.get('viewCount', 0)),
-                        'published_at': snippet.get('publishedAt', ''),
-                        'country': snippet.get('country', ''),
-                        'custom_url': snippet.get('customUrl', ''),
-                        'defaultLanguage': snippet.get('defaultLanguage', ''),
-                        'keywords': branding.get('keywords', '').split(',') if branding.get('keywords') else [],
-                        'thumbnail_url': snippet.get('thumbnails', {}).get('medium', {}).get('url', ''),
-                        'discovered_at': datetime.now().isoformat(),
-                        'sri_lankan_score': self._calculate_sri_lankan_score({
-                            'title': snippet.get('title', ''),
-                            'description': snippet.get('description', ''),
-                            'country': snippet.get('country', ''),
-                            'keywords': branding.get('keywords', '').split(',') if branding.get('keywords') else []
-                        })
-                    }
-                    
-                    # Only keep channels with good Sri Lankan score
-                    if channel_data['sri_lankan_score'] >= 1.0:
-                        batch_validated.append(channel_data)
-                
-                # Save batch immediately
-                if batch_validated:
-                    self.engine.save_validated_channels(batch_validated)
-                    all_validated.extend(batch_validated)
-                    logger.info(f"✅ Validated batch {i//batch_size + 1}: {len(batch_validated)} Sri Lankan channels")
-                
-                time.sleep(random.uniform(0.1, 0.3))
-                
-            except Exception as e:
-                if "quotaExceeded" in str(e) or "All API keys exhausted" in str(e):
-                    logger.warning(f"⚠️ Quota exhausted during validation at batch {i//batch_size + 1}")
-                    break
-                else:
-                    logger.error(f"❌ Error validating batch {i//batch_size + 1}: {e}")
-                    continue
+        all_validated = []
+        with ThreadPoolExecutor(max_workers=VALIDATION_WORKERS) as executor:
+            batches = chunked(channel_ids, min(batch_size, 50))
+            for batch_validated in executor.map(self._validate_one_batch, batches, itertools.count(1)):
+                all_validated.extend(batch_validated)
         
         return all_validated
     
+    def _validate_one_batch(self, batch_ids: List[str], batch_number: int = 1) -> List[Dict]:
+        """Validate one batch of up to 50 channel IDs and save the Sri Lankan ones"""
+        if self._quota_exhausted.is_set():
+            return []
+        
+        try:
+            response = self._make_api_request(
+                'channels',
+                quota_cost=1,
+                part='snippet,statistics,brandingSettings',
+                id=','.join(batch_ids),
+                maxResults=50
+            )
+        except Exception as e:
+            if is_quota_error(e):
+                if not self._quota_exhausted.is_set():
+                    self._quota_exhausted.set()
+                    logger.warning(f"⚠️ Quota exhausted during validation at batch {batch_number}")
+            else:
+                logger.error(f"❌ Error validating batch {batch_number}: {e}")
+            return []
+        
+        batch_validated = []
+        discovered_at = datetime.now().isoformat()
+        for item in response.get('items', []):
+            snippet = item.get('snippet', {})
+            title = snippet.get('title', '')
+            description = snippet.get('description', '')
+            country = snippet.get('country', '')
+            raw_keywords = item.get('brandingSettings', {}).get('channel', {}).get('keywords')
+            keywords = raw_keywords.split(',') if raw_keywords else []
+            
+            # Score first so channels that will be dropped never get a full record
+            sri_lankan_score = self._calculate_sri_lankan_score({
+                'title': title,
+                'description': description,
+                'country': country,
+                'keywords': keywords
+            })
+            
+            # Only keep channels with good Sri Lankan score
+            if sri_lankan_score < 1.0:
+                continue
+            
+            statistics = item.get('statistics', {})
+            batch_validated.append({
+                'channel_id': item['id'],
+                'title': title,
+                'description': description,
+                'subscriber_count': int(statistics.get('subscriberCount', 0)),
+                'video_count': int(statistics.get('videoCount', 0)),
+                'view_count': int(statistics.get('viewCount', 0)),
+                'published_at': snippet.get('publishedAt', ''),
+                'country': country,
+                'custom_url': snippet.get('customUrl', ''),
+                'defaultLanguage': snippet.get('defaultLanguage', ''),
+                'keywords': keywords,
+                'thumbnail_url': snippet.get('thumbnails', {}).get('medium', {}).get('url', ''),
+                'discovered_at': discovered_at,
+                'sri_lankan_score': sri_lankan_score
+            })
+        
+        # Save batch immediately
+        if batch_validated:
+            self.engine.save_validated_channels(batch_validated)
+            logger.info("✅ Validated batch %d: %d Sri Lankan channels", batch_number, len(batch_validated))
+        
+        return batch_validated
+    
     def _calculate_sri_lankan_score(self, channel_data: Dict) -> float:
         """Calculate Sri Lankan relevance score"""
         score = 0.0
         
-        # Combine text fields for analysis
-        text_fields = [
-            channel_data.get('title', '').lower(),
-            channel_data.get('description', '').lower(),
-            ' '.join(channel_data.get('keywords', [])).lower(),
-            channel_data.get('country', '').lower()
-        ]
-        
-        combined_text = ' '.join(text_fields)
-        
-        # High-value indicators
-        high_value = ['sri lanka', 'srilanka', 'ceylon', 'lanka']
-        for indicator in high_value:
-            if indicator in combined_text:
-                score += 3.0
-        
-        # Medium-value indicators
-        medium_value = ['colombo', 'kandy', 'galle', 'jaffna', 'sinhala', 'tamil']
-        for indicator in medium_value:
-            if indicator in combined_text:
-                score += 2.0
-        
-        # Cultural indicators
-        cultural = ['lankan', 'ape', 'mage', 'machang', 'aiya', 'nangi']
-        for indicator in cultural:
-            if indicator in combined_text:
-                score += 1.5
-        
-        # Country code bonus
-        if channel_data.get('country', '').upper() == 'LK':
+        # Country code bonus; the code is ISO 3166 ("LK"), so it is compared rather than scanned
+        if (channel_data.get('country') or '').upper() == 'LK':
             score += 5.0
         
+        # Scan each field in place; matches keep their original case, so only they are lowercased
+        found = set()
+        for field in (channel_data.get('title', ''), channel_data.get('description', ''),
+                      *channel_data.get('keywords', [])):
+            found.update(SRI_LANKAN_INDICATOR_PATTERN.findall(field))
+        found = {indicator.lower() for indicator in found}
+        for indicator in list(found):
+            found |= SRI_LANKAN_IMPLIED_INDICATORS[indicator]
+        score += sum(SRI_LANKAN_INDICATORS[indicator] for indicator in found)
+        
         return score
     
     def finalize_channels(self, validated_channels: List[Dict]):
-        """Add validated channels to main channels file"""
+        """Queue validated channels for the main channels file (merged by _compact_channels_file)"""
         if not validated_channels:
             return
         
-        # Load existing data
-        if self.channels_file.exists():
-            with open(self.channels_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        else:
-            data = {}
-        
-        # Add new channels by category
-        for channel in validated_channels:
-            category = self._categorize_channel(channel)
-            if category not in data:
-                data[category] = {}
-            
-            data[category][channel['title']] = channel['channel_id']
-        
-        # Save updated data
-        with open(self.channels_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Append only the new channels; rewriting the whole database per batch grows with its size
+        save_to_ndjson([{'category': self._categorize_channel(channel),
+                         'title': channel['title'],
+                         'channel_id': channel['channel_id']}
+                        for channel in validated_channels],
+                       str(self.pending_channels_file), append=True)
         
         logger.info(f"🎉 Added {len(validated_channels)} new channels to main database")
     
+    def _compact_channels_file(self):
+        """Merge the pending channels log into the main channels file and remove it"""
+        if not self.pending_channels_file.exists():
+            return
+        
+        try:
+            pending = read_ndjson_log(self.pending_channels_file)
+            
+            # Load existing data
+            if self.channels_file.exists():
+                data = read_json(self.channels_file)
+            else:
+                data = {}
+            
+            # Add new channels by category
+            for channel in pending:
+                data.setdefault(channel['category'], {})[channel['title']] = channel['channel_id']
+            
+            # Save updated data
+            write_json(self.channels_file, data)
+            self.pending_channels_file.unlink()
+            
+            logger.info(f"💾 Merged {len(pending)} channels into {self.channels_file.name}")
+            
+        except Exception as e:
+            logger.error(f"❌ Error merging pending channels (kept in {self.pending_channels_file.name}): {e}")
+    
     def _categorize_channel(self, channel_data: Dict) -> str:
         """Simple channel categorization"""
-        text_content = ' '.join([
-            channel_data.get('title', '').lower(),
-            channel_data.get('description', '').lower(),
-            ' '.join(channel_data.get('keywords', [])).lower()
-        ])
-        
-        # Simple category mapping
-        if any(word in text_content for word in ['news', 'politics', 'breaking', 'current']):
-            return "News & Politics"
-        elif any(word in text_content for word in ['music', 'song', 'singer', 'band']):
-            return "Music"
-        elif any(word in text_content for word in ['comedy', 'funny', 'entertainment', 'drama']):
-            return "Entertainment"
-        elif any(word in text_content for word in ['education', 'tutorial', 'learn', 'teach']):
-            return "Education"
-        elif any(word in text_content for word in ['sports', 'cricket', 'football', 'game']):
-            return "Sports"
-        elif any(word in text_content for word in ['travel', 'tour', 'visit', 'trip']):
-            return "Travel & Events"
-        else:
-            return "People & Blogs"
+        # Scan each field in place, short title first; only the matched keywords are lowercased
+        best = len(CATEGORY_KEYWORDS)
+        for field in (channel_data.get('title', ''), channel_data.get('description', ''),
+                      *channel_data.get('keywords', [])):
+            for keyword in CATEGORY_PATTERN.findall(field):
+                best = min(best, CATEGORY_PRIORITY[keyword.lower()])
+            
+            # Nothing outranks the top category, so the remaining fields need not be scanned
+            if best == 0:
+                break
+        
+        # Highest-priority category with any keyword in the text
+        if best == len(CATEGORY_KEYWORDS):
+            return DEFAULT_CATEGORY
+        return CATEGORY_KEYWORDS[best][0]
+    
+    def _run_strategy(self, strategy: str) -> Set[str]:
+        """Run one discovery strategy; errors are logged and yield no new IDs"""
+        try:
+            if strategy == 'keyword_search':
+                return self.discover_keyword_search()
+            elif strategy == 'long_tail_keywords':
+                return self.discover_long_tail_keywords()
+            elif strategy == 'trending_hashtags':
+                return self.discover_trending_hashtags()
+            elif strategy == 'popular_videos':
+                return self.discover_popular_videos()
+            else:
+                # For strategies not yet implemented, use keyword search
+                logger.info(f"Strategy {strategy} not implemented yet, using keyword search")
+                return self.discover_keyword_search()
+        except Exception as e:
+            if is_quota_error(e):
+                logger.warning(f"⚠️ Quota exhausted during {strategy}")
+                self._mark_quota_exhausted()
+            else:
+                logger.error(f"❌ Error in {strategy}: {e}")
+            return set()
+    
+    def _validation_worker(self):
+        """Validate queued channel IDs in batches while discovery keeps running"""
+        pending = []
+        first_pending_at = 0.0
+        while True:
+            try:
+                channel_ids = self._validation_queue.get(timeout=1.0)
+                if not pending:
+                    first_pending_at = time.monotonic()
+                pending.extend(channel_ids)
+            except queue.Empty:
+                pass
+            
+            if self.session_stats['quota_exhausted']:
+                return
+            
+            # A partial batch is flushed once it has waited long enough or discovery has stopped
+            discovery_done = self._discovery_done.is_set() and self._validation_queue.empty()
+            while pending and (len(pending) >= VALIDATION_BATCH_SIZE or discovery_done or
+                               time.monotonic() - first_pending_at >= VALIDATION_MAX_WAIT):
+                batch, pending = pending[:VALIDATION_BATCH_SIZE], pending[VALIDATION_BATCH_SIZE:]
+                self._validate_and_finalize(batch)
+                if self.session_stats['quota_exhausted']:
+                    return
+                first_pending_at = time.monotonic()
+            
+            if discovery_done:
+                return
+    
+    def _validate_and_finalize(self, channel_ids: List[str]):
+        """Validate a batch of channel IDs and add the Sri Lankan ones to the main database"""
+        try:
+            validated = self.validate_channels_batch(channel_ids)
+            with self._stats_lock:
+                self.session_stats['new_channels_validated'] += len(validated)
+            
+            # Add to main database
+            if validated:
+                self.finalize_channels(validated)
+            
+        except Exception as e:
+            if is_quota_error(e):
+                logger.warning("⚠️ Quota exhausted during validation")
+                self._mark_quota_exhausted()
+            else:
+                logger.error(f"❌ Error during validation: {e}")
     
     def run_unlimited_discovery(self) -> Dict:
         """Run unlimited continuous discovery"""
         logger.info("🚀 Starting unlimited continuous discovery...")
         
         total_new_discovered = 0
-        total_new_validated = 0
+        
+        # Validation runs in the background so discovery never waits on it
+        self._discovery_done.clear()
+        validator = threading.Thread(target=self._validation_worker, name="channel-validator", daemon=True)
+        validator.start()
+        
+        # IDs left unvalidated by earlier sessions go first
+        unvalidated_ids = self.engine.get_unvalidated_ids()
+        if unvalidated_ids:
+            self._validation_queue.put(unvalidated_ids)
         
         try:
             # Continue discovering until quota exhausted or target reached
-            while (len(self.engine.validated_channels) < self.target_total and 
-                   not self.session_stats['quota_exhausted']):
-                
-                # Get next strategy to use
-                strategy = self.engine.get_next_strategy()
-                self.session_stats['strategies_attempted'].append(strategy)
+            while not self._session_stopped.is_set():
+                # Count once per round; the validator keeps adding channels in the background
+                validated_count = len(self.engine.validated_channels)
+                if validated_count >= self.target_total:
+                    logger.info(f"🎉 Target reached! {validated_count} validated channels")
+                    break
                 
-                logger.info(f"🎯 Using strategy: {strategy}")
-                logger.info(f"📊 Current progress: {len(self.engine.validated_channels)}/{self.target_total} validated channels")
+                # Get next strategies to use
+                strategies = self.engine.get_next_strategies(self.parallel_strategies)
+                self.session_stats['strategies_attempted'].extend(strategies)
                 
-                # Run discovery strategy
-                new_ids = set()
-                try:
-                    if strategy == 'keyword_search':
-                        new_ids = self.discover_keyword_search()
-                    elif strategy == 'long_tail_keywords':
-                        new_ids = self.discover_long_tail_keywords()
-                    elif strategy == 'trending_hashtags':
-                        new_ids = self.discover_trending_hashtags()
-                    elif strategy == 'popular_videos':
-                        new_ids = self.discover_popular_videos()
-                    else:
-                        # For strategies not yet implemented, use keyword search
-                        logger.info(f"Strategy {strategy} not implemented yet, using keyword search")
-                        new_ids = self.discover_keyword_search()
-                    
-                    total_new_discovered += len(new_ids)
-                    
-                except Exception as e:
-                    if "quotaExceeded" in str(e) or "All API keys exhausted" in str(e):
-                        logger.warning(f"⚠️ Quota exhausted during {strategy}")
-                        self.session_stats['quota_exhausted'] = True
-                        break
-                    else:
-                        logger.error(f"❌ Error in {strategy}: {e}")
-                        continue
+                # Lazy %-style arguments so nothing is formatted when INFO is filtered out
+                logger.info("🎯 Using strategy: %s", ', '.join(strategies))
+                logger.info("📊 Current progress: %d/%d validated channels", validated_count, self.target_total)
                 
-                # Validate discovered channels periodically
-                unvalidated_ids = self.engine.get_unvalidated_ids()
-                if len(unvalidated_ids) >= 100:  # Validate in batches of 100
-                    logger.info(f"🔍 Validating {len(unvalidated_ids)} discovered channels...")
-                    try:
-                        validated = self.validate_channels_batch(unvalidated_ids[:100])
-                        total_new_validated += len(validated)
-                        
-                        # Add to main database
-                        if validated:
-                            self.finalize_channels(validated)
-                        
-                    except Exception as e:
-                        if "quotaExceeded" in str(e) or "All API keys exhausted" in str(e):
-                            logger.warning("⚠️ Quota exhausted during validation")
-                            self.session_stats['quota_exhausted'] = True
-                            break
-                        else:
-                            logger.error(f"❌ Error during validation: {e}")
+                # Run discovery strategies
+                if len(strategies) == 1:
+                    new_ids = self._run_strategy(strategies[0])
+                else:
+                    new_ids = set()
+                    with ThreadPoolExecutor(max_workers=len(strategies)) as executor:
+                        for strategy_ids in executor.map(self._run_strategy, strategies):
+                            new_ids |= strategy_ids
                 
-                # Check if we've reached target
-                if len(self.engine.validated_channels) >= self.target_total:
-                    logger.info(f"🎉 Target reached! {len(self.engine.validated_channels)} validated channels")
+                total_new_discovered += len(new_ids)
+                if self._session_stopped.is_set():
                     break
                 
-                # Small delay between strategies
-                time.sleep(random.uniform(1.0, 2.0))
-            
-            # Final validation of any remaining unvalidated channels
-            final_unvalidated = self.engine.get_unvalidated_ids()
-            if final_unvalidated and not self.session_stats['quota_exhausted']:
-                logger.info(f"🔍 Final validation of {len(final_unvalidated)} remaining channels...")
-                try:
-                    final_validated = self.validate_channels_batch(final_unvalidated)
-                    total_new_validated += len(final_validated)
-                    
-                    if final_validated:
-                        self.finalize_channels(final_validated)
-                        
-                except Exception as e:
-                    if not ("quotaExceeded" in str(e) or "All API keys exhausted" in str(e)):
-                        logger.error(f"❌ Error during final validation: {e}")
+                # Hand the new IDs to the validator
+                if new_ids:
+                    self._validation_queue.put(list(new_ids))
+                
+                # Back off between strategies only after throttling; otherwise keep a short polite pause.
+                # Either pause ends at once if the quota runs out meanwhile
+                if self._rate_limited.is_set():
+                    self._rate_limited.clear()
+                    self._session_stopped.wait(random.uniform(2.0, 5.0))
+                else:
+                    self._session_stopped.wait(0.1)
         
         except Exception as e:
             logger.error(f"❌ Unexpected error in unlimited discovery: {e}")
         
+        finally:
+            # Let the validator finish the remaining IDs, then stop it
+            self._discovery_done.set()
+            validator.join()
+        
+        # Export the whole-session JSON files from the append-only logs
+        try:
+            self.engine.finalize()
+        except Exception as e:
+            logger.error(f"❌ Failed to export discovery results: {e}")
+        
+        self._compact_channels_file()
+        
+        if self.search_cache is not None:
+            self.search_cache.close()
+        
         # Update session stats
         self.session_stats['new_channels_discovered'] = total_new_discovered
-        self.session_stats['new_channels_validated'] = total_new_validated
         self.session_stats['session_end'] = datetime.now().isoformat()
         
         return self.session_stats
@@ -852,6 +1155,10 @@ def main():
     parser.add_argument('--output-dir', help='Output directory for discovered channels')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode with detailed logging')
     parser.add_argument('--continuous', action='store_true', help='Run in continuous mode until quota exhausted')
+    parser.add_argument('--parallel-strategies', type=int, default=1,
+                        help='Number of discovery strategies to run concurrently each round (1-4)')
+    parser.add_argument('--cache-ttl-hours', type=float, default=DEFAULT_CACHE_TTL_HOURS,
+                        help='Reuse cached search responses for this many hours (0 disables the cache)')
     
     args = parser.parse_args()
     
@@ -863,7 +1170,9 @@ def main():
         discovery = UnlimitedChannelDiscovery(
             output_dir=args.output_dir,
             debug_mode=args.debug,
-            target_total=args.target
+            target_total=args.target,
+            cache_ttl_hours=args.cache_ttl_hours,
+            parallel_strategies=args.parallel_strategies
         )
         
         # Run unlimited discovery
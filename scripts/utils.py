@@ -5,25 +5,57 @@ Contains helper functions for API interactions, data processing, and common oper
 
 import re
 import time
+import random
 import logging
+import logging.handlers
+import queue
 import pytz
 import os
 import sys
+import threading
+import atexit
+import hashlib
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Set, Tuple
 from isodate import parse_duration
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+import httplib2
 import pandas as pd
 import json
+import csv
+import gzip
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pa_csv = None
+    feather = None
+    pq = None
+
+import config
 from config import (
     YOUTUBE_API_KEY, 
     YOUTUBE_API_KEYS,
     TIMEZONE, 
     COLLECTION_PARAMS,
     LOG_LEVEL,
-    LOG_FILE_PATH
+    LOG_FILE_PATH,
+    DATA_LOGS_PATH,
+    VALIDATION_RULES
 )
 
 # Detect if we're on Windows and console doesn't support Unicode
@@ -70,6 +102,39 @@ class LogSymbols:
         SEARCH = "[SEARCH]"
         PROCESS = "[PROC]"
 
+# Emoji -> safe symbol table for consoles without Unicode. Emoji such as '⚠️' carry a
+# trailing variation selector (U+FE0F), which is dropped so every key is one code point.
+_SAFE_SYMBOL_TABLE = str.maketrans({
+    **{emoji.replace('\ufe0f', ''): symbol for emoji, symbol in {
+        '🚀': LogSymbols.ROCKET,
+        '✅': LogSymbols.SUCCESS,
+        '❌': LogSymbols.ERROR,
+        '⚠️': LogSymbols.WARNING,
+        'ℹ️': LogSymbols.INFO,
+        '⏹️': LogSymbols.STOP,
+        '🧹': LogSymbols.CLEANUP,
+        '🧪': LogSymbols.TEST,
+        '📊': LogSymbols.CHART,
+        '🔍': LogSymbols.SEARCH,
+        '🔄': LogSymbols.PROCESS,
+    }.items()},
+    '\ufe0f': None,
+})
+
+# Background thread that writes queued log records to the real handlers
+_log_listener = None
+
+def _stop_log_listener():
+    """Flush queued log records and close the handlers behind the listener"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+atexit.register(_stop_log_listener)
+
 # Set up logging
 def setup_logging():
     """Set up logging configuration with Windows-safe formatting"""
@@ -79,24 +144,9 @@ def setup_logging():
             # Get the original formatted message
             formatted = super().format(record)
             
-            # If we don't support Unicode, replace common emoji with safe alternatives
+            # If we don't support Unicode, replace common emoji with safe alternatives in one pass
             if not UNICODE_SUPPORT:
-                replacements = {
-                    '🚀': LogSymbols.ROCKET,
-                    '✅': LogSymbols.SUCCESS,
-                    '❌': LogSymbols.ERROR,
-                    '⚠️': LogSymbols.WARNING,
-                    'ℹ️': LogSymbols.INFO,
-                    '⏹️': LogSymbols.STOP,
-                    '🧹': LogSymbols.CLEANUP,
-                    '🧪': LogSymbols.TEST,
-                    '📊': LogSymbols.CHART,
-                    '🔍': LogSymbols.SEARCH,
-                    '🔄': LogSymbols.PROCESS,
-                }
-                
-                for unicode_char, safe_char in replacements.items():
-                    formatted = formatted.replace(unicode_char, safe_char)
+                formatted = formatted.translate(_SAFE_SYMBOL_TABLE)
             
             return formatted
     
@@ -117,10 +167,22 @@ def setup_logging():
     ))
     handlers.append(console_handler)
     
+    # Loggers only enqueue records; a listener thread does the file and console I/O,
+    # so API worker threads never block on disk writes
+    global _log_listener
+    _stop_log_listener()
+    log_queue = queue.Queue(-1)
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers)
+    _log_listener.start()
+    
+    # The queue handler only merges the message arguments; the listener's handlers format the line
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
     # Configure logging
     logging.basicConfig(
         level=getattr(logging, LOG_LEVEL.upper()),
-        handlers=handlers,
+        handlers=[queue_handler],
         force=True  # Override any existing configuration
     )
     
@@ -128,6 +190,99 @@ def setup_logging():
 
 logger = setup_logging()
 
+class TTLCache:
+    """Thread-safe in-memory cache whose entries expire after a per-entry TTL (least recently used evicted first)"""
+    
+    MISSING = object()
+    
+    def __init__(self, max_items: int = 100_000):
+        self.max_items = max_items
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """Cached value for key, or TTLCache.MISSING if absent or expired"""
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return self.MISSING
+            value, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._items[key]
+                return self.MISSING
+            self._items.move_to_end(key)
+            return value
+    
+    def set(self, key, value, ttl: float):
+        """Cache value under key for ttl seconds"""
+        with self._lock:
+            self._items[key] = (value, time.monotonic() + ttl)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+    
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._items.clear()
+
+class TokenBucket:
+    """Adaptive token bucket (AIMD): the refill rate rises additively on success and is cut on throttling"""
+    
+    def __init__(self, rate: float, max_rate: float, capacity: float = 1.0,
+                 increase: float = 0.05, decrease: float = 0.5):
+        self.rate = rate
+        self.min_rate = rate / 4
+        self.max_rate = max(rate, max_rate)
+        self.capacity = capacity
+        self.increase = increase
+        self.decrease = decrease
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> float:
+        """Take one token and return how long the caller must wait for it (0 if one was ready)"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            
+            # Tokens may go negative: that reserves a future slot so concurrent callers queue up in order
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+    
+    def on_success(self):
+        """Additive increase after a successful request"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+    
+    def on_throttle(self):
+        """Multiplicative decrease after a 429 or 5xx response"""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self.tokens = min(self.tokens, 0.0)
+
+# API key health: throttled keys sit out an exponential cooldown (seconds), and
+# quota-exhausted keys sit out until the daily reset at midnight Pacific Time
+KEY_COOLDOWN_BASE = 30
+KEY_COOLDOWN_MAX = 3600
+KEY_COOLDOWN_MAX_WAIT = 300  # Longest wait for a key when every key is cooling down
+QUOTA_RESET_TIMEZONE = 'America/Los_Angeles'
+KEY_STATE_FILE = os.path.join(DATA_LOGS_PATH, 'api_key_state.json')
+
+# Clients alive at exit save their key state once; weak references so finished clients
+# (and their response caches) can still be garbage collected
+_live_clients = weakref.WeakSet()
+_key_state_file_lock = threading.Lock()
+
+def _save_live_key_states():
+    """Persist key state for every client still alive at interpreter exit"""
+    for client in list(_live_clients):
+        client.save_key_state()
+
+atexit.register(_save_live_key_states)
+
 class YouTubeAPIClient:
     """YouTube API client with multi-key rotation, rate limiting and error handling"""
     
@@ -138,22 +293,155 @@ class YouTubeAPIClient:
         
         self.current_key_index = 0
         self.current_key = self.api_keys[0]
-        self.service = None
         self.quota_used = 0
-        self.last_request_time = 0
-        self.key_quotas = {key: 0 for key in self.api_keys}  # Track quota per key
-        self.exhausted_keys = set()  # Track exhausted keys
+        self.key_quotas = {key: 0 for key in self.api_keys}  # Track quota per key (this run)
+        # Per-key usage for the whole quota day, carried across runs in KEY_STATE_FILE
+        self.daily_key_quotas = {key: 0 for key in self.api_keys}
+        # Per-key health: a benched key rejoins the rotation once its cooldown passes
+        self.key_state = {key: {'cooldown_until': 0.0, 'consec_429': 0} for key in self.api_keys}
+        self._key_cursor = -1  # Round-robin position over the available keys
+        
+        # One adaptive rate limiter per key, starting at the configured pace
+        self.rate_limiters = {
+            key: TokenBucket(1 / COLLECTION_PARAMS['rate_limit_delay'],
+                             COLLECTION_PARAMS['max_requests_per_second'])
+            for key in self.api_keys
+        }
+        
+        # Recently fetched channel/video items by (resource, parts, id); see _list_by_ids
+        self.response_cache = TTLCache()
+        
+        # httplib2 is not thread-safe, so each thread keeps its own keep-alive
+        # connection and per-key service objects; the lock guards shared counters
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        
+        self._load_key_state()
+        _live_clients.add(self)
         
         self._initialize_service()
         logger.info(f"Initialized YouTube API client with {len(self.api_keys)} API key(s)")
     
+    @property
+    def exhausted_keys(self) -> set:
+        """Keys currently benched by a cooldown"""
+        now = time.time()
+        return {key for key, state in self.key_state.items() if state['cooldown_until'] > now}
+    
+    @staticmethod
+    def _quota_day() -> str:
+        """Current quota day; YouTube resets quotas at midnight Pacific Time"""
+        return datetime.now(_get_timezone(QUOTA_RESET_TIMEZONE)).strftime('%Y-%m-%d')
+    
+    @staticmethod
+    def _seconds_until_quota_reset() -> float:
+        """Seconds until the next midnight Pacific Time"""
+        now = datetime.now(_get_timezone(QUOTA_RESET_TIMEZONE))
+        midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        return (midnight - now).total_seconds()
+    
+    @staticmethod
+    def _key_fingerprint(key: str) -> str:
+        """Short hash so the state file never stores the key itself"""
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]
+    
+    def _load_key_state(self):
+        """Restore cooldowns and today's per-key quota usage from a previous run"""
+        try:
+            if not os.path.exists(KEY_STATE_FILE):
+                return
+            with open(KEY_STATE_FILE, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            
+            same_day = saved.get('quota_day') == self._quota_day()
+            saved_keys = saved.get('keys', {})
+            for key in self.api_keys:
+                entry = saved_keys.get(self._key_fingerprint(key))
+                if not entry:
+                    continue
+                self.key_state[key]['cooldown_until'] = float(entry.get('cooldown_until', 0.0))
+                self.key_state[key]['consec_429'] = int(entry.get('consec_429', 0))
+                if same_day:
+                    self.daily_key_quotas[key] = int(entry.get('quota_used', 0))
+            logger.debug(f"Loaded API key state from {KEY_STATE_FILE}")
+        except Exception as e:
+            logger.warning(f"Could not load API key state from {KEY_STATE_FILE}: {e}")
+    
+    def save_key_state(self):
+        """Persist key cooldowns and quota usage so a restart on the same day picks them up"""
+        try:
+            with self._lock:
+                state = {
+                    'quota_day': self._quota_day(),
+                    'keys': {
+                        self._key_fingerprint(key): {
+                            'cooldown_until': self.key_state[key]['cooldown_until'],
+                            'consec_429': self.key_state[key]['consec_429'],
+                            'quota_used': self.daily_key_quotas[key]
+                        }
+                        for key in self.api_keys
+                    }
+                }
+            
+            # Worker threads (and other clients) may save at the same time; the module lock
+            # serializes writers in this process and the per-process temp name keeps
+            # concurrent processes from replacing each other's half-written file
+            with _key_state_file_lock:
+                os.makedirs(os.path.dirname(KEY_STATE_FILE), exist_ok=True)
+                tmp_path = f"{KEY_STATE_FILE}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(state, f, indent=2)
+                os.replace(tmp_path, KEY_STATE_FILE)
+        except Exception as e:
+            logger.warning(f"Could not save API key state to {KEY_STATE_FILE}: {e}")
+    
+    @property
+    def service(self):
+        """YouTube API service for the next available key, built once per thread and key
+        
+        Successive requests take turns across every non-exhausted key, so each key's
+        rate limiter paces only its share of the traffic and concurrent workers get
+        the combined throughput of all keys. The chosen key is remembered per thread
+        for _make_request's quota accounting.
+        """
+        key = self._next_key()
+        self._local.key = key
+        return self._service_for(key)
+    
+    def _next_key(self) -> str:
+        """Pick the next non-exhausted key in round-robin order"""
+        with self._lock:
+            exhausted = self.exhausted_keys
+            available = [key for key in self.api_keys if key not in exhausted]
+            if not available:
+                # Everything is cooling down; use the key that recovers first
+                return min(self.api_keys, key=lambda k: self.key_state[k]['cooldown_until'])
+            self._key_cursor = (self._key_cursor + 1) % len(available)
+            return available[self._key_cursor]
+    
+    def _service_for(self, key: str):
+        """Per-thread YouTube API service for the given key"""
+        local = self._local
+        if not hasattr(local, 'services'):
+            # One keep-alive connection shared by every key's service in this thread,
+            # so key rotation does not pay a fresh TLS handshake
+            local.http = httplib2.Http(timeout=30)
+            local.services = {}
+        
+        service = local.services.get(key)
+        if service is None:
+            service = build('youtube', 'v3', developerKey=key,
+                            http=local.http, cache_discovery=False)
+            local.services[key] = service
+        return service
+    
     def _initialize_service(self):
         """Initialize YouTube API service with current key"""
         try:
             if not self.current_key:
                 raise ValueError("Invalid or missing YouTube API key. Please check your .env file.")
             
-            self.service = build('youtube', 'v3', developerKey=self.current_key)
+            self._service_for(self.current_key)
             logger.info(f"YouTube API service initialized with key {self.current_key_index + 1}")
         except Exception as e:
             logger.error(f"Failed to initialize YouTube API service: {e}")
@@ -165,94 +453,150 @@ class YouTubeAPIClient:
             logger.warning("Only one API key available, cannot rotate")
             return False
         
-        # Find next non-exhausted key
-        original_index = self.current_key_index
-        attempts = 0
-        
-        while attempts < len(self.api_keys):
-            self.current_key_index = (self.current_key_index + 1) % len(self.api_keys)
-            next_key = self.api_keys[self.current_key_index]
+        with self._lock:
+            exhausted = self.exhausted_keys
             
-            if next_key not in self.exhausted_keys:
-                self.current_key = next_key
-                self._initialize_service()
-                logger.info(f"Rotated to API key {self.current_key_index + 1}")
+            # Requests take turns across keys, so the benched key is often not current_key;
+            # a usable key is still available as long as current_key is healthy
+            if self.current_key not in exhausted:
                 return True
             
-            attempts += 1
+            # Find next non-exhausted key
+            attempts = 0
+            
+            while attempts < len(self.api_keys):
+                self.current_key_index = (self.current_key_index + 1) % len(self.api_keys)
+                next_key = self.api_keys[self.current_key_index]
+                
+                if next_key not in exhausted:
+                    self.current_key = next_key
+                    self._initialize_service()
+                    logger.info(f"Rotated to API key {self.current_key_index + 1}")
+                    return True
+                
+                attempts += 1
+            
+            # Every key is cooling down; wait for the first one if it recovers soon
+            soonest = min(self.api_keys, key=lambda k: self.key_state[k]['cooldown_until'])
+            wait_time = self.key_state[soonest]['cooldown_until'] - time.time()
+        
+        if wait_time <= KEY_COOLDOWN_MAX_WAIT:
+            logger.warning(f"All API keys cooling down. Waiting {max(wait_time, 0):.0f}s for key {self.api_keys.index(soonest) + 1}...")
+            time.sleep(max(wait_time, 0))
+            with self._lock:
+                self.current_key = soonest
+                self.current_key_index = self.api_keys.index(soonest)
+                self._initialize_service()
+            return True
         
         # All keys exhausted
         logger.error("All API keys have been exhausted")
         return False
     
     def _mark_key_exhausted(self, key: str):
-        """Mark an API key as quota exhausted"""
-        self.exhausted_keys.add(key)
-        logger.warning(f"API key {self.api_keys.index(key) + 1} marked as exhausted")
+        """Bench an API key until its daily quota resets"""
+        with self._lock:
+            self.key_state[key]['cooldown_until'] = time.time() + self._seconds_until_quota_reset()
+        logger.warning(f"API key {self.api_keys.index(key) + 1} marked as exhausted until quota reset")
+        self.save_key_state()
     
-    def _rate_limit(self):
-        """Implement rate limiting between requests"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        min_interval = COLLECTION_PARAMS['rate_limit_delay']
-        
-        if time_since_last < min_interval:
-            sleep_time = min_interval - time_since_last
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+    def _cool_down_key(self, key: str):
+        """Bench a throttled key for an exponentially growing cooldown"""
+        with self._lock:
+            state = self.key_state[key]
+            state['consec_429'] += 1
+            cooldown = min(KEY_COOLDOWN_MAX, KEY_COOLDOWN_BASE * 2 ** state['consec_429'])
+            state['cooldown_until'] = max(state['cooldown_until'], time.time() + cooldown)
+        logger.warning(f"API key {self.api_keys.index(key) + 1} throttled, cooling down for {cooldown:.0f}s")
+        self.save_key_state()
+    
+    def _rate_limit(self, key: str):
+        """Wait for the key's adaptive rate limiter (shared across threads)"""
+        wait_time = self.rate_limiters[key].acquire()
+        if wait_time > 0:
+            time.sleep(wait_time)
+    
+    @staticmethod
+    def _backoff_delay(error: HttpError, attempt: int, retry_delay: float) -> float:
+        """Retry-After when the server sends one, otherwise exponential backoff with full jitter"""
+        retry_after = error.resp.get('retry-after') if error.resp is not None else None
+        if retry_after and str(retry_after).isdigit():
+            return float(retry_after)
+        return random.uniform(0, retry_delay * (2 ** attempt))
     
     def _make_request(self, request, quota_cost: int = 1):
-        """Make API request with error handling, retry logic, and key rotation"""
+        """Make API request with error handling, retry logic, and key rotation
+        
+        A request stays bound to the key it was built with. When that key runs out of
+        quota or is rejected, it is benched and None is returned while other keys remain,
+        so the caller can rebuild the request on client.service (see execute()).
+        """
         max_retries = COLLECTION_PARAMS['max_retries']
         retry_delay = COLLECTION_PARAMS['retry_delay']
         
+        # The key the request was built with; it stays bound to that key across retries
+        key = getattr(self._local, 'key', self.current_key)
+        key_number = self.api_keys.index(key) + 1
+        
         for attempt in range(max_retries):
             try:
-                self._rate_limit()
+                self._rate_limit(key)
                 response = request.execute()
+                self.rate_limiters[key].on_success()
                 
-                # Update quota tracking
-                self.quota_used += quota_cost
-                self.key_quotas[self.current_key] += quota_cost
+                # Update quota tracking; a healthy response decays the key's throttle count
+                with self._lock:
+                    self.quota_used += quota_cost
+                    self.key_quotas[key] += quota_cost
+                    self.daily_key_quotas[key] += quota_cost
+                    state = self.key_state[key]
+                    if state['consec_429']:
+                        state['consec_429'] -= 1
                 
-                logger.debug(f"API request successful. Total quota used: {self.quota_used}, Current key quota: {self.key_quotas[self.current_key]}")
+                logger.debug("API request successful. Total quota used: %d, Key %d quota: %d",
+                             self.quota_used, key_number, self.key_quotas[key])
                 return response
                 
             except HttpError as e:
                 error_code = e.resp.status
                 error_message = str(e)
                 
-                if error_code == 403 and 'quotaExceeded' in error_message:
-                    logger.warning(f"API key {self.current_key_index + 1} quota exceeded")
-                    self._mark_key_exhausted(self.current_key)
+                # Only these reasons bench the key until the quota resets; any other 403
+                # (e.g. comments disabled, private video) fails just this request below
+                if error_code == 403 and ('quotaExceeded' in error_message
+                                          or 'dailyLimitExceeded' in error_message):
+                    logger.warning(f"API key {key_number} quota exceeded")
+                    self._mark_key_exhausted(key)
                     
-                    # Try to rotate to next key
+                    # The request cannot switch keys; hand it back to be rebuilt on another one
                     if self._rotate_api_key():
-                        logger.info("Retrying with new API key...")
-                        # Rebuild the request with new service
-                        continue
+                        logger.info(f"API key {key_number} benched; request must be rebuilt on another key")
+                        return None
                     else:
                         logger.error("All API keys exhausted. Please try again tomorrow.")
                         raise Exception("All API keys exhausted. Please try again tomorrow.")
                 
-                elif error_code == 403 and ('keyInvalid' in error_message or 'forbidden' in error_message.lower()):
-                    logger.error(f"Invalid API key {self.current_key_index + 1}: {error_message}")
-                    self._mark_key_exhausted(self.current_key)
+                elif error_code in (400, 403) and 'keyInvalid' in error_message:
+                    logger.error(f"Invalid API key {key_number}: {error_message}")
+                    self._mark_key_exhausted(key)
                     
-                    # Try to rotate to next key
+                    # The request cannot switch keys; hand it back to be rebuilt on another one
                     if self._rotate_api_key():
-                        logger.info("Retrying with new API key...")
-                        continue
+                        logger.info(f"API key {key_number} benched; request must be rebuilt on another key")
+                        return None
                     else:
                         logger.error("No valid API keys available")
                         raise Exception("Invalid or missing YouTube API key. Please check your .env file.")
                 
-                elif error_code in [500, 502, 503, 504]:
-                    # Server errors - retry with exponential backoff
+                elif error_code in [429, 500, 502, 503, 504]:
+                    # Throttling or server errors - slow this key down and retry with jittered backoff
+                    self.rate_limiters[key].on_throttle()
+                    if error_code == 429 and len(self.api_keys) > 1:
+                        # Steer other requests to the remaining keys for a while
+                        self._cool_down_key(key)
                     if attempt < max_retries - 1:
-                        wait_time = retry_delay * (2 ** attempt)
-                        logger.warning(f"Server error {error_code}. Retrying in {wait_time}s...")
+                        wait_time = self._backoff_delay(e, attempt, retry_delay)
+                        logger.warning(f"Server error {error_code}. Retrying in {wait_time:.1f}s...")
                         time.sleep(wait_time)
                         continue
                     else:
@@ -275,74 +619,184 @@ class YouTubeAPIClient:
         
         return None
     
+    def execute(self, build_request, quota_cost: int = 1):
+        """Build a request with build_request(service) and run it, rebuilding it on the
+        next key whenever the key it was built with gets benched"""
+        for _ in range(len(self.api_keys)):
+            response = self._make_request(build_request(self.service), quota_cost)
+            if response is not None:
+                return response
+        return None
+    
     def get_quota_status(self) -> Dict:
         """Get current quota usage status"""
         return {
             'total_quota_used': self.quota_used,
             'key_quotas': self.key_quotas.copy(),
+            'daily_quota_used': sum(self.daily_key_quotas.values()),
             'current_key_index': self.current_key_index,
             'exhausted_keys': len(self.exhausted_keys),
             'available_keys': len(self.api_keys) - len(self.exhausted_keys)
         }
     
+    def _clear_cooldowns(self):
+        """Return every key to the rotation"""
+        with self._lock:
+            for state in self.key_state.values():
+                state['cooldown_until'] = 0.0
+                state['consec_429'] = 0
+    
     def reset_quota_tracking(self):
         """Reset quota tracking (call this daily)"""
         self.quota_used = 0
         self.key_quotas = {key: 0 for key in self.api_keys}
-        self.exhausted_keys.clear()
+        self.daily_key_quotas = {key: 0 for key in self.api_keys}
+        self._clear_cooldowns()
+        self.save_key_state()
         logger.info("Quota tracking reset")
     
     def reset_exhausted_keys(self):
         """Reset exhausted keys tracking for fresh session"""
-        self.exhausted_keys.clear()
+        self._clear_cooldowns()
+        self.save_key_state()
         logger.info("Exhausted keys tracking reset")
 
 # YouTube API Helper Functions
+
+# The API accepts up to 50 IDs per list request
+API_BATCH_SIZE = 50
+
+# Minimum batch requests kept in flight at once (more with more API keys); the per-key rate limiters still space their starts
+API_BATCH_WORKERS = 4
+
+# How long fetched items are reused (seconds): channel metadata changes slowly, video stats quickly.
+# IDs the API returned nothing for (deleted or private) are remembered briefly as well
+CACHE_TTL = {'channels': 3600, 'videos': 600}
+NEGATIVE_CACHE_TTL = 60
+
+def _list_by_ids(client: YouTubeAPIClient, resource: str, ids: List[str], parts: List[str],
+                 quota_cost: int) -> List[Dict]:
+    """Fetch items of a resource ('channels' or 'videos') for the given IDs, 50 per request.
+
+    IDs fetched within the last CACHE_TTL seconds are served from the client's cache; the rest are
+    requested in concurrent batches so their round trips overlap. Items come back in ID order.
+    """
+    part = ','.join(parts)
+    cache = client.response_cache
+    
+    cached = {}
+    misses = []
+    for item_id in dict.fromkeys(ids):
+        value = cache.get((resource, part, item_id))
+        if value is TTLCache.MISSING:
+            misses.append(item_id)
+        else:
+            cached[item_id] = value
+    
+    if misses:
+        items, answered_ids = _fetch_by_ids(client, resource, misses, part, quota_cost)
+        for item in items:
+            cached[item['id']] = item
+            cache.set((resource, part, item['id']), item, CACHE_TTL[resource])
+        for item_id in misses:
+            if item_id not in cached:
+                cached[item_id] = None
+                # Only an answered request proves the ID is deleted or private; a failed one is retried next call
+                if item_id in answered_ids:
+                    cache.set((resource, part, item_id), None, NEGATIVE_CACHE_TTL)
+    
+    return [cached[item_id] for item_id in dict.fromkeys(ids) if cached[item_id] is not None]
+
+def _fetch_by_ids(client: YouTubeAPIClient, resource: str, ids: List[str], part: str,
+                  quota_cost: int) -> Tuple[List[Dict], Set[str]]:
+    """Request items for the given IDs from the API, 50 per request, with batches in flight concurrently
+
+    Returns the items and the IDs whose batch got a response (failed batches are left out).
+    """
+    batches = [ids[i:i + API_BATCH_SIZE] for i in range(0, len(ids), API_BATCH_SIZE)]
+    
+    def fetch(batch_ids: List[str]) -> Optional[List[Dict]]:
+        # client.service is per thread, so the request is built in the worker that sends it
+        response = client.execute(
+            lambda service: getattr(service, resource)().list(part=part, id=','.join(batch_ids)),
+            quota_cost=quota_cost)
+        return response.get('items', []) if response is not None else None
+    
+    # Requests take turns across keys, so each extra key can carry another batch in flight
+    workers = min(max(API_BATCH_WORKERS, len(client.api_keys)), len(batches))
+    
+    items = []
+    answered_ids = set()
+    if len(batches) == 1:
+        results = [fetch(batches[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(fetch, batches))
+    
+    for batch_ids, batch_items in zip(batches, results):
+        if batch_items is not None:
+            items.extend(batch_items)
+            answered_ids.update(batch_ids)
+    return items, answered_ids
+
 def get_channel_info(client: YouTubeAPIClient, channel_ids: List[str]) -> List[Dict]:
     """Get channel information for given channel IDs"""
     if not channel_ids:
         return []
     
-    # YouTube API allows up to 50 IDs per request
-    batch_size = 50
-    all_channels = []
-    
-    for i in range(0, len(channel_ids), batch_size):
-        batch_ids = channel_ids[i:i + batch_size]
-        id_string = ','.join(batch_ids)
-        
-        request = client.service.channels().list(
-            part=','.join(COLLECTION_PARAMS['channel_parts']),
-            id=id_string
-        )
-        
-        response = client._make_request(request, quota_cost=5)
-        if response and 'items' in response:
-            all_channels.extend(response['items'])
-    
-    return all_channels
+    return _list_by_ids(client, 'channels', channel_ids, COLLECTION_PARAMS['channel_parts'], quota_cost=5)
+
+# Uploads playlist ID per channel; these never change, so they are kept for the whole process
+_UPLOADS_PLAYLIST_IDS: Dict[str, str] = {}
+
+def _get_uploads_playlist_id(client: YouTubeAPIClient, channel_id: str) -> Optional[str]:
+    """Look up a channel's uploads playlist (served from the channel cache when already fetched)"""
+    playlist_id = _UPLOADS_PLAYLIST_IDS.get(channel_id)
+    if playlist_id is None:
+        channels = get_channel_info(client, [channel_id])
+        if not channels:
+            return None
+        playlist_id = channels[0].get('contentDetails', {}).get('relatedPlaylists', {}).get('uploads')
+        if not playlist_id:
+            return None
+        _UPLOADS_PLAYLIST_IDS[channel_id] = playlist_id
+    return playlist_id
 
 def get_channel_videos(client: YouTubeAPIClient, channel_id: str, max_results: int = 50) -> List[str]:
-    """Get video IDs from a channel"""
+    """Get video IDs from a channel, newest uploads first
+    
+    Pages through the channel's uploads playlist (1 quota unit per page) instead of
+    search.list (100 units per page). Videos come back in playlist order, which is
+    upload order, rather than search's publish-date order.
+    """
     video_ids = []
     next_page_token = None
     
+    playlist_id = _get_uploads_playlist_id(client, channel_id)
+    if not playlist_id:
+        logger.warning(f"No uploads playlist found for channel: {channel_id}")
+        return video_ids
+    
     while len(video_ids) < max_results:
-        request = client.service.search().list(
-            part='snippet',
-            channelId=channel_id,
-            type='video',
-            order='date',
-            maxResults=min(50, max_results - len(video_ids)),
-            pageToken=next_page_token
-        )
-        
-        response = client._make_request(request, quota_cost=100)
+        page_size = min(50, max_results - len(video_ids))
+        
+        try:
+            response = client.execute(lambda service: service.playlistItems().list(
+                part='contentDetails',
+                playlistId=playlist_id,
+                maxResults=page_size,
+                pageToken=next_page_token
+            ), quota_cost=1)
+        except HttpError as e:
+            # Channels without public uploads have no playlist to page through
+            if e.resp.status == 404:
+                break
+            raise
         if not response or 'items' not in response:
             break
         
         for item in response['items']:
-            video_ids.append(item['id']['videoId'])
+            video_ids.append(item['contentDetails']['videoId'])
         
         next_page_token = response.get('nextPageToken')
         if not next_page_token:
@@ -355,27 +809,20 @@ def get_video_details(client: YouTubeAPIClient, video_ids: List[str]) -> List[Di
     if not video_ids:
         return []
     
-    batch_size = 50
-    all_videos = []
-    
-    for i in range(0, len(video_ids), batch_size):
-        batch_ids = video_ids[i:i + batch_size]
-        id_string = ','.join(batch_ids)
-        
-        request = client.service.videos().list(
-            part=','.join(COLLECTION_PARAMS['video_parts']),
-            id=id_string
-        )
-        
-        response = client._make_request(request, quota_cost=5)
-        if response and 'items' in response:
-            all_videos.extend(response['items'])
-    
-    return all_videos
+    return _list_by_ids(client, 'videos', video_ids, COLLECTION_PARAMS['video_parts'], quota_cost=5)
 
 # Data Processing Helper Functions
+# The PT#H#M#S form YouTube uses for almost every video
+_SIMPLE_DURATION_PATTERN = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+
 def parse_iso_duration(iso_duration: str) -> int:
     """Convert ISO 8601 duration to seconds"""
+    match = _SIMPLE_DURATION_PATTERN.fullmatch(iso_duration) if isinstance(iso_duration, str) else None
+    if match:
+        hours, minutes, seconds = match.groups()
+        return int(hours or 0) * 3600 + int(minutes or 0) * 60 + int(seconds or 0)
+    
+    # Day/week components (long live streams) and anything unusual go through isodate
     try:
         duration = parse_duration(iso_duration)
         return int(duration.total_seconds())
@@ -383,6 +830,11 @@ def parse_iso_duration(iso_duration: str) -> int:
         logger.warning(f"Failed to parse duration '{iso_duration}': {e}")
         return 0
 
+@lru_cache(maxsize=32)
+def _get_timezone(timezone: str):
+    """pytz timezone object, built once per name"""
+    return pytz.timezone(timezone)
+
 def convert_to_local_time(utc_time_str: str, timezone: str = TIMEZONE) -> datetime:
     """Convert UTC time string to local timezone"""
     try:
@@ -390,22 +842,47 @@ def convert_to_local_time(utc_time_str: str, timezone: str = TIMEZONE) -> dateti
         utc_time = datetime.fromisoformat(utc_time_str.replace('Z', '+00:00'))
         
         # Convert to local timezone
-        local_tz = pytz.timezone(timezone)
-        local_time = utc_time.astimezone(local_tz)
+        local_time = utc_time.astimezone(_get_timezone(timezone))
         
         return local_time
     except Exception as e:
         logger.warning(f"Failed to convert time '{utc_time_str}': {e}")
-        return datetime.now(pytz.timezone(timezone))
+        return datetime.now(_get_timezone(timezone))
 
-def extract_video_metadata(video_data: Dict) -> Dict:
-    """Extract and normalize video metadata from API response"""
+# (output field, API statistics field) pairs cast to int during extraction
+_VIDEO_STAT_FIELDS = (('view_count', 'viewCount'), ('like_count', 'likeCount'),
+                      ('comment_count', 'commentCount'))
+_CHANNEL_STAT_FIELDS = (('subscriber_count', 'subscriberCount'), ('video_count', 'videoCount'),
+                        ('view_count', 'viewCount'))
+
+def extract_video_metadata(video_data: Dict, include_local_time: bool = True,
+                           validate: bool = False) -> Dict:
+    """Extract and normalize video metadata from API response
+
+    Set include_local_time=False to skip the published_at_local timezone conversion.
+    With validate=True the video is also checked as validate_video_data does, and an
+    empty dict is returned for a rejected video; duration and views are checked before
+    the rest of the record is built, so most rejects cost almost nothing.
+    """
     try:
         snippet = video_data.get('snippet', {})
         statistics = video_data.get('statistics', {})
         content_details = video_data.get('contentDetails', {})
         status = video_data.get('status', {})
         
+        duration_seconds = parse_iso_duration(content_details.get('duration', 'PT0S'))
+        if validate:
+            view_count = int(statistics.get('viewCount') or 0)
+            if duration_seconds < _MIN_VIDEO_DURATION:
+                logger.warning(f"Video too short: {duration_seconds}s")
+                return {}
+            if duration_seconds > _MAX_VIDEO_DURATION:
+                logger.warning(f"Video too long: {duration_seconds}s")
+                return {}
+            if view_count < _MIN_VIEW_COUNT:
+                logger.warning(f"Video has insufficient views: {view_count}")
+                return {}
+        
         # Basic metadata
         metadata = {
             'video_id': video_data.get('id', ''),
@@ -421,15 +898,11 @@ def extract_video_metadata(video_data: Dict) -> Dict:
         }
         
         # Statistics
-        metadata.update({
-            'view_count': int(statistics.get('viewCount', 0)),
-            'like_count': int(statistics.get('likeCount', 0)),
-            'comment_count': int(statistics.get('commentCount', 0)),
-        })
+        for field, api_field in _VIDEO_STAT_FIELDS:
+            metadata[field] = int(statistics.get(api_field) or 0)
         
         # Content details
-        duration_iso = content_details.get('duration', 'PT0S')
-        metadata['duration_seconds'] = parse_iso_duration(duration_iso)
+        metadata['duration_seconds'] = duration_seconds
         metadata['definition'] = content_details.get('definition', 'sd')
         metadata['caption'] = content_details.get('caption', 'false')
         
@@ -438,7 +911,8 @@ def extract_video_metadata(video_data: Dict) -> Dict:
         metadata['upload_status'] = status.get('uploadStatus', 'processed')
         
         # Derived fields
-        metadata['published_at_local'] = convert_to_local_time(metadata['published_at'])
+        if include_local_time:
+            metadata['published_at_local'] = convert_to_local_time(metadata['published_at'])
         metadata['title_length'] = len(metadata['title'])
         metadata['description_length'] = len(metadata['description'])
         metadata['tag_count'] = len(metadata['tags'])
@@ -453,12 +927,78 @@ def extract_video_metadata(video_data: Dict) -> Dict:
             metadata['comment_ratio'] = 0
             metadata['engagement_ratio'] = 0
         
+        # Remaining rules (required fields) on the finished record
+        if validate and not validate_video_data(metadata):
+            return {}
+        
         return metadata
         
     except Exception as e:
         logger.error(f"Failed to extract video metadata: {e}")
         return {}
 
+def _count_column(values: List) -> pd.Series:
+    """API count strings as an int64 Series; missing or malformed values become 0"""
+    return pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').fillna(0).astype('int64')
+
+def extract_video_metadata_batch(videos: List[Dict], include_local_time: bool = True) -> pd.DataFrame:
+    """Extract and normalize metadata for a batch of API video items into a DataFrame
+
+    Produces the columns of extract_video_metadata, one row per video, with counts,
+    lengths and engagement ratios computed column-wise instead of per video.
+    """
+    snippets = [video.get('snippet', {}) for video in videos]
+    statistics = [video.get('statistics', {}) for video in videos]
+    content_details = [video.get('contentDetails', {}) for video in videos]
+    statuses = [video.get('status', {}) for video in videos]
+    
+    metadata = pd.DataFrame({
+        # Basic metadata
+        'video_id': [video.get('id', '') for video in videos],
+        'title': [snippet.get('title', '') for snippet in snippets],
+        'description': [snippet.get('description', '') for snippet in snippets],
+        'channel_id': [snippet.get('channelId', '') for snippet in snippets],
+        'channel_title': [snippet.get('channelTitle', '') for snippet in snippets],
+        'published_at': [snippet.get('publishedAt', '') for snippet in snippets],
+        'category_id': _count_column([snippet.get('categoryId', 0) for snippet in snippets]),
+        'tags': [snippet.get('tags', []) for snippet in snippets],
+        'default_language': [snippet.get('defaultLanguage', '') for snippet in snippets],
+        'thumbnail_url': [snippet.get('thumbnails', {}).get('high', {}).get('url', '') for snippet in snippets],
+        
+        # Statistics
+        **{field: _count_column([stats.get(api_field, 0) for stats in statistics])
+           for field, api_field in _VIDEO_STAT_FIELDS},
+        
+        # Content details
+        'duration_seconds': [parse_iso_duration(details.get('duration', 'PT0S')) for details in content_details],
+        'definition': [details.get('definition', 'sd') for details in content_details],
+        'caption': [details.get('caption', 'false') for details in content_details],
+        
+        # Status
+        'privacy_status': [status.get('privacyStatus', 'public') for status in statuses],
+        'upload_status': [status.get('uploadStatus', 'processed') for status in statuses],
+    })
+    
+    # Derived fields
+    if include_local_time:
+        # One vectorized parse and conversion; unparseable times become NaT
+        metadata['published_at_local'] = (pd.to_datetime(metadata['published_at'], utc=True, errors='coerce')
+                                          .dt.tz_convert(_get_timezone(TIMEZONE)))
+    metadata['title_length'] = metadata['title'].str.len()
+    metadata['description_length'] = metadata['description'].str.len()
+    metadata['tag_count'] = metadata['tags'].str.len()
+    
+    # Engagement metrics, 0 where there are no views
+    views = metadata['view_count']
+    has_views = views > 0
+    safe_views = views.where(has_views, 1)
+    metadata['like_ratio'] = (metadata['like_count'] / safe_views).where(has_views, 0.0)
+    metadata['comment_ratio'] = (metadata['comment_count'] / safe_views).where(has_views, 0.0)
+    metadata['engagement_ratio'] = (
+        (metadata['like_count'] + metadata['comment_count']) / safe_views).where(has_views, 0.0)
+    
+    return metadata
+
 def extract_channel_metadata(channel_data: Dict) -> Dict:
     """Extract and normalize channel metadata from API response"""
     try:
@@ -477,9 +1017,7 @@ def extract_channel_metadata(channel_data: Dict) -> Dict:
             'thumbnail_url': snippet.get('thumbnails', {}).get('high', {}).get('url', ''),
             
             # Statistics
-            'subscriber_count': int(statistics.get('subscriberCount', 0)),
-            'video_count': int(statistics.get('videoCount', 0)),
-            'view_count': int(statistics.get('viewCount', 0)),
+            **{field: int(statistics.get(api_field) or 0) for field, api_field in _CHANNEL_STAT_FIELDS},
             
             # Content details
             'uploads_playlist_id': content_details.get('relatedPlaylists', {}).get('uploads', ''),
@@ -496,35 +1034,175 @@ def extract_channel_metadata(channel_data: Dict) -> Dict:
         return {}
 
 # File I/O Helper Functions
-def save_to_csv(data: List[Dict], filepath: str, append: bool = False):
-    """Save data to CSV file"""
+# Characters that make pandas (QUOTE_MINIMAL) quote a field; arrow cannot quote selectively
+_CSV_QUOTE_CHARS = r'[",\r\n]'
+
+def _write_csv_arrow(df: pd.DataFrame, f, header: bool = True) -> bool:
+    """Write DataFrame as CSV to an open binary file with pyarrow's C++ writer
+
+    Non-integer columns are rendered to text the way pandas' to_csv does, so the output is
+    byte-identical. Arrow can only quote every string or none, so if any field needs quoting
+    nothing is written and False is returned for the caller to use pandas instead.
+    """
+    # pandas quotes an empty field when it is the only one on its row
+    if len(df.columns) < 2 or any(re.search(_CSV_QUOTE_CHARS, str(col)) for col in df.columns):
+        return False
+    
+    rendered = {}
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_integer_dtype(series.dtype):
+            continue
+        # str() matches pandas for floats (repr), bools, tz-aware timestamps and lists
+        text = series.astype(str).where(series.notna())
+        if text.str.contains(_CSV_QUOTE_CHARS, regex=True, na=False).any():
+            return False
+        rendered[col] = text
+    if rendered:
+        df = df.assign(**rendered)
+    
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if header:
+        # Arrow quotes header names whatever the quoting style, so write the header ourselves
+        f.write((','.join(map(str, df.columns)) + '\n').encode('utf-8'))
+    pa_csv.write_csv(table, f, write_options=pa_csv.WriteOptions(include_header=False,
+                                                                 quoting_style='none'))
+    return True
+
+def save_to_csv(data: Union[List[Dict], pd.DataFrame], filepath: str, append: bool = False,
+                fast: bool = False, chunk_size: int = 50_000):
+    """Save data to CSV file (fast=True uses pyarrow's writer when available)
+
+    Lists of records are converted and written chunk_size rows at a time, so a large
+    list never becomes one DataFrame in memory. A full rewrite goes to a temporary file
+    that replaces filepath only once complete, so a crash never leaves a truncated CSV.
+    """
+    use_arrow = fast and pa_csv is not None
+    target = filepath if append else filepath + '.tmp'
     try:
-        df = pd.DataFrame(data)
-        mode = 'a' if append else 'w'
-        header = not append
+        if isinstance(data, pd.DataFrame) or not data:
+            chunks = [pd.DataFrame(data)]
+        else:
+            # Every chunk gets the same columns, in first-seen order, so the rows line up
+            columns = list(dict.fromkeys(key for record in data for key in record))
+            chunks = (pd.DataFrame(data[i:i + chunk_size], columns=columns)
+                      for i in range(0, len(data), chunk_size))
+        
+        # One buffered handle for every chunk instead of reopening the file per chunk
+        if use_arrow:
+            f = open(target, 'ab' if append else 'wb')
+        else:
+            f = open(target, 'a' if append else 'w', encoding='utf-8', newline='')
+        with f:
+            for index, df in enumerate(chunks):
+                header = index == 0 and not append
+                if use_arrow:
+                    if not _write_csv_arrow(df, f, header=header):
+                        f.write(df.to_csv(header=header, index=False).encode('utf-8'))
+                else:
+                    df.to_csv(f, header=header, index=False)
         
-        df.to_csv(filepath, mode=mode, header=header, index=False, encoding='utf-8')
+        if not append:
+            os.replace(target, filepath)
         logger.info(f"Saved {len(data)} records to {filepath}")
         
     except Exception as e:
+        if not append and os.path.exists(target):
+            os.remove(target)
         logger.error(f"Failed to save data to {filepath}: {e}")
         raise
 
 def save_to_json(data: Union[Dict, List], filepath: str):
-    """Save data to JSON file"""
+    """Save data to JSON file (serialized with orjson when available)
+
+    The file is written to a temporary path and moved into place, so readers never see a partial file.
+    """
+    tmp_path = filepath + '.tmp'
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        if orjson is not None:
+            payload = orjson.dumps(data, default=str,
+                                   option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            # Encode first so the file is written in one call, not many small iterencode writes
+            payload = json.dumps(data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, filepath)
         logger.info(f"Saved data to {filepath}")
         
+    except Exception as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        logger.error(f"Failed to save data to {filepath}: {e}")
+        raise
+
+def _open_binary(filepath: str, mode: str, compresslevel: int = 1):
+    """Open file in binary mode, gzip-wrapped when the path ends in .gz"""
+    if filepath.endswith('.gz'):
+        return gzip.open(filepath, mode, compresslevel=compresslevel)
+    return open(filepath, mode)
+
+def save_to_ndjson(records: List[Dict], filepath: str, compresslevel: int = 1, append: bool = False):
+    """Save records to newline-delimited JSON, one record at a time (.gz paths are compressed)
+
+    With append=True the records are added to the end of an existing file.
+    """
+    try:
+        with _open_binary(filepath, 'ab' if append else 'wb', compresslevel) as f:
+            if orjson is not None:
+                for record in records:
+                    f.write(orjson.dumps(record, default=str))
+                    f.write(b'\n')
+            else:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False, default=str).encode('utf-8'))
+                    f.write(b'\n')
+        logger.info(f"Saved {len(records)} records to {filepath}")
+        
     except Exception as e:
         logger.error(f"Failed to save data to {filepath}: {e}")
         raise
 
-def load_from_csv(filepath: str) -> pd.DataFrame:
-    """Load data from CSV file"""
+def load_from_ndjson(filepath: str) -> List[Dict]:
+    """Load records from newline-delimited JSON file"""
+    loads = orjson.loads if orjson is not None else json.loads
+    try:
+        with _open_binary(filepath, 'rb') as f:
+            records = [loads(line) for line in f if line.strip()]
+        logger.info(f"Loaded {len(records)} records from {filepath}")
+        return records
+        
+    except Exception as e:
+        logger.error(f"Failed to load data from {filepath}: {e}")
+        return []
+
+def save_to_feather(data: Union[List[Dict], pd.DataFrame], filepath: str) -> bool:
+    """Save records or a DataFrame as an Arrow IPC (Feather v2) file for memory-mapped reads"""
+    if pa is None:
+        logger.debug("pyarrow not installed, skipping Feather output")
+        return False
+    
+    try:
+        if isinstance(data, pd.DataFrame):
+            table = pa.Table.from_pandas(data, preserve_index=False)
+        else:
+            table = pa.Table.from_pylist(data)
+        feather.write_feather(table, filepath, compression='uncompressed')
+        logger.info(f"Saved {len(data)} records to {filepath}")
+        return True
+        
+    except Exception as e:
+        logger.warning(f"Failed to save Feather file {filepath}: {e}")
+        return False
+
+def load_from_feather(filepath: str) -> pd.DataFrame:
+    """Load an Arrow IPC (Feather v2) file through a memory map"""
+    if pa is None:
+        logger.warning(f"pyarrow not installed, cannot read {filepath}")
+        return pd.DataFrame()
+    
     try:
-        df = pd.read_csv(filepath, encoding='utf-8')
+        df = feather.read_table(filepath, memory_map=True).to_pandas()
         logger.info(f"Loaded {len(df)} records from {filepath}")
         return df
         
@@ -532,11 +1210,156 @@ def load_from_csv(filepath: str) -> pd.DataFrame:
         logger.error(f"Failed to load data from {filepath}: {e}")
         return pd.DataFrame()
 
+def save_to_parquet(data: Union[List[Dict], pd.DataFrame], filepath: str,
+                    compression: str = 'snappy', chunk_size: int = 100_000) -> bool:
+    """Save records or a DataFrame to a Parquet file; returns False if pyarrow is not installed
+
+    DataFrames are converted and written chunk_size rows at a time (one row group each),
+    so only one chunk is held in Arrow memory alongside the DataFrame.
+    """
+    if pq is None:
+        logger.debug("pyarrow not installed, skipping Parquet output")
+        return False
+    
+    try:
+        if isinstance(data, pd.DataFrame):
+            schema = pa.Schema.from_pandas(data, preserve_index=False)
+            with pq.ParquetWriter(filepath, schema, compression=compression) as writer:
+                for start in range(0, max(len(data), 1), chunk_size):
+                    chunk = data.iloc[start:start + chunk_size]
+                    writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+        else:
+            pq.write_table(pa.Table.from_pylist(data), filepath, compression=compression)
+        logger.info(f"Saved {len(data)} records to {filepath}")
+        return True
+        
+    except Exception as e:
+        logger.error(f"Failed to save data to {filepath}: {e}")
+        raise
+
+def load_from_parquet(filepath: str, columns: Optional[List[str]] = None,
+                      filters: Optional[List[tuple]] = None) -> pd.DataFrame:
+    """Load data from Parquet file, reading only the given columns and matching rows
+
+    filters uses pyarrow's (column, op, value) form and is pushed down to row groups.
+    """
+    try:
+        if columns is not None:
+            # Only request columns the file actually has, like load_from_csv does
+            available = set(pq.read_schema(filepath).names)
+            columns = [col for col in columns if col in available]
+        df = pq.read_table(filepath, columns=columns, filters=filters).to_pandas()
+        logger.info(f"Loaded {len(df)} records from {filepath}")
+        return df
+        
+    except Exception as e:
+        logger.error(f"Failed to load data from {filepath}: {e}")
+        return pd.DataFrame()
+
+# Known column types for the CSVs this project writes; other columns are inferred
+_CSV_COLUMN_TYPES = {
+    'video_id': 'string',
+    'channel_id': 'string',
+    'title': 'string',
+    'description': 'string',
+    'channel_title': 'string',
+    'tags': 'string',
+    'view_count': 'int64',
+    'like_count': 'int64',
+    'comment_count': 'int64',
+    'published_at': 'timestamp_utc',
+}
+
+# Never matches a real value; given to pyarrow so it infers no timestamps of its own
+# (pandas does not either), leaving timestamp parsing to _apply_csv_column_types
+_NO_TIMESTAMP_PARSERS = ['%%']
+
+def _read_csv_arrow(filepath: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Read CSV with pyarrow's multithreaded parser, inferring types the way pandas does"""
+    string_columns = {name: pa.string() for name, kind in _CSV_COLUMN_TYPES.items()
+                      if kind in ('string', 'timestamp_utc')}
+    
+    if columns:
+        # Skip requested columns the file does not have, as the pandas reader does
+        with open(filepath, 'r', encoding='utf-8', newline='') as f:
+            header = next(csv.reader(f), [])
+        columns = [col for col in columns if col in header]
+        if not columns:
+            return pd.DataFrame()
+    
+    table = pa_csv.read_csv(
+        filepath,
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(column_types=string_columns, include_columns=columns,
+                                              strings_can_be_null=True,
+                                              timestamp_parsers=_NO_TIMESTAMP_PARSERS)
+    )
+    
+    # A column blank in every row is null-typed; pandas reads it as float64 NaN, so match that
+    null_columns = [i for i, field in enumerate(table.schema) if pa.types.is_null(field.type)]
+    for i in null_columns:
+        table = table.set_column(i, table.schema.field(i).name, table.column(i).cast(pa.float64()))
+    return table.to_pandas()
+
+def _read_csv_pandas(filepath: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Read CSV with pandas, keeping the known text columns as strings"""
+    usecols = (lambda name: name in columns) if columns else None
+    string_columns = {name: str for name, kind in _CSV_COLUMN_TYPES.items()
+                      if kind in ('string', 'timestamp_utc')}
+    return pd.read_csv(filepath, encoding='utf-8', usecols=usecols, dtype=string_columns)
+
+def _apply_csv_column_types(df: pd.DataFrame) -> pd.DataFrame:
+    """Give the known columns their types, identically for either CSV reader"""
+    for name, kind in _CSV_COLUMN_TYPES.items():
+        if name not in df.columns:
+            continue
+        if kind == 'int64':
+            df[name] = pd.to_numeric(df[name], errors='coerce')
+        elif kind == 'timestamp_utc':
+            df[name] = pd.to_datetime(df[name], utc=True, errors='coerce')
+    return df
+
+def load_from_csv(filepath: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Load data from CSV file (pyarrow parser when available, pandas otherwise)
+
+    If columns is given, only those columns (where present) are read. Both parsers
+    return the same dtypes: known text columns as strings, counts as numbers,
+    published_at as UTC timestamps, and every other column inferred without dates.
+    """
+    try:
+        df = None
+        if pa_csv is not None:
+            try:
+                df = _read_csv_arrow(filepath, columns)
+            except Exception as e:
+                logger.warning(f"pyarrow CSV read failed for {filepath}, using pandas: {e}")
+        
+        if df is None:
+            df = _read_csv_pandas(filepath, columns)
+        df = _apply_csv_column_types(df)
+        logger.info(f"Loaded {len(df)} records from {filepath}")
+        return df
+        
+    except Exception as e:
+        logger.error(f"Failed to load data from {filepath}: {e}")
+        return pd.DataFrame()
+
+def load_dataframe(filepath: str, columns: Optional[List[str]] = None,
+                   filters: Optional[List[tuple]] = None) -> pd.DataFrame:
+    """Load a Parquet or CSV file based on its extension (filters apply to Parquet only)"""
+    if filepath.endswith('.parquet'):
+        return load_from_parquet(filepath, columns=columns, filters=filters)
+    return load_from_csv(filepath, columns=columns)
+
 def load_from_json(filepath: str) -> Union[Dict, List]:
-    """Load data from JSON file"""
+    """Load data from JSON file (parsed with orjson when available)"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(filepath, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         logger.info(f"Loaded data from {filepath}")
         return data
         
@@ -545,35 +1368,39 @@ def load_from_json(filepath: str) -> Union[Dict, List]:
         return {}
 
 # Validation Functions
+# Validation rules bound once at import so the per-video check avoids dict lookups
+_REQUIRED_FIELDS = tuple(VALIDATION_RULES['required_fields'])
+_MIN_VIDEO_DURATION = VALIDATION_RULES['min_video_duration']
+_MAX_VIDEO_DURATION = VALIDATION_RULES['max_video_duration']
+_MIN_VIEW_COUNT = VALIDATION_RULES['min_view_count']
+
 def validate_video_data(video_data: Dict) -> bool:
     """Validate video data meets minimum requirements"""
-    from config import VALIDATION_RULES
+    get = video_data.get
+    duration = get('duration_seconds', 0)
+    view_count = get('view_count', 0)
     
-    required_fields = VALIDATION_RULES['required_fields']
+    # Fast path: every rule checked in a single expression
+    if (all(get(field) for field in _REQUIRED_FIELDS)
+            and _MIN_VIDEO_DURATION <= duration <= _MAX_VIDEO_DURATION
+            and view_count >= _MIN_VIEW_COUNT):
+        return True
     
-    # Check required fields
-    for field in required_fields:
-        if field not in video_data or not video_data[field]:
+    # Slow path: only reached on failure, to report the reason
+    for field in _REQUIRED_FIELDS:
+        if not get(field):
             logger.warning(f"Video missing required field: {field}")
             return False
     
-    # Check duration limits
-    duration = video_data.get('duration_seconds', 0)
-    if duration < VALIDATION_RULES['min_video_duration']:
+    if duration < _MIN_VIDEO_DURATION:
         logger.warning(f"Video too short: {duration}s")
-        return False
-    
-    if duration > VALIDATION_RULES['max_video_duration']:
+    elif duration > _MAX_VIDEO_DURATION:
         logger.warning(f"Video too long: {duration}s")
-        return False
-    
-    # Check view count
-    view_count = video_data.get('view_count', 0)
-    if view_count < VALIDATION_RULES['min_view_count']:
+    else:
         logger.warning(f"Video has insufficient views: {view_count}")
-        return False
-    
-    return True
+    return False
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
 
 def clean_text(text: str) -> str:
     """Clean and normalize text data"""
@@ -581,10 +1408,12 @@ def clean_text(text: str) -> str:
         return ""
     
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text.strip())
+    text = _WHITESPACE_PATTERN.sub(' ', text.strip())
     
-    # Remove non-printable characters
-    text = ''.join(char for char in text if char.isprintable() or char.isspace())
+    # Remove non-printable characters; after collapsing, the only whitespace left is ' ',
+    # so most text passes the C-level isprintable() check and skips the per-char scan
+    if not text.isprintable():
+        text = ''.join(char for char in text if char.isprintable() or char.isspace())
     
     return text
 
@@ -602,6 +1431,33 @@ def get_time_features(timestamp: datetime) -> Dict:
         'quarter': (timestamp.month - 1) // 3 + 1
     }
 
+def get_time_features_batch(timestamps: pd.Series) -> pd.DataFrame:
+    """Extract the get_time_features columns for a whole Series of timestamps at once"""
+    timestamps = pd.to_datetime(timestamps)
+    dt = timestamps.dt
+    day_of_week = dt.dayofweek
+    return pd.DataFrame({
+        'year': dt.year,
+        'month': dt.month,
+        'day': dt.day,
+        'hour': dt.hour,
+        'day_of_week': day_of_week,
+        'day_of_year': dt.dayofyear,
+        'week_of_year': dt.isocalendar().week.astype('int64'),
+        'is_weekend': day_of_week >= 5,
+        'quarter': dt.quarter
+    }, index=timestamps.index)
+
+def reset_module_state():
+    """Re-read API keys from config and drop process-lifetime caches
+
+    For long-lived callers (the scheduler) that run jobs in-process; call after reloading config.
+    """
+    global YOUTUBE_API_KEY, YOUTUBE_API_KEYS
+    YOUTUBE_API_KEY = config.YOUTUBE_API_KEY
+    YOUTUBE_API_KEYS = config.YOUTUBE_API_KEYS
+    _UPLOADS_PLAYLIST_IDS.clear()
+
 # Export main functions
 __all__ = [
     'YouTubeAPIClient',
@@ -612,12 +1468,22 @@ __all__ = [
     'parse_iso_duration',
     'convert_to_local_time',
     'extract_video_metadata',
+    'extract_video_metadata_batch',
     'extract_channel_metadata',
     'save_to_csv',
     'save_to_json',
     'load_from_csv',
     'load_from_json',
+    'save_to_ndjson',
+    'load_from_ndjson',
+    'save_to_feather',
+    'load_from_feather',
+    'save_to_parquet',
+    'load_from_parquet',
+    'load_dataframe',
     'validate_video_data',
     'clean_text',
-    'get_time_features'
+    'get_time_features',
+    'get_time_features_batch',
+    'reset_module_state'
 ]
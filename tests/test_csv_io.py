@@ -0,0 +1,127 @@
+"""
+Tests for the CSV readers and writers in scripts/utils.py
+Run with: python -m unittest discover tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+
+import config
+
+# utils logs to a file under data/logs as soon as it is imported
+os.makedirs(config.DATA_LOGS_PATH, exist_ok=True)
+
+import pandas as pd
+import utils
+
+class CSVReaderTests(unittest.TestCase):
+    """load_from_csv must return the same frame with or without pyarrow"""
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+    
+    def _write(self, name: str, content: str) -> str:
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+        return path
+    
+    def _read_both(self, path: str, columns=None):
+        """Read path with the pyarrow reader and with the pandas fallback"""
+        arrow_df = utils.load_from_csv(path, columns=columns)
+        saved = utils.pa_csv
+        utils.pa_csv = None
+        try:
+            pandas_df = utils.load_from_csv(path, columns=columns)
+        finally:
+            utils.pa_csv = saved
+        return arrow_df, pandas_df
+    
+    @unittest.skipIf(utils.pa_csv is None, "pyarrow not installed")
+    def test_readers_agree_on_dtypes_and_values(self):
+        path = self._write('videos.csv',
+                           'video_id,title,view_count,like_count,published_at,collected_at,like_ratio\n'
+                           '00123,"multi\nline",10,,2024-01-01T10:00:00Z,2024-01-02T10:00:00,0.1\n'
+                           'x2,,20,3,2024-01-03T10:00:00Z,2024-01-04T10:00:00,0.2\n')
+        arrow_df, pandas_df = self._read_both(path)
+        
+        pd.testing.assert_series_equal(arrow_df.dtypes, pandas_df.dtypes)
+        self.assertTrue(arrow_df.equals(pandas_df))
+        self.assertEqual(str(arrow_df['published_at'].dtype), 'datetime64[ns, UTC]')
+        self.assertEqual(arrow_df['collected_at'].dtype, object)
+        self.assertEqual(arrow_df['video_id'].iloc[0], '00123')
+    
+    @unittest.skipIf(utils.pa_csv is None, "pyarrow not installed")
+    def test_all_blank_column_is_float_nan_in_both_readers(self):
+        path = self._write('blank.csv',
+                           'video_id,default_language,view_count\n'
+                           'a,,1\n'
+                           'b,,2\n')
+        arrow_df, pandas_df = self._read_both(path)
+        
+        self.assertEqual(arrow_df['default_language'].dtype, 'float64')
+        self.assertEqual(pandas_df['default_language'].dtype, 'float64')
+        self.assertTrue(arrow_df['default_language'].isna().all())
+        pd.testing.assert_frame_equal(arrow_df, pandas_df)
+    
+    @unittest.skipIf(utils.pa_csv is None, "pyarrow not installed")
+    def test_missing_requested_columns_are_skipped(self):
+        path = self._write('subset.csv',
+                           'video_id,published_at,view_count\n'
+                           'a,2024-01-01T10:00:00Z,1\n')
+        arrow_df, pandas_df = self._read_both(path, columns=['video_id', 'published_at', 'not_there'])
+        
+        self.assertEqual(list(arrow_df.columns), ['video_id', 'published_at'])
+        pd.testing.assert_frame_equal(arrow_df, pandas_df)
+
+class CSVWriterTests(unittest.TestCase):
+    """save_to_csv(fast=True) must write the same bytes as the pandas writer"""
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+    
+    def _write_both(self, records):
+        """Save records with the pyarrow writer and with pandas, returning both files' bytes"""
+        contents = []
+        for fast in (True, False):
+            path = os.path.join(self.tmp_dir.name, f'fast_{fast}.csv')
+            utils.save_to_csv(records, path, fast=fast)
+            with open(path, 'rb') as f:
+                contents.append(f.read())
+        return contents
+    
+    @unittest.skipIf(utils.pa_csv is None, "pyarrow not installed")
+    def test_writers_agree_on_mixed_types(self):
+        ist = pd.Timestamp('2024-01-01 07:00:00+05:30')
+        records = [
+            {'video_id': 'a', 'view_count': 10, 'like_ratio': 1.0, 'tiny': 1e-07, 'big': 123456789012.0,
+             'is_short': True, 'published_at': ist, 'tags': ['x'], 'note': ''},
+            {'video_id': 'b', 'view_count': 20, 'like_ratio': None, 'tiny': 0.1 + 0.2, 'big': 2.5,
+             'is_short': False, 'published_at': pd.NaT, 'tags': [], 'note': None},
+        ]
+        arrow_bytes, pandas_bytes = self._write_both(records)
+        
+        self.assertEqual(arrow_bytes, pandas_bytes)
+        self.assertIn(b'2024-01-01 07:00:00+05:30', arrow_bytes)
+        # Nothing here needs quoting, so the arrow writer itself produced the file
+        with open(os.path.join(self.tmp_dir.name, 'direct.csv'), 'wb') as f:
+            self.assertTrue(utils._write_csv_arrow(pd.DataFrame(records), f))
+    
+    @unittest.skipIf(utils.pa_csv is None, "pyarrow not installed")
+    def test_writers_agree_when_fields_need_quoting(self):
+        records = [
+            {'video_id': 'a', 'title': 'Hello, "world"', 'description': 'line one\nline two'},
+            {'video_id': 'b', 'title': 'plain', 'description': None},
+        ]
+        arrow_bytes, pandas_bytes = self._write_both(records)
+        
+        self.assertEqual(arrow_bytes, pandas_bytes)
+
+if __name__ == '__main__':
+    unittest.main()